@@ -0,0 +1,73 @@
+import json
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.read_cache import read_cache
+from ..db.data_versions import get_versions
+
+
+def make_etag(versions: dict) -> str:
+    """
+    Weak ETag from data versions; includes the API version so a deploy that
+    changes the response shape doesn't match old tags.
+    """
+    parts = "-".join(f"{name}.{version}" for name, version in sorted(versions.items()))
+    return f'W/"{settings.VERSION}-{parts}"'
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: ignore W/ prefixes
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+def _cache_headers(versions: Dict[str, int]) -> Dict[str, str]:
+    return {
+        "ETag": make_etag(versions),
+        "Cache-Control": (
+            f"public, max-age={settings.API_CACHE_MAX_AGE}, "
+            f"stale-while-revalidate={settings.API_CACHE_STALE_SECONDS}"
+        ),
+    }
+
+
+def conditional_get(request: Request, response: Response, db: Session, *names: str) -> Optional[Response]:
+    """
+    ETag a read endpoint by the data versions it depends on.
+
+    Returns a 304 response when the client's If-None-Match is current (the
+    handler returns it without building the body); otherwise sets ETag and
+    Cache-Control on `response` and returns None.
+    """
+    headers = _cache_headers(get_versions(db, names))
+    if _matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def cached_json(request: Request, db: Session, name: str, params: str, load: Callable[[], Any]) -> Response:
+    """
+    Conditional GET plus a read-through cache of the encoded JSON body.
+
+    `load()` builds the response data (models, dicts); it only runs when the
+    body for the current version of `name` and these `params` isn't cached.
+    """
+    versions = get_versions(db, [name])
+    headers = _cache_headers(versions)
+    if _matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = read_cache.get_or_load(
+        f"{name}:{versions[name]}:{params}",
+        lambda: json.dumps(jsonable_encoder(load()), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    )
+    return Response(content=body, media_type="application/json", headers=headers)
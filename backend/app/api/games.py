@@ -1,20 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import date
 
 from ..db.database import get_db
+from ..db.data_versions import GAMES
 from ..db.models import Game, GameResult
 from ..db.schemas import Game as GameSchema, GameResult as GameResultSchema
 from ..services.game_service import GameService
 from ..services.stadium_service import StadiumService
 from ..services.box_score_service import BoxScoreService
 from ..services.player_game_service import PlayerGameService
+from ..services.live_game_service import LiveGameService, live_game_poller
+from ..services.sync_jobs import SYNC_SCHEDULE, SYNC_RESULTS, SYNC_WEATHER, SYNC_GAME_LOGS, SYNC_BOX_SCORES
+from ..core.scheduler import scheduler
+from ..core.config import settings
+from ..core.live_hub import live_hub
+from .conditional import conditional_get, cached_json
 
 router = APIRouter(tags=["games"])
 
+# Handlers are plain `def` so FastAPI runs them in its threadpool: the services
+# do blocking HTTP and SQLAlchemy work that would otherwise stall the event loop.
+# Read endpoints are ETagged by data version (conditional_get) and answer a
+# current If-None-Match with 304 before doing any work; the hottest ones also
+# serve their encoded body from the read cache (cached_json).
+
 @router.get("/games", response_model=List[GameSchema], summary="Get Dodgers Games")
-async def get_dodgers_games(
+def get_dodgers_games(
+    request: Request,
     db: Session = Depends(get_db),
     limit: int = 10
 ):
@@ -23,53 +39,89 @@ async def get_dodgers_games(
     
     - **limit**: Maximum number of games to return (default: 10)
     """
-    game_service = GameService(db)
-    return game_service.get_dodgers_games(limit=limit)
+    return cached_json(request, db, GAMES, f"games?limit={limit}", lambda: [
+        GameSchema.model_validate(game) for game in GameService(db).get_dodgers_games(limit=limit)
+    ])
 
 @router.get("/games/record", summary="Get Dodgers Record")
-async def get_dodgers_record(db: Session = Depends(get_db)):
+def get_dodgers_record(request: Request, season: Optional[int] = None, db: Session = Depends(get_db)):
     """
     Get current Dodgers record and recent performance.
+    
+    - **season**: Season year (default: latest season with a record)
     """
-    game_service = GameService(db)
-    return game_service.get_dodger_record()
+    return cached_json(request, db, GAMES, f"record?season={season}", lambda: GameService(db).get_dodger_record(season=season))
+
+@router.get("/games/live", summary="Get Live Game")
+def get_live_game(db: Session = Depends(get_db)):
+    """
+    The Dodgers game currently being followed (score, inning, state) and the live poller's status.
+    """
+    game = LiveGameService(db).find_live_game()
+    return {
+        "game": GameSchema.model_validate(game) if game else None,
+        "poller": live_game_poller.status()
+    }
 
-@router.post("/games/sync-schedule", summary="Sync Dodgers Schedule from ESPN")
-async def sync_dodgers_schedule(db: Session = Depends(get_db)):
+@router.get("/games/live/stream", summary="Stream Live Game Updates")
+async def stream_live_game(last_event_id: Optional[str] = Header(None, alias="Last-Event-ID")):
+    """
+    Server-Sent Events stream of live changes: `game_update` events carry only
+    the changed fields of a game, `record_update` the new season record.
+    The latest state is sent on connect; reconnecting clients resume from
+    Last-Event-ID. Events come from the live poller and the game syncs in
+    this process, and from every other worker when the event relay runs
+    (READ_CACHE_REDIS_URL); without it, only this worker's syncs are seen.
+    """
+    # async: a stream holds its connection open, which would tie up a threadpool thread
+    queue, initial = live_hub.connect(last_event_id)
+
+    async def event_stream():
+        try:
+            yield f"retry: {settings.LIVE_STREAM_RETRY_MS}\n\n"
+            for message in initial:
+                yield message
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=settings.LIVE_STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle connection
+                    yield ": heartbeat\n\n"
+                    continue
+                if message is None:
+                    break
+                yield message
+        finally:
+            live_hub.disconnect(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# The sync endpoints start a background job and return at once (202); poll
+# /jobs/runs/{id} from the returned run for progress and the sync result.
+
+@router.post("/games/sync-schedule", status_code=status.HTTP_202_ACCEPTED, summary="Sync Dodgers Schedule from ESPN")
+def sync_dodgers_schedule():
     """
-    Sync the Dodgers' current season schedule from ESPN.
+    Start syncing the Dodgers' current season schedule from ESPN.
     This will fetch all games and update the database.
     """
-    game_service = GameService(db)
-    result = game_service.sync_dodgers_schedule()
-    
-    if not result["synced"]:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=result["reason"]
-        )
-    
-    return result
+    return scheduler.submit(SYNC_SCHEDULE)
 
-@router.post("/games/sync-results", summary="Sync Game Results from ESPN")
-async def sync_game_results(db: Session = Depends(get_db)):
+@router.post("/games/sync-results", status_code=status.HTTP_202_ACCEPTED, summary="Sync Game Results from ESPN")
+def sync_game_results():
     """
-    Sync actual game results (scores, final status) from ESPN scoreboard.
-    This updates existing games with real scores and final status.
+    Start syncing actual game results (scores, final status) from ESPN scoreboard.
+    This updates existing games with real scores and final status,
+    then fetches weather for newly final games.
     """
-    game_service = GameService(db)
-    result = game_service.sync_game_results()
-    
-    if not result["synced"]:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=result["reason"]
-        )
-    
-    return result
+    return scheduler.submit(SYNC_RESULTS)
 
 @router.post("/games/fix-existing-results", summary="Fix Existing Game Results")
-async def fix_existing_game_results(db: Session = Depends(get_db)):
+def fix_existing_game_results(db: Session = Depends(get_db)):
     """
     Calculate and update game results for existing games that already have scores.
     This is a one-time fix for games we already have, separate from ESPN sync.
@@ -85,27 +137,20 @@ async def fix_existing_game_results(db: Session = Depends(get_db)):
     
     return result
 
-@router.post("/games/sync-weather", summary="Sync Weather Data for Existing Games")
-async def sync_weather_data(db: Session = Depends(get_db)):
+@router.post("/games/sync-weather", status_code=status.HTTP_202_ACCEPTED, summary="Sync Weather Data for Existing Games")
+def sync_weather_data():
     """
-    Sync weather data for existing games that don't have weather information.
+    Start syncing weather data for existing games that don't have weather information.
     """
-    game_service = GameService(db)
-    result = game_service.sync_weather_for_existing_games()
-    
-    if not result["synced"]:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=result["reason"]
-        )
-    
-    return result
+    return scheduler.submit(SYNC_WEATHER)
 
 
 
 @router.get("/games/{espn_id}", response_model=GameSchema, summary="Get Game by ESPN ID")
-async def get_game_by_espn_id(
+def get_game_by_espn_id(
     espn_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
@@ -113,6 +158,9 @@ async def get_game_by_espn_id(
     
     - **espn_id**: ESPN's event ID for the game
     """
+    not_modified = conditional_get(request, response, db, GAMES)
+    if not_modified:
+        return not_modified
     game_service = GameService(db)
     game = game_service.get_game_by_espn_id(espn_id)
     
@@ -125,7 +173,7 @@ async def get_game_by_espn_id(
     return game
 
 @router.get("/games/{espn_id}/result", response_model=GameResultSchema, summary="Get Game Result")
-async def get_game_result(
+def get_game_result(
     espn_id: str,
     db: Session = Depends(get_db)
 ):
@@ -157,7 +205,7 @@ async def get_game_result(
     return game_result
 
 @router.get("/games/debug/espn-schedule", summary="Debug ESPN Schedule Data")
-async def debug_espn_schedule(db: Session = Depends(get_db)):
+def debug_espn_schedule(db: Session = Depends(get_db)):
     """
     Debug endpoint to inspect what ESPN is sending us.
     This helps identify why we might be getting duplicate games.
@@ -166,7 +214,7 @@ async def debug_espn_schedule(db: Session = Depends(get_db)):
     return game_service.debug_espn_schedule()
 
 @router.get("/games/debug/espn-scoreboard", summary="Debug ESPN Scoreboard Data")
-async def debug_espn_scoreboard(db: Session = Depends(get_db)):
+def debug_espn_scoreboard(db: Session = Depends(get_db)):
     """
     Debug endpoint to inspect what ESPN scoreboard API is sending us.
     This helps identify why game results sync isn't working.
@@ -175,7 +223,7 @@ async def debug_espn_scoreboard(db: Session = Depends(get_db)):
     return game_service.debug_espn_scoreboard()
 
 @router.get("/games/debug/espn-box-score/{espn_id}", summary="Debug ESPN Box Score Data")
-async def debug_espn_box_score(
+def debug_espn_box_score(
     espn_id: str,
     db: Session = Depends(get_db)
 ):
@@ -188,7 +236,7 @@ async def debug_espn_box_score(
     return raw_data
 
 @router.post("/games/seed-stadiums", summary="Seed MLB Stadiums")
-async def seed_stadiums(db: Session = Depends(get_db)):
+def seed_stadiums(db: Session = Depends(get_db)):
     """
     Seed the database with current MLB stadiums and their coordinates.
     This is a one-time setup to populate stadium data.
@@ -197,8 +245,16 @@ async def seed_stadiums(db: Session = Depends(get_db)):
     result = stadium_service.seed_mlb_stadiums()
     return result
 
+@router.post("/games/sync-box-scores", status_code=status.HTTP_202_ACCEPTED, summary="Sync Box Scores for Final Games")
+def sync_box_scores():
+    """
+    Start storing ESPN box scores (player stats, team hits/errors/LOB/RISP)
+    for every final game that doesn't have one yet.
+    """
+    return scheduler.submit(SYNC_BOX_SCORES)
+
 @router.post("/games/{espn_id}/sync-player-stats", summary="Sync Player Statistics for Game")
-async def sync_game_player_stats(
+def sync_game_player_stats(
     espn_id: str,
     db: Session = Depends(get_db)
 ):
@@ -220,7 +276,7 @@ async def sync_game_player_stats(
     return result
 
 @router.get("/games/{espn_id}/player-stats", summary="Get Player Statistics for Game")
-async def get_game_player_stats(
+def get_game_player_stats(
     espn_id: str,
     db: Session = Depends(get_db)
 ):
@@ -241,8 +297,32 @@ async def get_game_player_stats(
     player_stats = box_score_service.get_player_game_stats(game.id)
     return player_stats
 
+@router.get("/players/season-stats", summary="Get Season Statistics for Several Players")
+def get_players_season_stats(
+    ids: str,
+    season: int = 2025,
+    db: Session = Depends(get_db)
+):
+    """
+    Get aggregated season statistics for several players in one query.
+    
+    - **ids**: Comma-separated player IDs (e.g. "1,2,3")
+    - **season**: Season year (default: 2025)
+    """
+    try:
+        player_ids = [int(player_id) for player_id in ids.split(",") if player_id.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of player IDs"
+        )
+    
+    box_score_service = BoxScoreService(db)
+    stats = box_score_service.get_players_season_stats(player_ids, season)
+    return [{"player_id": player_id, **line} for player_id, line in stats.items()]
+
 @router.get("/players/{player_id}/season-stats", summary="Get Player Season Statistics")
-async def get_player_season_stats(
+def get_player_season_stats(
     player_id: int,
     season: int = 2025,
     db: Session = Depends(get_db)
@@ -257,14 +337,22 @@ async def get_player_season_stats(
     stats = box_score_service.get_player_season_stats(player_id, season)
     return stats
 
+@router.post("/players/sync-game-logs", status_code=status.HTTP_202_ACCEPTED, summary="Sync Roster Game Logs from ESPN")
+def sync_roster_game_logs():
+    """
+    Start storing the whole roster's ESPN game logs as player game stats.
+    Players already synced through the latest final game are skipped.
+    """
+    return scheduler.submit(SYNC_GAME_LOGS)
+
 @router.post("/players/{player_id}/sync-game-log", summary="Sync Player Game Log from ESPN")
-async def sync_player_game_log(
+def sync_player_game_log(
     player_id: int,
     db: Session = Depends(get_db)
 ):
     """
     Sync complete game log for a player from ESPN player page.
-    This will scrape all games for the current season.
+    This will scrape all games for the current season and store them.
     
     - **player_id**: Player's ID in our database
     """
@@ -273,7 +361,7 @@ async def sync_player_game_log(
     return result
 
 @router.get("/players/{player_id}/game-log", summary="Get Player Game Log Data")
-async def get_player_game_log(
+def get_player_game_log(
     player_id: int,
     db: Session = Depends(get_db)
 ):
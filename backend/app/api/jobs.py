@@ -0,0 +1,49 @@
+from fastapi import APIRouter, HTTPException, status
+from typing import Optional
+
+from ..core.scheduler import scheduler
+from ..services import sync_jobs  # noqa: F401  (registers the sync jobs)
+
+router = APIRouter(tags=["jobs"])
+
+@router.get("/jobs", summary="List Background Jobs")
+def list_jobs():
+    """
+    List background sync jobs with their schedule, whether they are running and their last run.
+    """
+    return scheduler.list_jobs()
+
+@router.get("/jobs/runs", summary="List Job Runs")
+def list_job_runs(job: Optional[str] = None, limit: int = 20):
+    """
+    Recent job runs, newest first.
+    
+    - **job**: Only runs of this job (e.g. sync_results)
+    - **limit**: Maximum number of runs to return (default: 20)
+    """
+    return scheduler.list_runs(job_name=job, limit=limit)
+
+@router.get("/jobs/runs/{run_id}", summary="Get Job Run Status")
+def get_job_run(run_id: int):
+    """
+    Status and progress of one job run; poll this after starting a sync.
+    """
+    run = scheduler.get_run(run_id)
+    if not run:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job run {run_id} not found"
+        )
+    return run
+
+@router.post("/jobs/{job_name}/run", status_code=status.HTTP_202_ACCEPTED, summary="Start a Job")
+def run_job(job_name: str):
+    """
+    Start a job now. If it is already running, the in-flight run is returned instead.
+    """
+    if not scheduler.has_job(job_name):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_name} not found"
+        )
+    return scheduler.submit(job_name)
@@ -1,17 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import date
 
 from ..db.database import get_db
+from ..db.data_versions import ROSTER
 from ..db.models import Player
 from ..db.schemas import Player as PlayerSchema, PlayerCreate, PlayerUpdate
 from ..services.player_service import PlayerService
+from ..services.sync_jobs import SYNC_ROSTER
+from ..core.scheduler import scheduler
+from .conditional import conditional_get, cached_json
 
 router = APIRouter(tags=["roster"])
 
+# Handlers are plain `def`, as in games.py (see the note there)
+
 @router.get("/roster", response_model=List[PlayerSchema], summary="Get Dodgers Roster")
-async def get_roster(
+def get_roster(
+    request: Request,
     db: Session = Depends(get_db),
     position: str = None,
     status: str = None
@@ -20,16 +27,22 @@ async def get_roster(
     Get the complete Dodgers roster.
     
     - **position**: Filter by position (e.g., "P", "C", "1B", "2B", "3B", "SS", "LF", "CF", "RF")
-    - **status**: Filter by status (e.g., "Active", "Injured", "Suspended")
+    - **status**: Filter by status (e.g., "Active", "Injured", "Suspended"); players
+      who left the roster are "Inactive" and only listed when asked for
     """
-    player_service = PlayerService(db)
-    return player_service.get_players(position=position, status=status)
+    return cached_json(request, db, ROSTER, f"roster?position={position}&status={status}", lambda: [
+        PlayerSchema.model_validate(player)
+        for player in PlayerService(db).get_players(position=position, status=status)
+    ])
 
 @router.get("/roster/{player_id}", response_model=PlayerSchema, summary="Get Player by ID")
-async def get_player(player_id: int, db: Session = Depends(get_db)):
+def get_player(player_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Get a specific player by their ID.
     """
+    not_modified = conditional_get(request, response, db, ROSTER)
+    if not_modified:
+        return not_modified
     player_service = PlayerService(db)
     player = player_service.get_player_by_id(player_id)
     if not player:
@@ -40,7 +53,7 @@ async def get_player(player_id: int, db: Session = Depends(get_db)):
     return player
 
 @router.post("/roster", response_model=PlayerSchema, status_code=status.HTTP_201_CREATED, summary="Add New Player")
-async def create_player(player: PlayerCreate, db: Session = Depends(get_db)):
+def create_player(player: PlayerCreate, db: Session = Depends(get_db)):
     """
     Add a new player to the Dodgers roster.
     """
@@ -48,7 +61,7 @@ async def create_player(player: PlayerCreate, db: Session = Depends(get_db)):
     return player_service.create_player(player)
 
 @router.put("/roster/{player_id}", response_model=PlayerSchema, summary="Update Player")
-async def update_player(
+def update_player(
     player_id: int, 
     player_update: PlayerUpdate, 
     db: Session = Depends(get_db)
@@ -66,7 +79,7 @@ async def update_player(
     return player
 
 @router.delete("/roster/{player_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete Player")
-async def delete_player(player_id: int, db: Session = Depends(get_db)):
+def delete_player(player_id: int, db: Session = Depends(get_db)):
     """
     Remove a player from the roster.
     """
@@ -80,7 +93,7 @@ async def delete_player(player_id: int, db: Session = Depends(get_db)):
     return None
 
 @router.get("/roster-sync-status", summary="Check Roster Sync Status")
-async def check_sync_status(db: Session = Depends(get_db)):
+def check_sync_status(db: Session = Depends(get_db)):
     """
     Check if the roster needs to be synced (more than 24 hours since last update).
     """
@@ -100,7 +113,7 @@ async def check_sync_status(db: Session = Depends(get_db)):
     }
 
 @router.get("/roster-espn-test", summary="Test ESPN Parsing (No DB Changes)")
-async def test_espn_parsing(db: Session = Depends(get_db)):
+def test_espn_parsing(db: Session = Depends(get_db)):
     """
     Test the ESPN parsing to see what data we can extract (no database changes).
     """
@@ -111,16 +124,14 @@ async def test_espn_parsing(db: Session = Depends(get_db)):
         "message": "ESPN parsing test completed",
         "players_found": len(players),
         "players": players,  # Show all players
-        "note": "This is test data only - no database changes were made"
+        "note": "This is test data only - no roster changes were made"
     }
 
-@router.post("/roster-espn-sync", summary="Sync ESPN Roster to Database")
-async def sync_espn_roster(db: Session = Depends(get_db)):
+@router.post("/roster-espn-sync", status_code=status.HTTP_202_ACCEPTED, summary="Sync ESPN Roster to Database")
+def sync_espn_roster():
     """
-    Sync the current Dodgers roster from ESPN to the database.
+    Start syncing the current Dodgers roster from ESPN to the database in the background.
     This will only sync if the roster hasn't been updated in the last 24 hours.
+    Poll /jobs/runs/{id} from the returned run for the result.
     """
-    player_service = PlayerService(db)
-    result = player_service.sync_roster_to_database()
-    
-    return result
+    return scheduler.submit(SYNC_ROSTER)
@@ -15,15 +15,73 @@ class Settings(BaseSettings):
     
     # Database Configuration
     DATABASE_URL: str = "sqlite:///./dodgers.db"
+    DB_POOL_SIZE: int = 5  # connections kept open per worker (PostgreSQL)
+    DB_MAX_OVERFLOW: int = 10  # extra connections allowed under load
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MB
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    DB_AUTO_MIGRATE: bool = True  # run `alembic upgrade head` on startup
     
     # ESPN API Configuration
     ESPN_BASE_URL: str = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb"
     DODGERS_TEAM_ID: str = "19"
+    ESPN_API_RATE_LIMIT: float = 5.0  # box score (summary) requests per second
+    BOX_SCORE_WORKERS: int = 4  # box scores fetched at the same time
     
     # Weather API Configuration
     WEATHER_API_KEY: Optional[str] = None
     WEATHER_BASE_URL: str = "http://api.weatherapi.com/v1"
-    
+    WEATHER_API_RATE_LIMIT: float = 5.0  # requests per second
+    WEATHER_BACKFILL_WORKERS: int = 4
+    WEATHER_BACKFILL_BATCH_SIZE: int = 25  # stadium-days per commit
+
+    # ESPN Player Pages (game logs)
+    ESPN_WEB_RATE_LIMIT: float = 3.0  # espn.com page requests per second
+    GAME_LOG_WORKERS: int = 4  # game logs fetched at the same time
+
+    # Outbound HTTP Configuration
+    HTTP_TIMEOUT: float = 15.0  # seconds
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_BACKOFF_FACTOR: float = 0.5  # 0.5s, 1s, 2s between retries
+    HTTP_POOL_HOSTS: int = 4  # ESPN API, ESPN web, WeatherAPI
+    HTTP_POOL_MAXSIZE: int = 10  # connections kept alive per host
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_DIR: str = "./.http_cache"
+    HTTP_CACHE_MAX_MB: int = 200  # least recently fetched responses are removed beyond this
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 7 * 24 * 60 * 60  # responses not fetched for this long are removed
+
+    # Background Job Configuration
+    SCHEDULER_ENABLED: bool = False  # run scheduled syncs and the live poller here; enable on exactly one worker
+    SCHEDULER_WORKERS: int = 2  # jobs that may run at the same time
+    JOB_STALE_SECONDS: int = 3600  # a "running" job older than this no longer blocks new runs
+    SCHEDULE_SYNC_CRON: str = "0 9 * * *"  # minute hour day month weekday, server time
+    RESULTS_SYNC_LIVE_SECONDS: int = 60  # results poll while a Dodgers game is on
+    RESULTS_SYNC_IDLE_SECONDS: int = 900
+    WEATHER_SYNC_CRON: str = "30 9 * * *"
+    ROSTER_SYNC_CRON: str = "0 10 * * *"
+    GAME_LOG_SYNC_CRON: str = "30 10 * * *"
+    BOX_SCORE_SYNC_CRON: str = "45 9 * * *"
+
+    # Live Game Polling (runs with the scheduler)
+    LIVE_POLLER_ENABLED: bool = True
+    LIVE_POLL_PLAY_SECONDS: int = 15  # while an inning is in progress
+    LIVE_POLL_BREAK_SECONDS: int = 60  # between innings (Mid/End)
+    LIVE_POLL_PREGAME_SECONDS: int = 60  # from shortly before first pitch
+    LIVE_POLL_DELAY_SECONDS: int = 300  # rain/weather delays
+    LIVE_POLL_IDLE_SECONDS: int = 600  # no game on, or after the final
+    LIVE_STREAM_HEARTBEAT_SECONDS: int = 15  # keep-alive comment on idle event streams
+    LIVE_STREAM_RETRY_MS: int = 3000  # browser reconnect delay after a dropped stream
+
+    # Response Caching
+    API_CACHE_MAX_AGE: int = 10  # seconds clients/proxies may reuse a read response
+    API_CACHE_STALE_SECONDS: int = 30  # serve stale while revalidating with the ETag
+    READ_CACHE_ENABLED: bool = True  # cache encoded /games, /games/record, /roster responses
+    READ_CACHE_MAX_ENTRIES: int = 256
+    READ_CACHE_TTL_SECONDS: int = 3600  # entries are also dropped when their data changes
+    READ_CACHE_REDIS_URL: Optional[str] = None  # e.g. redis://localhost:6379/0 to share the cache and live updates across workers
+
     # CORS Configuration
     BACKEND_CORS_ORIGINS: list = ["http://localhost:3000", "http://127.0.0.1:3000"]
     
@@ -42,13 +100,11 @@ class Settings(BaseSettings):
 settings = Settings()
 
 # Environment-specific overrides
+# DATABASE_URL always comes from the environment/.env (SQLite by default)
 if os.getenv("ENVIRONMENT") == "development":
     settings.DEBUG = True
-    settings.DATABASE_URL = "sqlite:///./dodgers.db"
 elif os.getenv("ENVIRONMENT") == "production":
     settings.DEBUG = False
-    # Production database URL would be set via environment variable
-    settings.DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./dodgers.db")
 
 # Validate required settings
 def validate_settings():
@@ -67,7 +123,3 @@ def validate_settings():
     print(f"   Environment: {os.getenv('ENVIRONMENT', 'development')}")
     print(f"   Database: {settings.DATABASE_URL}")
     print(f"   Weather API: {'Enabled' if settings.WEATHER_API_KEY else 'Disabled'}")
-
-# Run validation when module is imported
-if __name__ != "__main__":
-    validate_settings()
@@ -0,0 +1,170 @@
+import json
+import threading
+import time
+import uuid
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Event types published by the sync services
+GAME_UPDATE = "game_update"  # {"game_id", "espn_id", <changed fields>}
+RECORD_UPDATE = "record_update"  # StandingsService.to_dict() of the new record
+
+Subscriber = Callable[[str, Dict[str, Any]], None]
+
+# Redis channel that carries events between workers
+RELAY_CHANNEL = "dodgers:events"
+
+
+def json_default(value: Any):
+    """
+    JSON encoding for event payloads (dates as ISO strings).
+    """
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+class EventBus:
+    """
+    Publish/subscribe for change notifications, in-process unless a
+    RedisRelay is started (see start_relay).
+
+    Subscribers are called synchronously on the publishing thread, so they
+    must be quick (e.g. hand the event to a queue). A failing subscriber is
+    logged and does not affect the publisher or other subscribers.
+    """
+
+    def __init__(self):
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+        self._relay: Optional["RedisRelay"] = None
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """
+        Register `callback(event_type, data)`; returns a function that unsubscribes it.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def publish(self, event_type: str, data: Dict[str, Any]):
+        """
+        Deliver an event to this process's subscribers and, when a relay is
+        running, to the other workers.
+        """
+        self.deliver(event_type, data)
+        relay = self._relay
+        if relay is not None:
+            relay.send(event_type, data)
+
+    def deliver(self, event_type: str, data: Dict[str, Any]):
+        """
+        Deliver an event to this process's subscribers only.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(event_type, data)
+            except Exception as e:
+                print(f"Error delivering {event_type} event: {e}")
+
+    def start_relay(self, relay: "RedisRelay"):
+        """
+        Exchange events with the other workers through `relay`.
+        """
+        self.stop_relay()
+        self._relay = relay
+        relay.start()
+
+    def stop_relay(self):
+        relay, self._relay = self._relay, None
+        if relay is not None:
+            relay.stop()
+
+
+class RedisRelay:
+    """
+    Carries published events between workers over Redis pub/sub.
+
+    Syncs started through the API run in whichever worker took the request;
+    the relay hands their events to every other worker's bus, so a live
+    stream sees them whichever worker it is connected to. Events a worker
+    published itself are not delivered back to it. Payloads travel as JSON,
+    so dates arrive as ISO strings. Redis errors never fail the publisher;
+    the listener reconnects until stopped.
+    """
+
+    def __init__(self, bus: EventBus, client, channel: str = RELAY_CHANNEL):
+        self.bus = bus
+        self.client = client
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._pubsub = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_url(cls, bus: EventBus, url: str) -> "RedisRelay":
+        # redis is imported here so it is only needed when a Redis URL is set
+        import redis
+
+        return cls(bus, redis.Redis.from_url(url))
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen, name="event-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        pubsub = self._pubsub
+        if pubsub is not None:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def send(self, event_type: str, data: Dict[str, Any]):
+        message = json.dumps({"origin": self.origin, "type": event_type, "data": data}, default=json_default)
+        try:
+            self.client.publish(self.channel, message)
+        except Exception as e:
+            print(f"Event relay publish failed: {e}")
+
+    def _listen(self):
+        while not self._stop.is_set():
+            try:
+                self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                self._pubsub.subscribe(self.channel)
+                for message in self._pubsub.listen():
+                    if self._stop.is_set():
+                        return
+                    if message and message.get("type") == "message":
+                        self._receive(message["data"])
+            except Exception as e:
+                if self._stop.is_set():
+                    return
+                print(f"Event relay connection lost: {e}")
+                time.sleep(1)
+
+    def _receive(self, raw):
+        try:
+            envelope = json.loads(raw)
+        except (TypeError, ValueError) as e:
+            print(f"Event relay got a malformed message: {e}")
+            return
+        if envelope.get("origin") == self.origin:
+            return
+        self.bus.deliver(envelope["type"], envelope["data"])
+
+events = EventBus()
@@ -0,0 +1,149 @@
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Any
+
+from .config import settings
+from .http_cache import response_cache
+
+# Browser-like headers for ESPN's HTML pages; the JSON APIs accept them too
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+if TYPE_CHECKING:
+    import requests
+    from .rate_limit import TokenBucket
+
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> "requests.Session":
+    """
+    Build the shared session: keep-alive pools per host, retry with backoff, gzip.
+    requests is imported here so read-only workers never load it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=settings.HTTP_MAX_RETRIES,
+        backoff_factor=settings.HTTP_BACKOFF_FACTOR,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+    )
+    # pool_maxsize is the per-host connection limit; pool_block makes extra
+    # threads wait for a free connection instead of opening throwaway ones
+    adapter = HTTPAdapter(
+        pool_connections=settings.HTTP_POOL_HOSTS,
+        pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+        pool_block=True,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+def get_session() -> "requests.Session":
+    """
+    Get the process-wide HTTP session used for all outbound ESPN and WeatherAPI calls.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get(url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None, limiter: Optional["TokenBucket"] = None) -> "requests.Response":
+    """
+    GET a URL through the shared session and raise for HTTP errors.
+    A `limiter` token is taken right before the request goes out.
+    """
+    if limiter is not None:
+        limiter.acquire()
+    response = get_session().get(
+        url,
+        params=params,
+        headers=headers,
+        timeout=timeout or settings.HTTP_TIMEOUT,
+    )
+    response.raise_for_status()
+    return response
+
+
+def _cached_fetch(url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]],
+                  cache: Optional[str], limiter: Optional["TokenBucket"] = None):
+    """
+    Fetch through the response cache; returns the cache entry for the body.
+    Fresh entries cost no network (and no `limiter` token). Stale ones are
+    revalidated with their ETag/Last-Modified and a 304 reuses the stored body.
+    """
+    key = response_cache.request_key(url, params)
+    entry = response_cache.lookup(key)
+    if entry and response_cache.is_fresh(entry, cache):
+        return entry
+
+    request_headers = dict(headers or {})
+    if entry:
+        if entry.get("etag"):
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = get(url, params=params, headers=request_headers, limiter=limiter)
+    if response.status_code == 304 and entry:
+        return response_cache.touch(key, entry)
+
+    return response_cache.store(
+        key,
+        url,
+        response.content,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+    )
+
+
+def fetch_json(url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+               cache: Optional[str] = None, limiter: Optional["TokenBucket"] = None) -> Any:
+    """
+    GET a JSON endpoint. With a `cache` class (see http_cache.CACHE_TTLS) the
+    response is served from and stored in the on-disk response cache.
+    The returned object may be shared between callers; treat it as read-only.
+    Pass the upstream's `limiter` to rate limit requests that hit the network.
+    """
+    if not cache or not settings.HTTP_CACHE_ENABLED:
+        return get(url, params=params, headers=headers, limiter=limiter).json()
+    return response_cache.read_json(_cached_fetch(url, params, headers, cache, limiter))
+
+
+def fetch_text(url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+               cache: Optional[str] = None, limiter: Optional["TokenBucket"] = None) -> str:
+    """
+    GET an HTML/text page, optionally through the response cache.
+    """
+    if not cache or not settings.HTTP_CACHE_ENABLED:
+        return get(url, params=params, headers=headers, limiter=limiter).text
+    return response_cache.read_text(_cached_fetch(url, params, headers, cache, limiter))
+
+
+def close_session():
+    """
+    Close pooled connections (used on application shutdown).
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
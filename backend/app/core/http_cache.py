@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from .config import settings
+
+# Seconds a cached response is served without asking the origin, per endpoint class.
+# After that it is revalidated with If-None-Match / If-Modified-Since.
+CACHE_TTLS = {
+    "schedule": 15 * 60,
+    "scoreboard": 30,
+    "summary": 5,  # Live game polling; revalidated with ETag after that
+    "boxscore": 60,
+    "roster": 60 * 60,
+    "gamelog": 30 * 60,
+    "weather": 24 * 60 * 60,
+}
+
+# Parsed JSON bodies kept in memory, keyed by content hash
+PARSED_CACHE_SIZE = 32
+
+# Garbage collection runs from store() at most this often
+GC_INTERVAL_SECONDS = 600
+# Unreferenced blobs younger than this may belong to a store() in progress
+ORPHAN_GRACE_SECONDS = 60
+
+
+class ResponseCache:
+    """
+    On-disk, content-addressed cache for outbound GET responses.
+
+    Each request key (URL + params) has a small metadata file pointing at a body
+    blob named by the SHA-256 of its content, so identical payloads are stored
+    once and an unchanged payload can be recognised without re-parsing it.
+    Payloads that changed (live game summaries every few seconds) leave their
+    old blobs behind; `collect_garbage()` removes those and keeps the cache
+    within HTTP_CACHE_MAX_MB and HTTP_CACHE_MAX_AGE_SECONDS.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self._parsed: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._gc_lock = threading.Lock()
+        self._last_gc = 0.0
+
+    @staticmethod
+    def request_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        canonical = url + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the metadata entry for a request key, or None if missing or its blob is gone.
+        """
+        try:
+            with open(self._meta_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(self._blob_path(entry["content_hash"])):
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any], cache_class: str) -> bool:
+        return time.time() - entry["fetched_at"] < CACHE_TTLS.get(cache_class, 0)
+
+    def store(self, key: str, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]) -> Dict[str, Any]:
+        content_hash = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(content_hash)
+        if not os.path.exists(blob_path):
+            self._atomic_write(blob_path, body)
+
+        entry = {
+            "url": url,  # Without params, which may hold API keys
+            "content_hash": content_hash,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+        }
+        self._atomic_write(self._meta_path(key), json.dumps(entry).encode("utf-8"))
+        self._maybe_collect_garbage()
+        return entry
+
+    def touch(self, key: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Mark an entry as freshly revalidated (after a 304).
+        """
+        entry = dict(entry, fetched_at=time.time())
+        self._atomic_write(self._meta_path(key), json.dumps(entry).encode("utf-8"))
+        return entry
+
+    def read_text(self, entry: Dict[str, Any]) -> str:
+        with open(self._blob_path(entry["content_hash"]), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def read_json(self, entry: Dict[str, Any]) -> Any:
+        """
+        Return the parsed JSON body, parsing each distinct payload only once per process.
+        """
+        content_hash = entry["content_hash"]
+        with self._lock:
+            if content_hash in self._parsed:
+                self._parsed.move_to_end(content_hash)
+                return self._parsed[content_hash]
+
+        data = json.loads(self.read_text(entry))
+        with self._lock:
+            self._parsed[content_hash] = data
+            while len(self._parsed) > PARSED_CACHE_SIZE:
+                self._parsed.popitem(last=False)
+        return data
+
+    def collect_garbage(self, max_age: Optional[float] = None, max_bytes: Optional[int] = None) -> Dict[str, int]:
+        """
+        Remove entries not fetched within `max_age` seconds, blobs no entry
+        points at, then the least recently fetched entries until the blobs
+        fit in `max_bytes`. Returns counts of what was removed.
+        """
+        max_age = settings.HTTP_CACHE_MAX_AGE_SECONDS if max_age is None else max_age
+        max_bytes = settings.HTTP_CACHE_MAX_MB * 1024 * 1024 if max_bytes is None else max_bytes
+        now = time.time()
+        removed = {"entries": 0, "blobs": 0}
+
+        entries = []  # (fetched_at, meta path, content hash)
+        meta_dir = os.path.join(self.cache_dir, "meta")
+        for name in os.listdir(meta_dir) if os.path.isdir(meta_dir) else []:
+            path = os.path.join(meta_dir, name)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                fetched_at, content_hash = entry["fetched_at"], entry["content_hash"]
+            except (OSError, ValueError, KeyError):
+                if name.endswith(".json"):
+                    self._remove(path)
+                continue
+            if now - fetched_at > max_age:
+                self._remove(path)
+                removed["entries"] += 1
+            else:
+                entries.append((fetched_at, path, content_hash))
+
+        references: Dict[str, int] = {}
+        for _, _, content_hash in entries:
+            references[content_hash] = references.get(content_hash, 0) + 1
+
+        blobs: Dict[str, int] = {}  # content hash -> size
+        blob_dir = os.path.join(self.cache_dir, "blobs")
+        for root, _, names in os.walk(blob_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if name in references:
+                    blobs[name] = stat.st_size
+                elif now - stat.st_mtime > ORPHAN_GRACE_SECONDS:
+                    self._remove(path)
+                    removed["blobs"] += 1
+
+        total = sum(blobs.values())
+        for _, path, content_hash in sorted(entries):
+            if total <= max_bytes:
+                break
+            self._remove(path)
+            removed["entries"] += 1
+            references[content_hash] -= 1
+            if references[content_hash] == 0 and content_hash in blobs:
+                self._remove(self._blob_path(content_hash))
+                removed["blobs"] += 1
+                total -= blobs.pop(content_hash)
+        return removed
+
+    def _maybe_collect_garbage(self):
+        if time.time() - self._last_gc < GC_INTERVAL_SECONDS or not self._gc_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_gc = time.time()
+            self.collect_garbage()
+        except OSError as e:
+            print(f"Error cleaning HTTP cache: {e}")
+        finally:
+            self._gc_lock.release()
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, "meta", f"{key}.json")
+
+    def _blob_path(self, content_hash: str) -> str:
+        return os.path.join(self.cache_dir, "blobs", content_hash[:2], content_hash)
+
+    @staticmethod
+    def _atomic_write(path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+response_cache = ResponseCache(settings.HTTP_CACHE_DIR)
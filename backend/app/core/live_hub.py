@@ -0,0 +1,150 @@
+import asyncio
+import json
+import threading
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .events import EventBus, events, json_default, GAME_UPDATE, RECORD_UPDATE
+
+# Recent messages kept for clients that reconnect with Last-Event-ID
+REPLAY_SIZE = 200
+
+# Messages buffered per client; a client that falls this far behind is dropped
+# (EventSource reconnects and catches up from the replay buffer)
+CLIENT_QUEUE_SIZE = 100
+
+# Latest snapshots sent to new clients; the least recently updated games go first
+LATEST_SIZE = 20
+
+
+class LiveHub:
+    """
+    Fan-out of change events to Server-Sent Events clients.
+
+    The hub is the only subscriber to the event bus: each event is encoded
+    once and the same bytes are queued for every connected client, so the
+    cost per viewer is a queue put. The latest state of each game and the
+    latest record are retained and sent to clients when they connect.
+
+    Event IDs are "<hub>-<n>": every worker numbers the events it relays on
+    its own, so a Last-Event-ID from another worker's hub (a client that
+    reconnected elsewhere) gets the snapshot instead of a replay.
+    """
+
+    def __init__(self, bus: EventBus = events):
+        self.bus = bus
+        self.hub_id = uuid.uuid4().hex[:8]
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # client queue -> last event id already included in its initial messages
+        self._clients: Dict[asyncio.Queue, int] = {}
+        self._replay: Deque[Tuple[int, str]] = deque(maxlen=REPLAY_SIZE)
+        self._latest: "OrderedDict[Tuple[str, Any], Dict[str, Any]]" = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._unsubscribe: Optional[Callable[[], None]] = None
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        """
+        Start relaying events; call from the app's event loop (lifespan).
+        """
+        self._loop = loop
+        if self._unsubscribe is None:
+            self._unsubscribe = self.bus.subscribe(self._on_event)
+
+    def stop(self):
+        """
+        Stop relaying events and end every open stream. Safe to call from any
+        thread (including a signal handler) while the event loop runs.
+        """
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+        loop, self._loop = self._loop, None
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._close_clients)
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def _on_event(self, event_type: str, data: Dict[str, Any]):
+        # Called on the publishing (sync/poller) thread
+        if event_type not in (GAME_UPDATE, RECORD_UPDATE):
+            return
+        with self._lock:
+            event_id = self._next_id
+            self._next_id += 1
+            message = self._encode(event_id, event_type, data)
+            self._replay.append((event_id, message))
+
+            # Merge diffs into the retained snapshot for new clients
+            key = (event_type, data.get("game_id"))
+            snapshot = dict(self._latest.get(key, {}).get("data", {}), **data)
+            self._latest[key] = {"type": event_type, "data": snapshot}
+            self._latest.move_to_end(key)
+            if len(self._latest) > LATEST_SIZE:
+                # Drop the least recently updated game; the record always stays
+                del self._latest[next(k for k in self._latest if k[0] == GAME_UPDATE)]
+
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._broadcast, event_id, message)
+
+    def _broadcast(self, event_id: int, message: str):
+        # Runs on the event loop
+        for queue, seen_id in list(self._clients.items()):
+            if event_id <= seen_id:
+                continue
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Slow client: end its stream; it reconnects with Last-Event-ID
+                self._end_stream(queue)
+
+    def _close_clients(self):
+        # Runs on the event loop
+        for queue in list(self._clients):
+            self._end_stream(queue)
+
+    def _end_stream(self, queue: asyncio.Queue):
+        self._clients.pop(queue, None)
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def _encode(self, event_id: Optional[int], event_type: str, data: Dict[str, Any]) -> str:
+        payload = json.dumps(data, default=json_default, separators=(",", ":"))
+        prefix = f"id: {self.hub_id}-{event_id}\n" if event_id is not None else ""
+        return f"{prefix}event: {event_type}\ndata: {payload}\n\n"
+
+    def connect(self, last_event_id: Optional[str] = None) -> Tuple[asyncio.Queue, List[str]]:
+        """
+        Register a client. Returns its queue and the messages to send first:
+        the events missed since `last_event_id` if it is one of this hub's
+        and they are still buffered, otherwise a snapshot of the latest state.
+        """
+        last_event_id = self._own_event_number(last_event_id)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        with self._lock:
+            replay = list(self._replay)
+            latest = list(self._latest.values())
+            seen_id = self._next_id - 1
+        if last_event_id is not None and replay and replay[0][0] <= last_event_id + 1:
+            initial = [message for event_id, message in replay if event_id > last_event_id]
+        else:
+            initial = [self._encode(None, item["type"], item["data"]) for item in latest]
+        self._clients[queue] = seen_id
+        return queue, initial
+
+    def _own_event_number(self, event_id: Optional[str]) -> Optional[int]:
+        hub_id, _, number = (event_id or "").partition("-")
+        if hub_id != self.hub_id or not number.isdigit():
+            return None
+        return int(number)
+
+    def disconnect(self, queue: asyncio.Queue):
+        self._clients.pop(queue, None)
+
+
+live_hub = LiveHub()
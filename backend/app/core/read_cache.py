@@ -0,0 +1,168 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from .config import settings
+
+
+class LocalCache:
+    """
+    In-process LRU cache with a per-entry TTL. Also the stand-in for the
+    shared backend when no Redis URL is configured.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str):
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisCache:
+    """
+    Shared cache for several workers. redis is imported here so it is only
+    needed when READ_CACHE_REDIS_URL is set. Redis errors count as misses:
+    the cache must never fail a read.
+    """
+
+    def __init__(self, url: str, ttl: float, namespace: str):
+        import redis
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.5)
+        self.ttl = int(ttl)
+        self.namespace = namespace
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.client.get(self.namespace + key)
+        except Exception as e:
+            print(f"Read cache get failed: {e}")
+            return None
+
+    def set(self, key: str, value: bytes):
+        try:
+            self.client.set(self.namespace + key, value, ex=self.ttl)
+        except Exception as e:
+            print(f"Read cache set failed: {e}")
+
+    def invalidate(self, prefix: str):
+        try:
+            keys = list(self.client.scan_iter(match=f"{self.namespace}{prefix}*", count=500))
+            if keys:
+                self.client.delete(*keys)
+        except Exception as e:
+            print(f"Read cache invalidate failed: {e}")
+
+    def clear(self):
+        self.invalidate("")
+
+
+class ReadCache:
+    """
+    Read-through cache of encoded API responses.
+
+    Keys start with the data group they were built from ("games:", "roster:")
+    and include that group's data version, so a write in any worker makes old
+    entries unreachable; `invalidate(group)` also drops them as soon as the
+    writing transaction commits. Concurrent misses on one key load it once.
+    """
+
+    def __init__(self):
+        self._backend = None
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = self._build_backend()
+        return self._backend
+
+    @staticmethod
+    def _build_backend():
+        if settings.READ_CACHE_REDIS_URL:
+            try:
+                return RedisCache(
+                    settings.READ_CACHE_REDIS_URL,
+                    settings.READ_CACHE_TTL_SECONDS,
+                    namespace=f"dodgers:{settings.VERSION}:"
+                )
+            except ImportError:
+                print("⚠️  Warning: READ_CACHE_REDIS_URL is set but redis is not installed. Using the in-process cache.")
+        return LocalCache(settings.READ_CACHE_MAX_ENTRIES, settings.READ_CACHE_TTL_SECONDS)
+
+    def get_or_load(self, key: str, load: Callable[[], bytes]) -> bytes:
+        if not settings.READ_CACHE_ENABLED:
+            return load()
+
+        value = self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.backend.get(key)
+            if value is None:
+                self.misses += 1
+                value = load()
+                self.backend.set(key, value)
+            else:
+                self.hits += 1
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return value
+
+    def invalidate(self, group: str):
+        """
+        Drop every entry built from a data group.
+        """
+        if self._backend is not None:
+            self._backend.invalidate(f"{group}:")
+
+    def clear(self):
+        if self._backend is not None:
+            self._backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+read_cache = ReadCache()
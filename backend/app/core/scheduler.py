@@ -0,0 +1,491 @@
+import json
+import os
+import socket
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .config import settings
+from ..db.database import SessionLocal
+from ..db.models.jobs import JobRun
+
+# Seconds between progress writes to the job_runs row (in-memory progress is always current)
+PROGRESS_WRITE_INTERVAL = 1.0
+
+# Longest the scheduler loop sleeps, so new jobs and shutdown are noticed promptly
+MAX_SLEEP_SECONDS = 30.0
+
+
+def run_owner() -> str:
+    """
+    host:pid recorded on the job runs this process claims.
+    """
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+class IntervalTrigger:
+    """
+    Run every `seconds` seconds.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def next_run(self, after: datetime) -> datetime:
+        return after + timedelta(seconds=self.seconds)
+
+    def describe(self) -> str:
+        return f"every {self.seconds:g}s"
+
+
+class CronTrigger:
+    """
+    Five-field cron expression (minute hour day month weekday, 0 = Sunday) in server time.
+    Fields accept `*`, `*/n`, `a-b`, `a-b/n` and comma lists.
+    """
+
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = [
+            self._parse_field(field, low, high) for field, (low, high) in zip(fields, self.FIELD_RANGES)
+        ]
+        # Standard cron: if both day fields are restricted, either one may match.
+        # A field starting with "*" (including "*/n") counts as unrestricted
+        self._any_day = fields[2].startswith("*")
+        self._any_weekday = fields[4].startswith("*")
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> Set[int]:
+        values: Set[int] = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/")
+                step = int(step_text)
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start, end = (int(value) for value in part.split("-"))
+            else:
+                start = end = int(part)
+            if start < low or end > high or step < 1:
+                raise ValueError(f"Cron field {field!r} is out of range {low}-{high}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_run(self, after: datetime) -> datetime:
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # Skip whole months/days/hours that can't match; bounded by a few years of steps
+        for _ in range(100000):
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+        raise ValueError(f"Cron expression {self.expression!r} never matches")
+
+    def describe(self) -> str:
+        return f"cron {self.expression}"
+
+
+class AdaptiveTrigger:
+    """
+    Run every `active_seconds` while `is_active()` is true (e.g. a game is on),
+    and every `idle_seconds` otherwise.
+    """
+
+    def __init__(self, active_seconds: float, idle_seconds: float, is_active: Callable[[], bool]):
+        self.active_seconds = active_seconds
+        self.idle_seconds = idle_seconds
+        self.is_active = is_active
+
+    def next_run(self, after: datetime) -> datetime:
+        try:
+            active = self.is_active()
+        except Exception as e:
+            print(f"Adaptive trigger check failed: {e}")
+            active = False
+        return after + timedelta(seconds=self.active_seconds if active else self.idle_seconds)
+
+    def describe(self) -> str:
+        return f"every {self.active_seconds:g}s when active, {self.idle_seconds:g}s otherwise"
+
+
+class JobProgress:
+    """
+    Progress callback handed to a running job: `progress(percent, message=None)`.
+    """
+
+    def __init__(self, scheduler: "JobScheduler", run_id: int):
+        self.scheduler = scheduler
+        self.run_id = run_id
+        self._last_write = 0.0
+
+    def __call__(self, percent: float, message: Optional[str] = None):
+        percent = max(0.0, min(100.0, float(percent)))
+        self.scheduler._live_progress[self.run_id] = {"progress": percent, "message": message}
+        now = time.monotonic()
+        if now - self._last_write >= PROGRESS_WRITE_INTERVAL:
+            self._last_write = now
+            self.scheduler._update_run(self.run_id, progress=percent, message=message)
+
+
+class Job:
+    def __init__(self, name: str, func: Callable[[Session, JobProgress], Any], trigger=None, description: str = ""):
+        self.name = name
+        self.func = func
+        self.trigger = trigger
+        self.description = description
+        self.lock = threading.Lock()  # Held while a run is in flight (single-flight)
+        self.current_run_id: Optional[int] = None
+        self.next_run_at: Optional[datetime] = None
+
+
+class JobScheduler:
+    """
+    In-process background job runner.
+
+    Jobs run on a small thread pool, each with its own database session, and
+    every run is recorded in the job_runs table. A job never runs twice at
+    once: the in-process lock covers this worker, and a run is claimed by
+    inserting its "running" row, which a partial unique index allows once per
+    job across all workers. Triggers are only evaluated after `start()`
+    (one worker, see SCHEDULER_ENABLED); manual runs via `submit()` work in
+    every worker.
+    """
+
+    def __init__(self, session_factory=SessionLocal, max_workers: Optional[int] = None):
+        self.session_factory = session_factory
+        self.max_workers = max_workers or settings.SCHEDULER_WORKERS
+        self._jobs: Dict[str, Job] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._live_progress: Dict[int, Dict[str, Any]] = {}
+
+    def add_job(self, name: str, func: Callable[[Session, JobProgress], Any], trigger=None, description: str = ""):
+        """
+        Register a job. `func(db, progress)` returns a JSON-serializable result;
+        a result dict with `"synced": False` marks the run as failed and one
+        with `"skipped": True` as skipped (nothing to do).
+        """
+        self._jobs[name] = Job(name, func, trigger, description)
+
+    def has_job(self, name: str) -> bool:
+        return name in self._jobs
+
+    def start(self):
+        """
+        Start evaluating triggers in a background thread.
+        Runs left "running" by an earlier process on this host are marked as failed first.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._fail_interrupted_runs()
+        now = datetime.now()
+        for job in self._jobs.values():
+            job.next_run_at = job.trigger.next_run(now) if job.trigger else None
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="job-scheduler", daemon=True)
+        self._thread.start()
+        print(f"Job scheduler started with {len(self._jobs)} jobs")
+
+    def shutdown(self, wait: bool = False):
+        """
+        Stop the trigger loop; running jobs finish unless the process exits first.
+        Queued runs are cancelled and recorded as failed.
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        with self._executor_lock:
+            if self._executor:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+
+    def submit(self, name: str, trigger: str = "manual") -> Dict[str, Any]:
+        """
+        Start a run of `name` in the background.
+        Returns {"started": bool, "reason": str, "run": {...}}; when the job is
+        already running, the in-flight run is returned and nothing new starts.
+        """
+        if name not in self._jobs:
+            raise KeyError(name)
+        job = self._jobs[name]
+
+        if not job.lock.acquire(blocking=False):
+            return {
+                "started": False,
+                "reason": f"{name} is already running",
+                "run": self.get_run(job.current_run_id) if job.current_run_id else None,
+            }
+
+        try:
+            run_id = self._claim_run(name, trigger)
+            if run_id is None:
+                job.lock.release()
+                return {"started": False, "reason": f"{name} is already running", "run": self._running_run(name)}
+            job.current_run_id = run_id
+            future = self._get_executor().submit(self._execute, job, run_id)
+
+            def on_done(future):
+                if future.cancelled():
+                    self._finish_cancelled(job, run_id)
+
+            future.add_done_callback(on_done)
+        except Exception:
+            job.current_run_id = None
+            if job.lock.locked():
+                job.lock.release()
+            raise
+
+        return {"started": True, "reason": f"{name} started", "run": self.get_run(run_id)}
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """
+        Registered jobs with their schedule, in-flight run and latest finished run.
+        """
+        db = self.session_factory()
+        try:
+            jobs = []
+            for job in self._jobs.values():
+                last_run = db.query(JobRun).filter(
+                    JobRun.job_name == job.name
+                ).order_by(JobRun.id.desc()).first()
+                jobs.append({
+                    "name": job.name,
+                    "description": job.description,
+                    "schedule": job.trigger.describe() if job.trigger else None,
+                    "next_run_at": job.next_run_at.isoformat() if job.next_run_at else None,
+                    "running": job.lock.locked(),
+                    "last_run": self._run_to_dict(last_run) if last_run else None,
+                })
+            return jobs
+        finally:
+            db.close()
+
+    def get_run(self, run_id: int) -> Optional[Dict[str, Any]]:
+        db = self.session_factory()
+        try:
+            run = db.get(JobRun, run_id)
+            return self._run_to_dict(run) if run else None
+        finally:
+            db.close()
+
+    def list_runs(self, job_name: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        db = self.session_factory()
+        try:
+            query = db.query(JobRun)
+            if job_name:
+                query = query.filter(JobRun.job_name == job_name)
+            return [self._run_to_dict(run) for run in query.order_by(JobRun.id.desc()).limit(limit)]
+        finally:
+            db.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+            return self._executor
+
+    def _loop(self):
+        while not self._stop.is_set():
+            now = datetime.now()
+            for job in self._jobs.values():
+                if job.next_run_at and job.next_run_at <= now:
+                    job.next_run_at = job.trigger.next_run(now)
+                    if job.lock.locked():
+                        continue  # Still running from the last trigger; skip this slot
+                    try:
+                        self.submit(job.name, trigger="schedule")
+                    except Exception as e:
+                        print(f"Error starting scheduled job {job.name}: {e}")
+
+            upcoming = [job.next_run_at for job in self._jobs.values() if job.next_run_at]
+            sleep = min([(moment - datetime.now()).total_seconds() for moment in upcoming] + [MAX_SLEEP_SECONDS])
+            self._stop.wait(max(sleep, 0.1))
+
+    def _execute(self, job: Job, run_id: int):
+        progress = JobProgress(self, run_id)
+        status, result, error = "succeeded", None, None
+        db = self.session_factory()
+        try:
+            result = job.func(db, progress)
+            if isinstance(result, dict) and result.get("skipped"):
+                status = "skipped"
+            elif isinstance(result, dict) and result.get("synced") is False:
+                status, error = "failed", result.get("reason")
+        except Exception as e:
+            status, error = "failed", str(e)
+            traceback.print_exc()
+        finally:
+            db.close()
+            try:
+                live = self._live_progress.get(run_id, {})
+                values = {
+                    "status": status,
+                    "message": live.get("message"),
+                    "result": json.dumps(result, default=str) if result is not None else None,
+                    "error": error,
+                    "finished_at": datetime.now(),
+                }
+                if status != "failed":
+                    values["progress"] = 100.0
+                elif "progress" in live:
+                    values["progress"] = live["progress"]
+                self._update_run(run_id, **values)
+            finally:
+                self._live_progress.pop(run_id, None)
+                job.current_run_id = None
+                job.lock.release()
+            print(f"Job {job.name} (run {run_id}) {status}")
+
+    def _claim_run(self, name: str, trigger: str) -> Optional[int]:
+        """
+        Insert the "running" row for a new run and return its ID, or None if
+        another worker holds a run of this job. Runs older than
+        JOB_STALE_SECONDS are failed first so they no longer block.
+        """
+        db = self.session_factory()
+        try:
+            cutoff = datetime.now() - timedelta(seconds=settings.JOB_STALE_SECONDS)
+            db.query(JobRun).filter(
+                JobRun.job_name == name,
+                JobRun.status == "running",
+                JobRun.started_at < cutoff
+            ).update(
+                {"status": "failed", "error": "Stale: still running after JOB_STALE_SECONDS", "finished_at": datetime.now()},
+                synchronize_session=False
+            )
+            run = JobRun(
+                job_name=name, trigger=trigger, status="running", owner=run_owner(),
+                progress=0.0, started_at=datetime.now()
+            )
+            db.add(run)
+            db.commit()
+            return run.id
+        except IntegrityError:
+            db.rollback()
+            return None
+        finally:
+            db.close()
+
+    def _finish_cancelled(self, job: Job, run_id: int):
+        """
+        Record a queued run that was cancelled at shutdown and free its job.
+        """
+        try:
+            self._update_run(run_id, status="failed", error="Cancelled at shutdown", finished_at=datetime.now())
+        finally:
+            job.current_run_id = None
+            if job.lock.locked():
+                job.lock.release()
+
+    def _update_run(self, run_id: int, **values):
+        db = self.session_factory()
+        try:
+            db.query(JobRun).filter(JobRun.id == run_id).update(values, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"Error updating job run {run_id}: {e}")
+        finally:
+            db.close()
+
+    def _running_run(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        The in-flight run of this job (from any worker), if any.
+        """
+        db = self.session_factory()
+        try:
+            run = db.query(JobRun).filter(
+                JobRun.job_name == name,
+                JobRun.status == "running"
+            ).first()
+            return self._run_to_dict(run) if run else None
+        finally:
+            db.close()
+
+    def _fail_interrupted_runs(self):
+        """
+        Fail "running" rows whose process is gone: an earlier process with our
+        own host:pid (e.g. a restarted container) or a dead pid on this host.
+        Live workers' runs are left alone; rows from other hosts expire after
+        JOB_STALE_SECONDS (see `_claim_run`).
+        """
+        own = run_owner()
+        host = own.rsplit(":", 1)[0]
+        db = self.session_factory()
+        try:
+            rows = db.query(JobRun.id, JobRun.owner).filter(
+                JobRun.status == "running",
+                JobRun.owner.like(f"{host}:%")
+            ).all()
+            interrupted = [
+                run_id for run_id, owner in rows
+                if owner == own or not _process_alive(int(owner.rsplit(":", 1)[1]))
+            ]
+            if interrupted:
+                db.query(JobRun).filter(JobRun.id.in_(interrupted)).update(
+                    {"status": "failed", "error": "Interrupted by a restart", "finished_at": datetime.now()},
+                    synchronize_session=False
+                )
+                db.commit()
+        finally:
+            db.close()
+
+    def _run_to_dict(self, run: JobRun) -> Dict[str, Any]:
+        live = self._live_progress.get(run.id) if run.status == "running" else None
+        finished = run.finished_at
+        return {
+            "id": run.id,
+            "job": run.job_name,
+            "trigger": run.trigger,
+            "status": run.status,
+            "progress": live["progress"] if live else run.progress,
+            "message": live["message"] if live else run.message,
+            "result": json.loads(run.result) if run.result else None,
+            "error": run.error,
+            "started_at": run.started_at.isoformat() if run.started_at else None,
+            "finished_at": finished.isoformat() if finished else None,
+            "duration_seconds": round((finished - run.started_at).total_seconds(), 2)
+            if finished and run.started_at else None,
+        }
+
+
+scheduler = JobScheduler()
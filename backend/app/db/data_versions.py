@@ -0,0 +1,52 @@
+from typing import Dict, Sequence
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from ..core.read_cache import read_cache
+from .models import DataVersion
+
+# Version names and the data behind them
+GAMES = "games"  # games, game_results, team_records, player_game_stats
+ROSTER = "roster"  # players, player_positions
+
+
+def bump_version(db: Session, *names: str):
+    """
+    Increment the named versions. Call before the commit that writes the
+    data, so the new version becomes visible together with the changes;
+    cached responses for those groups are dropped once the commit succeeds.
+    """
+    db.info.setdefault("bumped_versions", set()).update(names)
+    result = db.execute(
+        update(DataVersion)
+        .where(DataVersion.name.in_(names))
+        .values(version=DataVersion.version + 1, updated_at=func.now())
+    )
+    if result.rowcount < len(names):
+        existing = set(db.scalars(select(DataVersion.name).where(DataVersion.name.in_(names))))
+        db.execute(insert(DataVersion), [
+            {"name": name, "version": 2} for name in names if name not in existing
+        ])
+
+
+def get_versions(db: Session, names: Sequence[str]) -> Dict[str, int]:
+    """
+    Current versions by name (one primary-key lookup); unknown names are 1.
+    """
+    rows = dict(db.execute(
+        select(DataVersion.name, DataVersion.version).where(DataVersion.name.in_(names))
+    ).all())
+    return {name: rows.get(name, 1) for name in names}
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_cached_reads(session: Session):
+    for name in session.info.pop("bumped_versions", ()):
+        read_cache.invalidate(name)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_bumps(session: Session, previous_transaction):
+    session.info.pop("bumped_versions", None)
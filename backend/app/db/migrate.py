@@ -0,0 +1,34 @@
+import os
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy.engine import Engine
+
+# Alembic is only imported when migrations actually run
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ALEMBIC_INI = os.path.join(BACKEND_DIR, "alembic.ini")
+
+
+def alembic_config(engine: Optional[Engine] = None) -> "Config":
+    """
+    Alembic config for this backend; pass an engine to migrate something other than the app database.
+    """
+    from alembic.config import Config
+
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    config.attributes["configure_logger"] = False
+    if engine is not None:
+        config.attributes["engine"] = engine
+    return config
+
+
+def upgrade_database(engine: Optional[Engine] = None, revision: str = "head"):
+    """
+    Bring the database schema up to date (same as `alembic upgrade head`).
+    """
+    from alembic import command
+
+    command.upgrade(alembic_config(engine), revision)
@@ -0,0 +1,105 @@
+"""
+Helpers for Alembic revisions in migrations/versions.
+
+Schema helpers are idempotent so the first revisions also apply cleanly to
+databases that were created by `create_all` or the old sqlite3 scripts.
+Data migrations go through `backfill_in_batches`, which commits one primary
+key range at a time so the app keeps reading and writing while it runs.
+"""
+from typing import Any, Dict, Iterable, Optional
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.schema import CreateColumn
+
+# Rows per UPDATE in online data migrations
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _inspector():
+    return sa.inspect(op.get_bind())
+
+
+def has_table(table_name: str) -> bool:
+    return _inspector().has_table(table_name)
+
+
+def has_column(table_name: str, column_name: str) -> bool:
+    return any(column["name"] == column_name for column in _inspector().get_columns(table_name))
+
+
+def has_index(table_name: str, index_name: str) -> bool:
+    return any(index["name"] == index_name for index in _inspector().get_indexes(table_name))
+
+
+def has_unique_constraint(table_name: str, constraint_name: str) -> bool:
+    return any(constraint["name"] == constraint_name for constraint in _inspector().get_unique_constraints(table_name))
+
+
+def drop_unique_constraint_if_present(table_name: str, constraint_name: str) -> bool:
+    if not has_unique_constraint(table_name, constraint_name):
+        return False
+    # Batch mode: SQLite has to copy the table to drop a constraint
+    with op.batch_alter_table(table_name) as batch_op:
+        batch_op.drop_constraint(constraint_name, type_='unique')
+    return True
+
+
+def create_table_if_missing(table_name: str, *columns, **kwargs) -> bool:
+    if has_table(table_name):
+        return False
+    op.create_table(table_name, *columns, **kwargs)
+    return True
+
+
+def add_column_if_missing(table_name: str, column: sa.Column) -> bool:
+    if has_column(table_name, column.name):
+        return False
+    bind = op.get_bind()
+    if column.foreign_keys and bind.dialect.name == "sqlite":
+        # Alembic only adds SQLite constraints by copying the table; an inline
+        # REFERENCES clause on ADD COLUMN does the same without the copy
+        ddl = str(CreateColumn(column).compile(dialect=bind.dialect))
+        for foreign_key in column.foreign_keys:
+            target_table, target_column = foreign_key.target_fullname.split(".")
+            ddl += f" REFERENCES {target_table}({target_column})"
+        op.execute(f"ALTER TABLE {table_name} ADD COLUMN {ddl}")
+    else:
+        op.add_column(table_name, column)
+    return True
+
+
+def create_index_if_missing(index_name: str, table_name: str, columns: Iterable[str], **kwargs) -> bool:
+    if has_index(table_name, index_name):
+        return False
+    op.create_index(index_name, table_name, list(columns), **kwargs)
+    return True
+
+
+def backfill_in_batches(table: sa.Table, values: Dict[str, Any], where: Optional[Any] = None,
+                        batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """
+    UPDATE `table` SET `values` WHERE `where`, one id range at a time.
+
+    Each range commits on its own (autocommit), so locks are held for one
+    short statement instead of the whole backfill, and an interrupted run
+    can simply be restarted as long as `where` excludes rows already done.
+    Returns the number of rows updated.
+    """
+    bind = op.get_bind()
+    low, high = bind.execute(sa.select(sa.func.min(table.c.id), sa.func.max(table.c.id))).one()
+    if low is None:
+        return 0
+
+    updated = 0
+    with op.get_context().autocommit_block():
+        for start in range(low, high + 1, batch_size):
+            statement = (
+                sa.update(table)
+                .where(table.c.id >= start, table.c.id < start + batch_size)
+                .values(values)
+            )
+            if where is not None:
+                statement = statement.where(where)
+            updated += bind.execute(statement).rowcount
+    return updated
@@ -1,6 +1,9 @@
-from .players import Player, PlayerPosition
-from .teams import Team
+from .players import Player, PlayerPosition, PlayerIdentity
+from .teams import Team, TeamRecord
 from .games import Game, GameResult, PlayerGameStats
 from .stadiums import Stadium
+from .weather import WeatherObservation
+from .jobs import JobRun, GameLogCheckpoint
+from .data_versions import DataVersion
 
-__all__ = ["Player", "PlayerPosition", "Team", "Game", "GameResult", "PlayerGameStats", "Stadium"]
+__all__ = ["Player", "PlayerPosition", "PlayerIdentity", "Team", "TeamRecord", "Game", "GameResult", "PlayerGameStats", "Stadium", "WeatherObservation", "JobRun", "GameLogCheckpoint", "DataVersion"]
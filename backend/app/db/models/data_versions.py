@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from ..database import Base
+
+class DataVersion(Base):
+    """
+    Change counter for a group of tables; writers bump it in the same
+    transaction as their changes, readers use it for ETags and cache keys.
+    """
+    __tablename__ = "data_versions"
+
+    name = Column(String(50), primary_key=True)  # games, roster
+    version = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<DataVersion(name='{self.name}', version={self.version})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Time, Boolean, ForeignKey, Text, Float, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Date, DateTime, Time, Boolean, ForeignKey, Text, Float, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -28,6 +28,11 @@ class Game(Base):
     days_since_last_game = Column(Integer)  # Days since team's last game
     game_result = Column(String(5))  # W, L, or NULL for TBD
     
+    # Live status (maintained by the live game poller)
+    game_state = Column(String(10))  # pre, in, post
+    inning = Column(Integer)
+    status_detail = Column(String(50))  # e.g., "Top 5th", "Final/10"
+    
     # Weather data (if available)
     weather_temp = Column(Integer)  # in Fahrenheit
     weather_conditions = Column(String(100))
@@ -35,6 +40,9 @@ class Game(Base):
     wind_direction = Column(String(10))
     humidity = Column(Integer)  # percentage
     
+    # Set once the ESPN box score has been stored, whether or not it had team stats
+    box_score_synced_at = Column(DateTime)
+    
     created_at = Column(String, server_default=func.now())
     updated_at = Column(String, server_default=func.now(), onupdate=func.now())
 
@@ -43,6 +51,26 @@ class Game(Base):
     player_stats = relationship("PlayerGameStats", back_populates="game", cascade="all, delete-orphan")
     stadium_info = relationship("Stadium", back_populates="games")
 
+    # Team filters come with a date order (schedule, standings); the partial
+    # indexes cover the small "still to do" sets the maintenance jobs scan for
+    __table_args__ = (
+        Index('ix_games_home_team_date', 'home_team', 'game_date'),
+        Index('ix_games_away_team_date', 'away_team', 'game_date'),
+        Index('ix_games_stadium_id', 'stadium_id'),
+        Index(
+            'ix_games_final_without_result', 'is_final',
+            sqlite_where=game_result.is_(None), postgresql_where=game_result.is_(None)
+        ),
+        Index(
+            'ix_games_venue_without_weather', 'venue',
+            sqlite_where=weather_temp.is_(None), postgresql_where=weather_temp.is_(None)
+        ),
+        Index(
+            'ix_games_final_without_box_score', 'is_final',
+            sqlite_where=box_score_synced_at.is_(None), postgresql_where=box_score_synced_at.is_(None)
+        ),
+    )
+
     def __repr__(self):
         return f"<Game(date='{self.game_date}', {self.away_team} @ {self.home_team}, {self.away_score}-{self.home_score})>"
 
@@ -76,6 +104,10 @@ class GameResult(Base):
     # Relationships
     game = relationship("Game", back_populates="game_results")
 
+    __table_args__ = (
+        Index('ix_game_results_game_id', 'game_id'),
+    )
+
     def __repr__(self):
         return f"<GameResult(game_id={self.game_id}, {self.away_team} {self.away_score} @ {self.home_team} {self.home_score})>"
 
@@ -142,5 +174,12 @@ class PlayerGameStats(Base):
     game = relationship("Game", back_populates="player_stats")
     player = relationship("Player", backref="game_stats")
 
+    # Season lines read by player, box scores by game; one line per player
+    # and game, which the stat ingestion upserts on
+    __table_args__ = (
+        Index('ix_player_game_stats_player_game', 'player_id', 'game_id', unique=True),
+        Index('ix_player_game_stats_game_id', 'game_id'),
+    )
+
     def __repr__(self):
         return f"<PlayerGameStats(game_id={self.game_id}, player_id={self.player_id}, position='{self.position}')>"
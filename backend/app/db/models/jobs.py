@@ -0,0 +1,53 @@
+from sqlalchemy import Column, Integer, String, Float, Text, Date, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from ..database import Base
+
+class JobRun(Base):
+    """
+    One execution of a background sync job (manual or scheduled), kept as run history.
+    """
+    __tablename__ = "job_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String(50), nullable=False)
+    trigger = Column(String(20), nullable=False)  # manual, schedule
+    status = Column(String(20), nullable=False)  # running, succeeded, skipped, failed
+    owner = Column(String(100))  # host:pid of the process running it
+    progress = Column(Float, default=0.0)  # 0-100
+    message = Column(String(200))  # Latest progress message
+    result = Column(Text)  # JSON returned by the job
+    error = Column(Text)
+    started_at = Column(DateTime, server_default=func.now())
+    finished_at = Column(DateTime)
+
+    # History is read newest-first per job. At most one run per job may be
+    # "running": claiming a run is an INSERT that this partial index rejects
+    __table_args__ = (
+        Index('ix_job_runs_job_name_id', 'job_name', 'id'),
+        Index('ix_job_runs_status', 'status'),
+        Index(
+            'ux_job_runs_running', 'job_name', unique=True,
+            sqlite_where=status == 'running', postgresql_where=status == 'running'
+        ),
+    )
+
+    def __repr__(self):
+        return f"<JobRun(job='{self.job_name}', status='{self.status}', started_at={self.started_at})>"
+
+
+class GameLogCheckpoint(Base):
+    """
+    Per-player progress of the game-log ingestion: the player's game log was
+    last stored when `games` Dodgers games were final; `synced_through` is the
+    last game on it.
+    """
+    __tablename__ = "game_log_checkpoints"
+
+    player_id = Column(Integer, ForeignKey("players.id", ondelete="CASCADE"), primary_key=True)
+    season = Column(Integer, primary_key=True)
+    synced_through = Column(Date, nullable=False)
+    games = Column(Integer, default=0)  # Final games of the season at the last run
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<GameLogCheckpoint(player_id={self.player_id}, season={self.season}, synced_through={self.synced_through})>"
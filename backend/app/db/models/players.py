@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Float, Text, Boolean, UniqueConstraint, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, DateTime, Float, Text, Boolean, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -7,6 +7,7 @@ class Player(Base):
     __tablename__ = "players"
     
     id = Column(Integer, primary_key=True, index=True)
+    espn_id = Column(String(20))  # ESPN athlete ID; stable across roster syncs
     name = Column(String(100), nullable=False, index=True)
     uniform_number = Column(Integer, nullable=False)
     height = Column(String(10))  # e.g., "6'2\""
@@ -15,14 +16,16 @@ class Player(Base):
     bats = Column(String(5))  # L, R, S (switch)
     throws = Column(String(5))  # L, R
     team = Column(String(50), default="Los Angeles Dodgers")
-    status = Column(String(20), default="Active")  # Active, Injured, Suspended, etc.
+    status = Column(String(20), default="Active")  # Active, Injured, Suspended, Inactive (left the roster)
     created_at = Column(String, server_default=func.now())
     updated_at = Column(String, server_default=func.now(), onupdate=func.now())
-    last_updated = Column(String, server_default=func.now())  # When roster data was last synced
+    last_updated = Column(String, server_default=func.now())  # When a roster sync last changed this player
     
-    # Unique constraint: team + uniform_number must be unique
+    # Roster syncs match players by ESPN ID. Uniform numbers aren't unique:
+    # inactive players keep theirs and numbers are briefly shared after trades.
     __table_args__ = (
-        UniqueConstraint('team', 'uniform_number', name='uq_team_uniform_number'),
+        Index('ix_players_espn_id', 'espn_id', unique=True),
+        Index('ix_players_status', 'status'),
     )
     
     # Relationship to positions
@@ -44,5 +47,26 @@ class PlayerPosition(Base):
     # Relationship back to player
     player = relationship("Player", back_populates="positions")
     
+    # Positions are loaded per player and filtered by position within a player
+    __table_args__ = (
+        Index('ix_player_positions_player_position', 'player_id', 'position'),
+    )
+    
     def __repr__(self):
         return f"<PlayerPosition(player_id={self.player_id}, position='{self.position}', is_primary={self.is_primary})>"
+
+class PlayerIdentity(Base):
+    """
+    ESPN athlete seen on a roster page: ID, name and the slug ESPN uses in
+    player URLs. Kept for every player ever seen, so game logs can be looked
+    up by name without scraping.
+    """
+    __tablename__ = "player_identities"
+    
+    espn_id = Column(String(20), primary_key=True)
+    name = Column(String(100), nullable=False)
+    slug = Column(String(100))  # e.g. "shohei-ohtani" in /player/_/id/39832/shohei-ohtani
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<PlayerIdentity(espn_id='{self.espn_id}', name='{self.name}')>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import Column, Integer, String, Text, Date, UniqueConstraint
 from sqlalchemy.sql import func
 from ..database import Base
 
@@ -18,3 +18,33 @@ class Team(Base):
     
     def __repr__(self):
         return f"<Team(name='{self.name}', city='{self.city}', division='{self.division}')>"
+
+class TeamRecord(Base):
+    """
+    Materialized season record for a team, maintained by the game syncs.
+    """
+    __tablename__ = "team_records"
+
+    id = Column(Integer, primary_key=True, index=True)
+    team = Column(String(100), nullable=False)
+    season = Column(Integer, nullable=False)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    ties = Column(Integer, nullable=False, default=0)
+    home_wins = Column(Integer, nullable=False, default=0)
+    home_losses = Column(Integer, nullable=False, default=0)
+    away_wins = Column(Integer, nullable=False, default=0)
+    away_losses = Column(Integer, nullable=False, default=0)
+    streak = Column(String(5))  # e.g., "W3", "L1"
+    recent_results = Column(String(10))  # Last 10 results, most recent first (e.g., "WWLWL")
+    last_game_date = Column(Date)
+    created_at = Column(String, server_default=func.now())
+    updated_at = Column(String, server_default=func.now(), onupdate=func.now())
+
+    # One row per team per season; this is the index the record endpoint reads
+    __table_args__ = (
+        UniqueConstraint('team', 'season', name='uq_team_records_team_season'),
+    )
+
+    def __repr__(self):
+        return f"<TeamRecord(team='{self.team}', season={self.season}, {self.wins}-{self.losses})>"
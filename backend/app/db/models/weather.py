@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, Date, Float, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from ..database import Base
+
+class WeatherObservation(Base):
+    """
+    Cached hourly historical weather for a stadium, filled one stadium-day at a time.
+    """
+    __tablename__ = "weather_observations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    stadium_id = Column(Integer, ForeignKey("stadiums.id"), nullable=False)
+    obs_date = Column(Date, nullable=False)
+    hour = Column(Integer, nullable=False)  # 0-23, stadium local time
+    temp_f = Column(Float)
+    condition = Column(String(100))
+    wind_mph = Column(Float)
+    wind_dir = Column(String(10))
+    humidity = Column(Integer)  # percentage
+    precip_in = Column(Float)
+    created_at = Column(String, server_default=func.now())
+
+    # Lookups are always by stadium and day; historical weather never changes
+    __table_args__ = (
+        UniqueConstraint('stadium_id', 'obs_date', 'hour', name='uq_weather_stadium_date_hour'),
+    )
+
+    def __repr__(self):
+        return f"<WeatherObservation(stadium_id={self.stadium_id}, {self.obs_date} {self.hour:02d}:00, {self.temp_f}°F)>"
@@ -0,0 +1,52 @@
+from contextlib import contextmanager
+from typing import Any, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """
+    Collects the SQL statements an engine executes while it is active.
+    """
+
+    def __init__(self):
+        self.statements: List[str] = []
+        self.executions: List[Tuple[str, Any]] = []  # (statement, parameters)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+        self.executions.append((statement, parameters))
+
+
+@contextmanager
+def count_queries(engine: Engine):
+    """
+    Count the statements executed on `engine` inside the block.
+
+        with count_queries(engine) as counter:
+            service.get_players()
+        print(counter.count)
+    """
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter._record)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter._record)
+
+
+@contextmanager
+def assert_max_queries(engine: Engine, limit: int):
+    """
+    Fail if the block executes more than `limit` statements (catches N+1 regressions).
+    """
+    with count_queries(engine) as counter:
+        yield counter
+    if counter.count > limit:
+        statements = "\n".join(counter.statements)
+        raise AssertionError(f"Expected at most {limit} queries, got {counter.count}:\n{statements}")
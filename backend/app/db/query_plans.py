@@ -0,0 +1,61 @@
+import re
+from contextlib import contextmanager
+from typing import Iterable, List
+
+from sqlalchemy.engine import Connection, Engine
+
+from .query_counter import count_queries
+
+# Plan lines that mean "read every row of the table"
+_SQLITE_FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$")
+_POSTGRES_FULL_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+def explain(connection: Connection, statement: str, parameters=None) -> List[str]:
+    """
+    Return the query plan of a statement, one line per plan node.
+    Uses EXPLAIN QUERY PLAN on SQLite and EXPLAIN on PostgreSQL.
+    """
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+        return [row[-1] for row in rows]
+    rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters or {})
+    return [row[0] for row in rows]
+
+
+def full_scans(plan: Iterable[str]) -> List[str]:
+    """
+    Tables a plan reads with a full table scan (index scans don't count).
+    """
+    tables = []
+    for line in plan:
+        line = line.strip()
+        match = _SQLITE_FULL_SCAN.match(line) or _POSTGRES_FULL_SCAN.search(line)
+        if match:
+            tables.append(match.group(1))
+    return tables
+
+
+@contextmanager
+def assert_no_full_scans(engine: Engine, allow: Iterable[str] = ()):
+    """
+    Fail if any SELECT run inside the block plans a full scan of a table not in `allow`.
+
+        with assert_no_full_scans(engine, allow=("stadiums",)):
+            service.get_dodgers_games()
+    """
+    allowed = set(allow)
+    with count_queries(engine) as counter:
+        yield counter
+
+    problems = []
+    with engine.connect() as connection:
+        for statement, parameters in counter.executions:
+            if not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            plan = explain(connection, statement, parameters)
+            scanned = [table for table in full_scans(plan) if table not in allowed]
+            if scanned:
+                problems.append(f"Full scan of {', '.join(scanned)}:\n{statement}\n  " + "\n  ".join(plan))
+    if problems:
+        raise AssertionError("\n\n".join(problems))
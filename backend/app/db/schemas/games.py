@@ -20,6 +20,9 @@ class GameBase(BaseModel):
     day_of_week: Optional[str] = None
     is_night_game: Optional[bool] = None
     days_since_last_game: Optional[int] = None
+    game_state: Optional[str] = None
+    inning: Optional[int] = None
+    status_detail: Optional[str] = None
     weather_temp: Optional[int] = None
     weather_conditions: Optional[str] = None
     wind_speed: Optional[int] = None
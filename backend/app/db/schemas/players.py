@@ -20,6 +20,7 @@ class PlayerPosition(PlayerPositionBase):
 
 class PlayerBase(BaseModel):
     name: str
+    espn_id: Optional[str] = None
     uniform_number: int
     height: Optional[str] = None
     weight: Optional[int] = None
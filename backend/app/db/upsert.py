@@ -0,0 +1,78 @@
+from typing import Any, Dict, Iterable, List, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+# Rows per statement; keeps SQLite under its bound-parameter limit
+UPSERT_CHUNK_SIZE = 500
+
+
+def _dialect_insert(db: Session, model):
+    """
+    Return the dialect-specific insert() that supports ON CONFLICT, or None.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        return pg_insert(model)
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        return sqlite_insert(model)
+    return None
+
+
+def _chunks(rows: List[Dict[str, Any]], size: int) -> Iterable[List[Dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def upsert_rows(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    index_elements: Sequence[str],
+    update_columns: Sequence[str],
+    render_nulls: bool = False,
+    keep_existing_on_null: bool = False,
+) -> int:
+    """
+    Bulk INSERT ... ON CONFLICT DO UPDATE rows into a model's table.
+
+    `index_elements` must match a unique constraint or index. Only
+    `update_columns` are overwritten on conflict, so columns owned by other
+    syncs (weather, results) are left alone. Returns the number of rows sent.
+
+    None values are normally left out of the INSERT (so column defaults
+    apply), which splits a chunk into one statement per distinct set of
+    keys; `render_nulls` binds them as NULL so each chunk is one statement.
+    With `keep_existing_on_null`, a NULL in a row leaves the stored value of
+    that column alone on conflict instead of clearing it.
+    """
+    if not rows:
+        return 0
+
+    stmt = _dialect_insert(db, model)
+    if stmt is None:
+        # No ON CONFLICT support: plain bulk insert, callers must pre-filter
+        for chunk in _chunks(rows, UPSERT_CHUNK_SIZE):
+            db.execute(insert(model), chunk)
+        return len(rows)
+
+    if keep_existing_on_null:
+        table = model.__table__
+        set_ = {column: func.coalesce(stmt.excluded[column], table.c[column]) for column in update_columns}
+    else:
+        set_ = {column: stmt.excluded[column] for column in update_columns}
+    if "updated_at" in model.__table__.c and "updated_at" not in set_:
+        set_["updated_at"] = func.now()
+
+    if set_:
+        stmt = stmt.on_conflict_do_update(index_elements=list(index_elements), set_=set_)
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(index_elements))
+
+    options = {"render_nulls": True} if render_nulls else {}
+    for chunk in _chunks(rows, UPSERT_CHUNK_SIZE):
+        db.execute(stmt, chunk, execution_options=options)
+    return len(rows)
@@ -1,21 +1,78 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional
-import uvicorn
 import os
 
-from .api import roster, games
-from .db.database import engine, Base
-from .core.config import settings
+from .api import roster, games, jobs
+from .db.database import SessionLocal
+from .db.migrate import upgrade_database
+from .core.config import settings, validate_settings
+from .core import http
+from .core.scheduler import scheduler
+from .core.events import events, RedisRelay
+from .core.live_hub import live_hub
+from .services.stadium_resolver import stadium_resolver
+from .services.live_game_service import live_game_poller
+
+
+def migrate_database():
+    # Schema changes are Alembic revisions (migrations/versions); with several
+    # workers, set DB_AUTO_MIGRATE=false and run `alembic upgrade head` once on deploy
+    if settings.DB_AUTO_MIGRATE:
+        upgrade_database()
+
+
+def start_event_relay():
+    # Syncs started through the API run in whichever worker took the request;
+    # the relay carries their live updates to the streams in every worker
+    if not settings.READ_CACHE_REDIS_URL:
+        return
+    try:
+        events.start_relay(RedisRelay.from_url(events, settings.READ_CACHE_REDIS_URL))
+    except ImportError:
+        print("⚠️  Warning: READ_CACHE_REDIS_URL is set but redis is not installed. Live updates stay in this worker.")
+
+
+def load_stadium_index():
+    db = SessionLocal()
+    try:
+        stadium_resolver.load(db)
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup and shutdown. Importing the app has no side effects; all of the
+    work (settings check, migrations, warm caches) happens here.
+    """
+    validate_settings()
+    migrate_database()
+    load_stadium_index()
+    live_hub.start(asyncio.get_running_loop())
+    start_event_relay()
+    # Scheduled syncs run in one worker only: SCHEDULER_ENABLED=true there, unset elsewhere
+    if settings.SCHEDULER_ENABLED:
+        scheduler.start()
+        if settings.LIVE_POLLER_ENABLED:
+            live_game_poller.start()
+    yield
+    live_game_poller.stop()
+    scheduler.shutdown()
+    events.stop_relay()
+    live_hub.stop()
+    http.close_session()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="API for the 2025 Los Angeles Dodgers season",
     version=settings.VERSION,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -30,6 +87,7 @@ app.add_middleware(
 # Include routers
 app.include_router(roster.router, prefix="/api/v1", tags=["roster"])
 app.include_router(games.router, prefix="/api/v1", tags=["games"])
+app.include_router(jobs.router, prefix="/api/v1", tags=["jobs"])
 
 @app.get("/")
 async def root():
@@ -45,6 +103,12 @@ async def root():
             "games": "/api/v1/games",
             "games_sync_schedule": "/api/v1/games/sync-schedule",
             "games_record": "/api/v1/games/record",
+            "games_live": "/api/v1/games/live",
+            "games_live_stream": "/api/v1/games/live/stream",
+            "games_sync_box_scores": "/api/v1/games/sync-box-scores",
+            "players_sync_game_logs": "/api/v1/players/sync-game-logs",
+            "jobs": "/api/v1/jobs",
+            "job_runs": "/api/v1/jobs/runs",
             "docs": "/docs"
         }
     }
@@ -54,4 +118,13 @@ async def health_check():
     return {"status": "healthy", "service": "dodger-report-api"}
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    import uvicorn
+
+    class Server(uvicorn.Server):
+        # uvicorn waits for open connections before the lifespan shutdown, and
+        # live streams never close on their own: end them when shutdown starts
+        def handle_exit(self, sig, frame):
+            live_hub.stop()
+            super().handle_exit(sig, frame)
+
+    Server(uvicorn.Config(app, host="0.0.0.0", port=8000)).run()
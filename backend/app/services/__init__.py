@@ -1,10 +1,17 @@
 # Services Package
+#
+# Services are imported on first use so a worker only loads what its routes
+# need (the scraping services pull in BeautifulSoup and requests).
 
-from .game_service import GameService
-from .stadium_service import StadiumService
-from .player_service import PlayerService
-from .box_score_service import BoxScoreService
-from .player_game_service import PlayerGameService
+import importlib
+
+_SERVICE_MODULES = {
+    "GameService": ".game_service",
+    "StadiumService": ".stadium_service",
+    "PlayerService": ".player_service",
+    "BoxScoreService": ".box_score_service",
+    "PlayerGameService": ".player_game_service",
+}
 
 __all__ = [
     "GameService",
@@ -13,3 +20,10 @@ __all__ = [
     "BoxScoreService",
     "PlayerGameService"
 ]
+
+
+def __getattr__(name):
+    if name in _SERVICE_MODULES:
+        module = importlib.import_module(_SERVICE_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
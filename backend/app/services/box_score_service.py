@@ -1,10 +1,65 @@
-import requests
-from typing import Dict, List, Optional, Any
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import insert, select, update, func, cast, Float
 from sqlalchemy.orm import Session
 from ..core.config import settings
-from ..db.models.games import Game, PlayerGameStats
+from ..core import http
+from ..core.rate_limit import TokenBucket
+from ..db.models.games import Game, GameResult, PlayerGameStats
 from ..db.models.players import Player
-import re
+from ..db.upsert import upsert_rows
+from .player_registry import normalize_player_name
+
+# Shared by all box-score workers so a backfill stays within ESPN's API limits
+espn_api_limiter = TokenBucket(settings.ESPN_API_RATE_LIMIT)
+
+# PlayerGameStats columns summed into a season line
+SEASON_SUM_COLUMNS = [
+    'at_bats', 'runs', 'hits', 'doubles', 'triples', 'home_runs', 'rbis', 'walks',
+    'strikeouts', 'stolen_bases', 'caught_stealing', 'hit_by_pitch', 'sacrifice_flies',
+    'innings_pitched', 'hits_allowed', 'earned_runs', 'walks_allowed', 'strikeouts_pitched'
+]
+SEASON_RATE_COLUMNS = ['batting_average', 'on_base_percentage', 'slugging_percentage', 'ops']
+SEASON_PITCHING_RATE_COLUMNS = ['era', 'whip', 'strikeouts_per_nine']
+
+# Summary box score stat keys -> PlayerGameStats columns, per statistics group.
+# Keys missing from a game's box score leave the stored column alone.
+BOX_SCORE_STAT_KEYS = {
+    'batting': {
+        'atBats': 'at_bats', 'runs': 'runs', 'hits': 'hits', 'doubles': 'doubles',
+        'triples': 'triples', 'homeRuns': 'home_runs', 'RBIs': 'rbis', 'walks': 'walks',
+        'strikeouts': 'strikeouts', 'stolenBases': 'stolen_bases', 'caughtStealing': 'caught_stealing',
+        'hitByPitch': 'hit_by_pitch', 'sacBunts': 'sacrifice_bunts', 'sacFlies': 'sacrifice_flies',
+        'leftOnBase': 'left_on_base',
+    },
+    'pitching': {
+        'fullInnings.partInnings': 'innings_pitched', 'hits': 'hits_allowed', 'runs': 'runs_allowed',
+        'earnedRuns': 'earned_runs', 'walks': 'walks_allowed', 'strikeouts': 'strikeouts_pitched',
+        'homeRuns': 'home_runs_allowed', 'wildPitches': 'wild_pitches', 'balks': 'balks',
+        'hitBatsmen': 'hit_batters', 'pitches': 'pitches_thrown',
+    },
+    'fielding': {
+        'putouts': 'putouts', 'assists': 'assists', 'errors': 'errors',
+        'doublePlays': 'double_plays', 'passedBalls': 'passed_balls',
+    },
+}
+
+# Pitching decision notes, e.g. "(W, 10-5)", "(S, 21)", "(BS, 3)"
+DECISION_PATTERN = re.compile(r'^\(?\s*(W|L|SV|S|HLD|H|BS)\b')
+DECISION_COLUMNS = {'W': 'win', 'L': 'loss', 'S': 'save', 'SV': 'save', 'H': 'hold', 'HLD': 'hold', 'BS': 'blown_save'}
+
+# GameResult columns per side, from the teams' box score statistics
+TEAM_STATS = {
+    'hits': ('batting', 'hits'),
+    'errors': ('fielding', 'errors'),
+    'lob': ('batting', 'leftOnBase'),
+    'risp': ('batting', 'hitsWithRISP'),
+}
+
+ProgressCallback = Callable[[int, int], None]
 
 class BoxScoreService:
     """
@@ -15,62 +70,125 @@ class BoxScoreService:
         self.db = db
         self.espn_base_url = settings.ESPN_BASE_URL
     
+    def fetch_summary(self, espn_id: str) -> Dict[str, Any]:
+        """
+        Fetch one game's /summary (box score included). Does no database
+        work, so it is safe to call from worker threads; errors are raised.
+        """
+        return http.fetch_json(f"{self.espn_base_url}/summary", params={"event": espn_id}, cache="boxscore",
+                               limiter=espn_api_limiter)
+    
     def fetch_game_box_score(self, espn_id: str) -> Optional[Dict[str, Any]]:
         """
         Fetch box score data for a specific game from ESPN.
         """
         try:
-            # ESPN scoreboard endpoint - this is what we know works
-            url = f"{self.espn_base_url}/scoreboard"
-            print(f"Fetching from ESPN endpoint: {url}")
-            
-            response = requests.get(url)
-            response.raise_for_status()
-            
-            data = response.json()
-            print(f"Response keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-            
-            # Find the specific game in events
-            events = data.get('events', [])
-            target_event = None
-            
-            for event in events:
-                if event.get('id') == espn_id:
-                    print(f"Found game in events: {espn_id}")
-                    target_event = event
-                    break
-            
-            if not target_event:
-                print(f"Game with ESPN ID {espn_id} not found in scoreboard")
+            data = self.fetch_summary(espn_id)
+            if not data.get('boxscore'):
+                print(f"No box score in summary for game {espn_id}")
                 return None
-            
-            return target_event
+            return data
             
         except Exception as e:
             print(f"Error fetching box score for game {espn_id}: {e}")
             return None
     
-    def parse_player_batting_stats(self, competitor_data: Dict[str, Any], game_id: int) -> List[PlayerGameStats]:
+    def _stat_value(self, column: str, value: Any) -> Any:
+        text = str(value).strip() if value is not None else ''
+        if column == 'innings_pitched':
+            return self._parse_innings(text)
+        try:
+            return int(text) if text and text not in ('-', '--') else 0
+        except ValueError:
+            return None
+    
+    def _parse_player_stats(self, summary: Dict[str, Any], group_type: str) -> Dict[str, Dict[str, Any]]:
+        """
+        One group's lines (batting, pitching or fielding) by ESPN athlete ID,
+        mapped with BOX_SCORE_STAT_KEYS. Entries carry `_name` for players
+        we only know by name.
+        """
+        mapping = BOX_SCORE_STAT_KEYS[group_type]
+        lines: Dict[str, Dict[str, Any]] = {}
+        for team in summary.get('boxscore', {}).get('players', []):
+            for group in team.get('statistics', []):
+                if (group.get('type') or group.get('name')) != group_type:
+                    continue
+                keys = group.get('keys', [])
+                for entry in group.get('athletes', []):
+                    athlete = entry.get('athlete', {})
+                    espn_id = str(athlete.get('id') or '')
+                    if not espn_id:
+                        continue
+                    line = lines.setdefault(espn_id, {'_name': athlete.get('displayName')})
+                    for key, value in zip(keys, entry.get('stats', [])):
+                        if key == 'pitches-strikes' and '-' in str(value):
+                            pitches, strikes = str(value).split('-', 1)
+                            line['pitches_thrown'] = self._stat_value('pitches_thrown', pitches)
+                            line['strikes_thrown'] = self._stat_value('strikes_thrown', strikes)
+                        elif key in mapping:
+                            line[mapping[key]] = self._stat_value(mapping[key], value)
+                    if group_type == 'batting':
+                        line['is_starter'] = bool(entry.get('starter'))
+                        position = entry.get('position') or athlete.get('position') or {}
+                        line['position'] = position.get('abbreviation')
+                    if group_type == 'pitching':
+                        line['is_starter'] = bool(entry.get('starter'))
+                        line['position'] = 'P'
+                        for column in DECISION_COLUMNS.values():
+                            line[column] = False
+                        for note in entry.get('notes', []):
+                            match = DECISION_PATTERN.match(note.get('text', ''))
+                            if match:
+                                line[DECISION_COLUMNS[match.group(1)]] = True
+        return lines
+    
+    def parse_player_batting_stats(self, summary: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
-        Parse batting statistics for all players in a game.
-        For now, this is a placeholder since ESPN's public API doesn't provide detailed player stats.
-        We'll need to either:
-        1. Use a different data source (MLB Stats API when approved)
-        2. Scrape the ESPN website box scores
-        3. Find an alternative free API
+        Batting lines by ESPN athlete ID (plus starter flag and position).
         """
-        print("Note: ESPN's public API doesn't provide detailed player statistics")
-        print("This method is a placeholder for future implementation")
-        return []
+        return self._parse_player_stats(summary, 'batting')
     
-    def parse_player_pitching_stats(self, competitor_data: Dict[str, Any], game_id: int) -> List[PlayerGameStats]:
+    def parse_player_pitching_stats(self, summary: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
-        Parse pitching statistics for all players in a game.
-        For now, this is a placeholder since ESPN's public API doesn't provide detailed player stats.
+        Pitching lines by ESPN athlete ID, with W/L/S/H/BS decisions.
         """
-        print("Note: ESPN's public API doesn't provide detailed player statistics")
-        print("This method is a placeholder for future implementation")
-        return []
+        return self._parse_player_stats(summary, 'pitching')
+    
+    def parse_player_fielding_stats(self, summary: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fielding lines by ESPN athlete ID.
+        """
+        return self._parse_player_stats(summary, 'fielding')
+    
+    def parse_team_stats(self, summary: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Hits, errors, LOB and RISP per side ('home'/'away'). Hits and errors
+        fall back to the header line score.
+        """
+        sides: Dict[str, Dict[str, Any]] = {}
+        for team in summary.get('boxscore', {}).get('teams', []):
+            groups = {
+                group.get('name'): {stat.get('name'): stat.get('displayValue') for stat in group.get('stats', [])}
+                for group in team.get('statistics', [])
+            }
+            side = sides.setdefault(team.get('homeAway'), {})
+            for column, (group, name) in TEAM_STATS.items():
+                value = groups.get(group, {}).get(name)
+                if column == 'risp':
+                    # "3-15" or "3-for-15"
+                    match = re.match(r'^(\d+)\D+(\d+)$', value or '')
+                    side[column] = f"{match.group(1)}-{match.group(2)}" if match else None
+                else:
+                    side[column] = self._stat_value(column, value) if value is not None else None
+        
+        competitions = summary.get('header', {}).get('competitions', [])
+        for competitor in competitions[0].get('competitors', []) if competitions else []:
+            side = sides.setdefault(competitor.get('homeAway'), {})
+            for column in ('hits', 'errors'):
+                if side.get(column) is None and competitor.get(column) is not None:
+                    side[column] = int(competitor[column])
+        return {side: stats for side, stats in sides.items() if side in ('home', 'away')}
     
     def _parse_innings(self, ip_string: str) -> float:
         """
@@ -98,10 +216,75 @@ class BoxScoreService:
         except:
             return 0.0
     
+    def _player_ids(self, lines: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Our player IDs for box score athletes, by ESPN ID (or by name for
+        players saved before ESPN IDs were recorded). Opponents are left out.
+        """
+        ids = dict(self.db.execute(
+            select(Player.espn_id, Player.id).where(Player.espn_id.in_(list(lines)))
+        ).all())
+        missing = {normalize_player_name(line['_name']): espn_id for espn_id, line in lines.items()
+                   if espn_id not in ids and line.get('_name')}
+        if missing:
+            for player_id, name in self.db.execute(select(Player.id, Player.name).where(Player.espn_id.is_(None))):
+                espn_id = missing.get(normalize_player_name(name))
+                if espn_id:
+                    ids[espn_id] = player_id
+        return ids
+    
+    def store_box_score(self, game: Game, summary: Dict[str, Any]) -> int:
+        """
+        Write a game's player stats in one bulk upsert on (player_id, game_id)
+        and its team hits/errors/LOB/RISP on the game result, and mark the game
+        as synced. Does not commit. Returns the number of player lines written.
+        """
+        lines: Dict[str, Dict[str, Any]] = {}
+        for group in (self.parse_player_batting_stats(summary),
+                      self.parse_player_pitching_stats(summary),
+                      self.parse_player_fielding_stats(summary)):
+            for espn_id, line in group.items():
+                merged = lines.setdefault(espn_id, {})
+                for column, value in line.items():
+                    merged.setdefault(column, value)  # Batting decides starter/position for two-way players
+        
+        player_ids = self._player_ids(lines)
+        # Every row needs the same keys for the bulk statement. Columns a player
+        # has no line for are NULL and keep their stored value (e.g. game-log
+        # batting for a pitcher); no pitching line means no decision.
+        columns = sorted({column for line in lines.values() for column in line if not column.startswith('_')})
+        rows = [
+            {
+                'game_id': game.id,
+                'player_id': player_ids[espn_id],
+                **{column: line.get(column, False if column in DECISION_COLUMNS.values() else None) for column in columns}
+            }
+            for espn_id, line in lines.items() if espn_id in player_ids
+        ]
+        upsert_rows(self.db, PlayerGameStats, rows, ['player_id', 'game_id'], columns,
+                    render_nulls=True, keep_existing_on_null=True)
+        
+        teams = self.parse_team_stats(summary)
+        values = {
+            f"{side}_{column}": teams.get(side, {}).get(column)
+            for side in ('home', 'away') for column in TEAM_STATS
+        }
+        result_id = self.db.execute(
+            select(GameResult.id).where(GameResult.game_id == game.id).order_by(GameResult.id).limit(1)
+        ).scalar()
+        if result_id:
+            self.db.execute(update(GameResult).where(GameResult.id == result_id).values(**values))
+        elif game.home_score is not None and game.away_score is not None:
+            self.db.execute(insert(GameResult).values(
+                game_id=game.id, home_team=game.home_team, away_team=game.away_team,
+                home_score=game.home_score, away_score=game.away_score, **values
+            ))
+        game.box_score_synced_at = datetime.now()
+        return len(rows)
+    
     def sync_game_player_stats(self, espn_id: str) -> Dict[str, Any]:
         """
-        Sync player statistics for a specific game.
-        Note: This is currently a placeholder since ESPN's public API doesn't provide detailed player stats.
+        Sync batting, pitching and fielding stats for a specific game from its ESPN box score.
         """
         try:
             # Get the game from our database
@@ -112,31 +295,96 @@ class BoxScoreService:
                     "reason": f"Game with ESPN ID {espn_id} not found in database"
                 }
             
-            # Fetch box score from ESPN (this works and gives us game structure)
-            box_score_data = self.fetch_game_box_score(espn_id)
-            if not box_score_data:
+            summary = self.fetch_game_box_score(espn_id)
+            if not summary:
                 return {
                     "synced": False,
                     "reason": "Failed to fetch box score data from ESPN"
                 }
             
-            print(f"Successfully fetched game data for {espn_id}")
-            print(f"Game structure: {list(box_score_data.keys())}")
+            stored = self.store_box_score(game, summary)
+            self.db.commit()
             
-            # For now, return a placeholder response since we can't get player stats yet
             return {
-                "synced": False,
-                "reason": "ESPN's public API doesn't provide detailed player statistics. This endpoint is ready for when we get access to MLB Stats API or implement web scraping.",
-                "game_found": True,
-                "game_structure": list(box_score_data.keys()) if isinstance(box_score_data, dict) else "Not a dict"
+                "synced": True,
+                "reason": f"Stored stats for {stored} players",
+                "players": stored
             }
             
         except Exception as e:
+            self.db.rollback()
             return {
                 "synced": False,
                 "reason": f"Error syncing player stats: {e}"
             }
     
+    def games_missing_box_scores(self) -> List[Tuple[int, str]]:
+        """
+        (id, ESPN ID) of final games whose box score hasn't been stored yet.
+        """
+        return self.db.execute(
+            select(Game.id, Game.espn_id)
+            .where(Game.is_final.is_(True), Game.box_score_synced_at.is_(None))
+            .order_by(Game.game_date)
+        ).all()
+    
+    def sync_missing_box_scores(self, progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+        """
+        Store box scores for every final game that doesn't have one.
+        
+        Summaries are fetched concurrently (BOX_SCORE_WORKERS, rate limited by
+        espn_api_limiter); DB writes stay on this thread, one bulk write and
+        commit per game, so an interrupted run resumes with the games it missed.
+        """
+        started = time.monotonic()
+        try:
+            missing = self.games_missing_box_scores()
+            stored_games = 0
+            stored_lines = 0
+            failures = []
+            
+            if missing:
+                with ThreadPoolExecutor(max_workers=settings.BOX_SCORE_WORKERS) as executor:
+                    futures = {
+                        executor.submit(self.fetch_summary, espn_id): (game_id, espn_id)
+                        for game_id, espn_id in missing
+                    }
+                    for done, future in enumerate(as_completed(futures), 1):
+                        game_id, espn_id = futures[future]
+                        try:
+                            summary = future.result()
+                            if not summary.get('boxscore'):
+                                raise ValueError("No box score in summary")
+                            stored_lines += self.store_box_score(self.db.get(Game, game_id), summary)
+                            self.db.commit()
+                            stored_games += 1
+                        except Exception as e:
+                            self.db.rollback()
+                            failures.append({"espn_id": espn_id, "error": str(e)})
+                        if progress:
+                            progress(done, len(missing))
+            
+            elapsed = time.monotonic() - started
+            print(f"Box scores: {stored_games} games, {stored_lines} player lines in {elapsed:.1f}s, {len(failures)} failures")
+            
+            return {
+                "synced": True,
+                "reason": f"Stored box scores for {stored_games} games",
+                "games": stored_games,
+                "player_lines": stored_lines,
+                "failures": failures,
+                "elapsed_seconds": round(elapsed, 2)
+            }
+            
+        except Exception as e:
+            self.db.rollback()
+            print(f"Error syncing box scores: {e}")
+            return {
+                "synced": False,
+                "reason": f"Error: {str(e)}",
+                "games": 0
+            }
+    
     def get_player_game_stats(self, game_id: int) -> List[PlayerGameStats]:
         """
         Get all player statistics for a specific game.
@@ -149,43 +397,77 @@ class BoxScoreService:
         """
         Get aggregated season statistics for a specific player.
         """
+        return self.get_players_season_stats([player_id], season)[player_id]
+    
+    def get_players_season_stats(self, player_ids: List[int], season: int = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Get aggregated season statistics for several players with one grouped query.
+        Counting stats are summed in SQL and the rate stats (AVG/OBP/SLG/OPS,
+        ERA/WHIP/K9) are derived in the same statement.
+        Players without any games get an all-zero line.
+        """
         if not season:
             season = 2025  # Default to current season
         
-        # Get all games for the season
-        season_games = self.db.query(Game).filter(
-            Game.game_date >= f"{season}-01-01",
-            Game.game_date <= f"{season}-12-31"
-        ).all()
+        stat = PlayerGameStats
+        totals = {
+            column: func.coalesce(func.sum(getattr(stat, column)), 0)
+            for column in SEASON_SUM_COLUMNS
+        }
         
-        game_ids = [game.id for game in season_games]
+        # Rates need float division and must not divide by zero
+        at_bats = func.nullif(totals['at_bats'], 0)
+        plate_appearances = func.nullif(
+            totals['at_bats'] + totals['walks'] + totals['hit_by_pitch'] + totals['sacrifice_flies'], 0
+        )
+        innings = func.nullif(totals['innings_pitched'], 0)
+        total_bases = (
+            totals['hits'] + totals['doubles'] + 2 * totals['triples'] + 3 * totals['home_runs']
+        )
+        on_base = totals['hits'] + totals['walks'] + totals['hit_by_pitch']
         
-        # Get all player stats for these games
-        player_stats = self.db.query(PlayerGameStats).filter(
-            PlayerGameStats.player_id == player_id,
-            PlayerGameStats.game_id.in_(game_ids)
-        ).all()
+        batting_average = cast(totals['hits'], Float) / at_bats
+        on_base_percentage = cast(on_base, Float) / plate_appearances
+        slugging_percentage = cast(total_bases, Float) / at_bats
         
-        # Aggregate the stats
-        aggregated = {
-            'games_played': len(player_stats),
-            'at_bats': sum(ps.at_bats or 0 for ps in player_stats),
-            'runs': sum(ps.runs or 0 for ps in player_stats),
-            'hits': sum(ps.hits or 0 for ps in player_stats),
-            'doubles': sum(ps.doubles or 0 for ps in player_stats),
-            'triples': sum(ps.triples or 0 for ps in player_stats),
-            'home_runs': sum(ps.home_runs or 0 for ps in player_stats),
-            'rbis': sum(ps.rbis or 0 for ps in player_stats),
-            'walks': sum(ps.walks or 0 for ps in player_stats),
-            'strikeouts': sum(ps.strikeouts or 0 for ps in player_stats),
-            'stolen_bases': sum(ps.stolen_bases or 0 for ps in player_stats),
-            'caught_stealing': sum(ps.caught_stealing or 0 for ps in player_stats),
-        }
+        query = (
+            select(
+                stat.player_id,
+                func.count(stat.id).label('games_played'),
+                *[expression.label(column) for column, expression in totals.items()],
+                batting_average.label('batting_average'),
+                on_base_percentage.label('on_base_percentage'),
+                slugging_percentage.label('slugging_percentage'),
+                (func.coalesce(on_base_percentage, 0) + func.coalesce(slugging_percentage, 0)).label('ops'),
+                (9.0 * totals['earned_runs'] / innings).label('era'),
+                (cast(totals['walks_allowed'] + totals['hits_allowed'], Float) / innings).label('whip'),
+                (9.0 * totals['strikeouts_pitched'] / innings).label('strikeouts_per_nine')
+            )
+            .join(Game, Game.id == stat.game_id)
+            .where(
+                stat.player_id.in_(player_ids),
+                Game.game_date >= date(season, 1, 1),
+                Game.game_date <= date(season, 12, 31)
+            )
+            .group_by(stat.player_id)
+        )
         
-        # Calculate batting average
-        if aggregated['at_bats'] > 0:
-            aggregated['batting_average'] = round(aggregated['hits'] / aggregated['at_bats'], 3)
-        else:
-            aggregated['batting_average'] = 0.000
+        lines = {player_id: self._empty_season_line() for player_id in player_ids}
+        for row in self.db.execute(query):
+            line = dict(row._mapping)
+            del line['player_id']
+            for column in SEASON_RATE_COLUMNS:
+                line[column] = round(float(line[column]), 3) if line[column] is not None else 0.000
+            for column in SEASON_PITCHING_RATE_COLUMNS:
+                line[column] = round(line[column], 2) if line[column] is not None else None
+            line['innings_pitched'] = round(line['innings_pitched'], 2)
+            lines[row.player_id] = line
         
-        return aggregated
+        return lines
+    
+    def _empty_season_line(self) -> Dict[str, Any]:
+        line = {'games_played': 0}
+        line.update({column: 0 for column in SEASON_SUM_COLUMNS})
+        line.update({column: 0.000 for column in SEASON_RATE_COLUMNS})
+        line.update({column: None for column in SEASON_PITCHING_RATE_COLUMNS})
+        return line
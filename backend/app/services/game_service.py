@@ -1,13 +1,34 @@
-import requests
-from datetime import datetime, date
-from typing import List, Dict, Optional, Any
-from sqlalchemy.orm import Session
-from ..db.models import Game, GameResult, PlayerGameStats, Player
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, date, timedelta
+from typing import Callable, List, Dict, Optional, Any
+from sqlalchemy import select, insert, update, or_
+from sqlalchemy.orm import Session, raiseload
+from ..db.models import Game, GameResult, PlayerGameStats, Player, Stadium, WeatherObservation
 from ..db.schemas import GameCreate, GameResultCreate, PlayerGameStatsCreate
 from .stadium_service import StadiumService
+from .standings_service import StandingsService, DODGERS
 from ..core.config import settings
+from ..core import http
+from ..core.events import events, GAME_UPDATE, RECORD_UPDATE
+from ..db.upsert import upsert_rows
+from ..db.data_versions import bump_version, GAMES
 import re
 
+# Game columns owned by the schedule sync; everything else (weather, results)
+# is enriched later and must survive a re-sync
+SCHEDULE_COLUMNS = [
+    'game_date', 'home_team', 'away_team', 'home_score', 'away_score', 'venue',
+    'attendance', 'game_duration', 'extra_innings', 'neutral_site', 'is_final',
+    'day_of_week', 'is_night_game', 'stadium_id'
+]
+
+# Games handed to the API are serialized without their relationships; a schema
+# that starts reading one fails loudly instead of lazy-loading it per row
+GAME_LOADER_OPTIONS = (
+    raiseload('*'),
+)
+
 class GameService:
     def __init__(self, db: Session):
         self.db = db
@@ -18,88 +39,129 @@ class GameService:
     def sync_dodgers_schedule(self) -> Dict[str, Any]:
         """
         Sync the Dodgers' current season schedule from ESPN.
-        Returns sync result with game count and status.
+        Existing games are upserted in place so weather, results and player
+        stats attached to them survive a re-sync.
+        Returns sync result with inserted, updated and unchanged counts.
         """
         try:
             print("Fetching Dodgers schedule from ESPN...")
             
             # Get schedule
             schedule_url = f"{self.espn_base_url}/teams/{self.dodgers_team_id}/schedule"
-            response = requests.get(schedule_url)
-            response.raise_for_status()
+            schedule_data = http.fetch_json(schedule_url, cache="schedule")
+            schedule_events = schedule_data.get('events', [])
             
-            schedule_data = response.json()
-            events = schedule_data.get('events', [])
-            
-            if not events:
+            if not schedule_events:
                 return {
                     "synced": False,
                     "reason": "No games found in schedule",
                     "games_count": 0
                 }
             
-            print(f"Found {len(events)} games in schedule")
+            print(f"Found {len(schedule_events)} games in schedule")
             
-            # Clear existing games for this season
-            current_year = datetime.now().year
-            self.db.query(Game).filter(
-                Game.game_date >= date(current_year, 1, 1)
-            ).delete()
-            self.db.commit()
-            
-            added_games = 0
+            # Parse and de-duplicate the schedule in memory
+            incoming = {}  # espn_id -> (game_data, event)
             processed_games = set()  # Track unique games to avoid duplicates
             
-            for event in events:
+            for event in schedule_events:
                 try:
                     game_data = self._parse_schedule_event(event)
-                    if game_data:
-                        # Skip Spring Training games (March games)
-                        if game_data['game_date'].month == 3:
-                            print(f"Skipping Spring Training: {game_data['away_team']} @ {game_data['home_team']} on {game_data['game_date']}")
-                            continue
-                        
-                        # Create a unique key for the game (date + teams)
-                        game_key = f"{game_data['game_date']}_{game_data['home_team']}_{game_data['away_team']}"
-                        
-                        # Skip if we've already processed this exact game
-                        if game_key in processed_games:
-                            print(f"Skipping duplicate game: {game_data['away_team']} @ {game_data['home_team']} on {game_data['game_date']}")
-                            continue
-                        
-                        processed_games.add(game_key)
-                        
-                        # Check if game already exists by ESPN ID
-                        existing_game = self.db.query(Game).filter(
-                            Game.espn_id == game_data['espn_id']
-                        ).first()
+                    if not game_data:
+                        continue
+                    
+                    # Skip Spring Training games (March games)
+                    if game_data['game_date'].month == 3:
+                        continue
+                    
+                    # Create a unique key for the game (date + teams)
+                    game_key = f"{game_data['game_date']}_{game_data['home_team']}_{game_data['away_team']}"
+                    
+                    # Skip if we've already processed this exact game
+                    if game_key in processed_games or game_data['espn_id'] in incoming:
+                        continue
+                    
+                    processed_games.add(game_key)
+                    # Persist the stadium so weather lookups skip name matching
+                    game_data['stadium_id'] = self.stadium_service.resolve_stadium_id(game_data['venue'])
+                    incoming[game_data['espn_id']] = (game_data, event)
                         
-                        if not existing_game:
-                            game = Game(**game_data)
-                            self.db.add(game)
-                            self.db.flush()  # Get the game ID
-                            
-                            # Create generic game result
-                            game_result = self._create_game_result(game, event)
-                            if game_result:
-                                self.db.add(game_result)
-                            
-                            added_games += 1
-                            print(f"Added game: {game_data['away_team']} @ {game_data['home_team']} on {game_data['game_date']}")
-                        else:
-                            print(f"Game already exists: {game_data['away_team']} @ {game_data['home_team']}")
-                            
                 except Exception as e:
                     print(f"Error processing game: {e}")
                     continue
             
+            # Load the schedule-owned columns of every known game in one query
+            existing = {
+                row.espn_id: row
+                for row in self.db.execute(
+                    select(Game.id, Game.espn_id, *[getattr(Game, column) for column in SCHEDULE_COLUMNS])
+                    .where(Game.espn_id.in_(list(incoming)))
+                )
+            }
+            
+            to_insert = []
+            to_update = []
+            game_events = []
+            unchanged = 0
+            
+            for espn_id, (game_data, _) in incoming.items():
+                current = existing.get(espn_id)
+                if current is None:
+                    to_insert.append(game_data)
+                    continue
+                changes = {
+                    column: game_data[column] for column in SCHEDULE_COLUMNS
+                    if getattr(current, column) != game_data[column]
+                }
+                if changes:
+                    to_update.append(game_data)
+                    game_events.append(dict(changes, game_id=current.id, espn_id=espn_id))
+                else:
+                    unchanged += 1
+            
+            upsert_rows(self.db, Game, to_insert + to_update, ['espn_id'], SCHEDULE_COLUMNS)
+            
+            # New games get a generic game result, written in one bulk insert
+            if to_insert:
+                new_ids = dict(self.db.execute(
+                    select(Game.espn_id, Game.id).where(
+                        Game.espn_id.in_([game_data['espn_id'] for game_data in to_insert])
+                    )
+                ).all())
+                result_rows = [
+                    self._create_game_result(new_ids[game_data['espn_id']], incoming[game_data['espn_id']][1])
+                    for game_data in to_insert
+                ]
+                result_rows = [row for row in result_rows if row]
+                if result_rows:
+                    self.db.execute(insert(GameResult), result_rows)
+                game_events.extend(
+                    dict({column: game_data[column] for column in SCHEDULE_COLUMNS},
+                         game_id=new_ids[game_data['espn_id']], espn_id=game_data['espn_id'])
+                    for game_data in to_insert
+                )
+            
+            # Schedule rows can carry final scores; refresh those seasons' records
+            standings = StandingsService(self.db)
+            seasons = {game_data['game_date'].year for game_data in to_insert + to_update if game_data['is_final']}
+            for season in seasons:
+                standings.rebuild_record(DODGERS, season)
+            
+            if to_insert or to_update:
+                bump_version(self.db, GAMES)
             self.db.commit()
+            self._publish(game_events, standings, seasons)
+            
+            print(f"Schedule sync: {len(to_insert)} inserted, {len(to_update)} updated, {unchanged} unchanged")
             
             return {
                 "synced": True,
-                "reason": f"Successfully synced {added_games} games from ESPN",
-                "games_count": added_games,
-                "total_games": len(events)
+                "reason": f"Successfully synced {len(to_insert) + len(to_update)} games from ESPN",
+                "games_count": len(to_insert) + len(to_update),
+                "inserted": len(to_insert),
+                "updated": len(to_update),
+                "unchanged": unchanged,
+                "total_games": len(schedule_events)
             }
             
         except Exception as e:
@@ -217,9 +279,9 @@ class GameService:
             print(f"Error extracting teams from name '{name}': {e}")
             return None
 
-    def _create_game_result(self, game: Game, event: Dict[str, Any]) -> Optional[GameResult]:
+    def _create_game_result(self, game_id: int, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Create a GameResult record for a game.
+        Build GameResult column values for a game, ready for a bulk insert.
         """
         try:
             competition = event.get('competitions', [{}])[0] if event.get('competitions') else {}
@@ -261,15 +323,15 @@ class GameService:
                         away_record_after = record.get('displayValue')
                         break
             
-            return GameResult(
-                game_id=game.id,
-                home_team=home_team,
-                away_team=away_team,
-                home_score=home_score,
-                away_score=away_score,
-                home_record_after=home_record_after,
-                away_record_after=away_record_after
-            )
+            return {
+                'game_id': game_id,
+                'home_team': home_team,
+                'away_team': away_team,
+                'home_score': home_score,
+                'away_score': away_score,
+                'home_record_after': home_record_after,
+                'away_record_after': away_record_after
+            }
             
         except Exception as e:
             print(f"Error creating game result: {e}")
@@ -279,7 +341,7 @@ class GameService:
         """
         Get recent Dodgers games.
         """
-        return self.db.query(Game).filter(
+        return self.db.query(Game).options(*GAME_LOADER_OPTIONS).filter(
             (Game.home_team == 'Los Angeles Dodgers') | (Game.away_team == 'Los Angeles Dodgers')
         ).order_by(Game.is_final.desc(), Game.game_date.desc()).limit(limit).all()
 
@@ -287,48 +349,27 @@ class GameService:
         """
         Get a game by its ESPN ID.
         """
-        return self.db.query(Game).filter(Game.espn_id == espn_id).first()
+        return self.db.query(Game).options(*GAME_LOADER_OPTIONS).filter(Game.espn_id == espn_id).first()
 
-    def get_dodger_record(self) -> Dict[str, Any]:
+    def has_live_game_window(self, today: Optional[date] = None) -> bool:
+        """
+        Whether a Dodgers game from today (or a late game from last night) is not final yet.
+        The scheduler polls results more often while this is true.
+        """
+        today = today or date.today()
+        return self.db.query(Game.id).filter(
+            or_(Game.home_team == DODGERS, Game.away_team == DODGERS),
+            Game.game_date.in_([today - timedelta(days=1), today]),
+            Game.is_final.isnot(True)
+        ).first() is not None
+
+    def get_dodger_record(self, season: Optional[int] = None) -> Dict[str, Any]:
         """
         Get current Dodgers record and recent performance.
+        Reads the materialized team_records row kept current by the syncs.
         """
-        # Get all Dodger game results
-        results = self.db.query(GameResult).join(Game).filter(
-            (GameResult.home_team == 'Los Angeles Dodgers') | (GameResult.away_team == 'Los Angeles Dodgers')
-        ).order_by(Game.game_date.desc()).all()
-        
-        if not results:
-            return {"wins": 0, "losses": 0, "ties": 0, "record": "0-0"}
-        
-        wins = 0
-        losses = 0
-        ties = 0
-        
-        for result in results:
-            if result.home_team == 'Los Angeles Dodgers':
-                if result.home_score > result.away_score:
-                    wins += 1
-                elif result.home_score < result.away_score:
-                    losses += 1
-                else:
-                    ties += 1
-            else:  # Dodgers are away team
-                if result.away_score > result.home_score:
-                    wins += 1
-                elif result.away_score < result.home_score:
-                    losses += 1
-                else:
-                    ties += 1
-        
-        return {
-            "wins": wins,
-            "losses": losses,
-            "ties": ties,
-            "record": f"{wins}-{losses}",
-            "total_games": len(results),
-            "last_game": results[0].game.game_date if results else None
-        }
+        standings = StandingsService(self.db)
+        return standings.to_dict(standings.get_record(DODGERS, season))
 
     def debug_espn_schedule(self) -> Dict[str, Any]:
         """
@@ -336,10 +377,7 @@ class GameService:
         """
         try:
             schedule_url = f"{self.espn_base_url}/teams/{self.dodgers_team_id}/schedule"
-            response = requests.get(schedule_url)
-            response.raise_for_status()
-            
-            schedule_data = response.json()
+            schedule_data = http.fetch_json(schedule_url, cache="schedule")
             events = schedule_data.get('events', [])
             
             # Analyze the data
@@ -399,10 +437,7 @@ class GameService:
         """
         try:
             url = f"{self.espn_base_url}/scoreboard"
-            response = requests.get(url)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = http.fetch_json(url, cache="scoreboard")
             events = data.get('events', [])
             
             # Find Dodgers games in the scoreboard
@@ -459,6 +494,8 @@ class GameService:
                     print(f"Error calculating result for game {game.espn_id}: {e}")
                     continue
             
+            if updated_games:
+                bump_version(self.db, GAMES)
             self.db.commit()
             
             return {
@@ -480,128 +517,149 @@ class GameService:
         """
         Sync actual game results (scores, final status) from ESPN scoreboard.
         This updates existing games with real scores and final status.
+        Matching games and results are prefetched in one query, diffed in
+        memory and written with bulk statements. Weather enrichment is not
+        done inline: the IDs of games that need it are returned as
+        `weather_pending` for the caller to queue.
         """
         try:
             url = f"{self.espn_base_url}/scoreboard"
-            response = requests.get(url)
-            response.raise_for_status()
+            data = http.fetch_json(url, cache="scoreboard")
             
-            data = response.json()
-            events = data.get('events', [])
+            scoreboard = {}
+            for event in data.get('events', []):
+                parsed = self._parse_scoreboard_event(event)
+                if parsed:
+                    scoreboard[parsed['espn_id']] = parsed
             
-            updated_games = 0
+            if not scoreboard:
+                return {
+                    "synced": True,
+                    "reason": "No scoreboard events to reconcile",
+                    "updated_games": 0,
+                    "games_with_scores": 0,
+                    "weather_pending": []
+                }
+            
+            # Prefetch every matching game with its result in a single IN-query
+            rows = self.db.execute(
+                select(
+                    Game.id, Game.espn_id, Game.game_date, Game.home_team, Game.away_team,
+                    Game.home_score, Game.away_score, Game.is_final, Game.game_result,
+                    Game.venue, Game.weather_temp,
+                    GameResult.id.label('result_id'),
+                    GameResult.home_score.label('result_home_score'),
+                    GameResult.away_score.label('result_away_score')
+                )
+                .outerjoin(GameResult, GameResult.game_id == Game.id)
+                .where(Game.espn_id.in_(list(scoreboard)))
+                .order_by(Game.id, GameResult.id)
+            ).all()
+            
+            game_updates = []
+            game_events = []
+            result_updates = []
+            result_inserts = []
+            weather_pending = []
+            standings = StandingsService(self.db)
+            newly_final = []
+            corrected_seasons = set()
             games_with_scores = 0
+            seen = set()
             
-            for event in events:
-                try:
-                    espn_id = event.get('id')
-                    if not espn_id:
-                        continue
-                    
-                    # Find our game by ESPN ID
-                    game = self.db.query(Game).filter(Game.espn_id == espn_id).first()
-                    if not game:
-                        continue
-                    
-                    # Get competition data
-                    competition = event.get('competitions', [{}])[0] if event.get('competitions') else {}
-                    
-                    # Extract scores
-                    home_score = None
-                    away_score = None
-                    is_final = False
-                    
-                    if competition.get('competitors'):
-                        for competitor in competition['competitors']:
-                            if competitor.get('homeAway') == 'home':
-                                score_val = competitor.get('score', {}).get('value')
-                                if score_val is not None:
-                                    home_score = int(score_val)
-                            elif competitor.get('homeAway') == 'away':
-                                score_val = competitor.get('score', {}).get('value')
-                                if score_val is not None:
-                                    away_score = int(score_val)
-                    
-                    # Check if game is final
-                    if competition.get('status', {}).get('type', {}).get('state') == 'post':
-                        is_final = True
+            for row in rows:
+                if row.id in seen:
+                    continue  # Extra GameResult rows for the same game
+                seen.add(row.id)
+                
+                live = scoreboard[row.espn_id]
+                home_score = live['home_score'] if live['home_score'] is not None else row.home_score
+                away_score = live['away_score'] if live['away_score'] is not None else row.away_score
+                is_final = live['is_final']
+                
+                # Calculate the result (W/L) for Dodgers games
+                calculated_result = None
+                if home_score is not None and away_score is not None and is_final:
+                    if row.home_team == 'Los Angeles Dodgers':
+                        calculated_result = 'W' if home_score > away_score else 'L'
+                    elif row.away_team == 'Los Angeles Dodgers':
+                        calculated_result = 'W' if away_score > home_score else 'L'
+                
+                if live['home_score'] is not None or live['away_score'] is not None:
+                    games_with_scores += 1
+                
+                values = {
+                    'home_score': home_score,
+                    'away_score': away_score,
+                    'is_final': is_final,
+                    'game_result': calculated_result
+                }
+                changes = {column: value for column, value in values.items() if getattr(row, column) != value}
+                if changes:
+                    game_updates.append(dict(values, id=row.id))
+                    game_events.append(dict(changes, game_id=row.id, espn_id=row.espn_id))
+                    print(f"Updated game {row.espn_id}: {row.away_team} @ {row.home_team} - {away_score}-{home_score} (Final: {is_final}) Result: {calculated_result}")
                     
-                    # Update game if we have new data
-                    if home_score is not None or away_score is not None or is_final != game.is_final:
-                        if home_score is not None:
-                            game.home_score = home_score
-                        if away_score is not None:
-                            game.away_score = away_score
-                        game.is_final = is_final
-                        
-                        # Calculate the result (W/L) for Dodgers games
-                        calculated_result = None
-                        if home_score is not None and away_score is not None and is_final:
-                            if game.home_team == 'Los Angeles Dodgers':
-                                calculated_result = 'W' if home_score > away_score else 'L'
-                            elif game.away_team == 'Los Angeles Dodgers':
-                                calculated_result = 'W' if away_score > home_score else 'L'
-                        
-                        # Store the calculated result
-                        game.game_result = calculated_result
-                        
-                        # Update or create game result
-                        game_result = self.db.query(GameResult).filter(
-                            GameResult.game_id == game.id
-                        ).first()
-                        
-                        if not game_result:
-                            game_result = GameResult(
-                                game_id=game.id,
-                                home_team=game.home_team,
-                                away_team=game.away_team,
-                                home_score=game.home_score or 0,
-                                away_score=game.away_score or 0,
-                                home_record_after=None,  # We'll calculate this later
-                                away_record_after=None
-                            )
-                            self.db.add(game_result)
-                        else:
-                            game_result.home_score = game.home_score or 0
-                            game_result.away_score = game.away_score or 0
-                        
-                        updated_games += 1
-                        
-                        if home_score is not None or away_score != None:
-                            games_with_scores += 1
-                            
-                        # Try to get weather data for this game
-                        if game.venue:
-                            try:
-                                weather_data = self.stadium_service.get_weather_for_game(
-                                    game.venue, 
-                                    game.game_date.strftime("%Y-%m-%d"),
-                                    game.game_time.strftime("%H:%M") if game.game_time else None
-                                )
-                                
-                                if weather_data:
-                                    game.weather_temp = weather_data['temperature']
-                                    game.weather_conditions = weather_data['conditions']
-                                    game.wind_speed = weather_data['wind_speed']
-                                    game.wind_direction = weather_data['wind_direction']
-                                    game.humidity = weather_data['humidity']
-                                    print(f"Added weather data for {game.venue}: {weather_data['temperature']}°F, {weather_data['conditions']}")
-                            except Exception as weather_err:
-                                print(f"Error getting weather for {game.venue}: {weather_err}")
-                        
-                        print(f"Updated game {espn_id}: {game.away_team} @ {game.home_team} - {away_score}-{home_score} (Final: {is_final}) Result: {calculated_result}")
+                    # Keep the materialized record current
+                    if is_final and home_score is not None and away_score is not None:
+                        if row.is_final:
+                            corrected_seasons.add(row.game_date.year)
+                        elif standings.claim_final_game(row.id):
+                            newly_final.append({
+                                'game_date': row.game_date,
+                                'home_team': row.home_team,
+                                'away_team': row.away_team,
+                                'home_score': home_score,
+                                'away_score': away_score
+                            })
+                    elif row.is_final:
+                        corrected_seasons.add(row.game_date.year)
                 
-                except Exception as e:
-                    print(f"Error updating game {event.get('id', 'unknown')}: {e}")
-                    continue
+                if row.result_id is None:
+                    result_inserts.append({
+                        'game_id': row.id,
+                        'home_team': row.home_team,
+                        'away_team': row.away_team,
+                        'home_score': home_score or 0,
+                        'away_score': away_score or 0,
+                        'home_record_after': None,  # We'll calculate this later
+                        'away_record_after': None
+                    })
+                elif (home_score or 0, away_score or 0) != (row.result_home_score, row.result_away_score):
+                    result_updates.append({
+                        'id': row.result_id,
+                        'home_score': home_score or 0,
+                        'away_score': away_score or 0
+                    })
+                
+                if is_final and row.venue and row.weather_temp is None:
+                    weather_pending.append(row.id)
+            
+            if game_updates:
+                self.db.execute(update(Game), game_updates)
+            if result_updates:
+                self.db.execute(update(GameResult), result_updates)
+            if result_inserts:
+                self.db.execute(insert(GameResult), result_inserts)
+            
+            for season in corrected_seasons:
+                standings.rebuild_record(DODGERS, season)
+            standings.apply_final_games(
+                [game for game in newly_final if game['game_date'].year not in corrected_seasons]
+            )
             
+            if game_updates or result_updates or result_inserts:
+                bump_version(self.db, GAMES)
             self.db.commit()
+            self._publish(game_events, standings, corrected_seasons | {game['game_date'].year for game in newly_final})
             
             return {
                 "synced": True,
-                "reason": f"Successfully updated {updated_games} games with results",
-                "updated_games": updated_games,
-                "games_with_scores": games_with_scores
+                "reason": f"Successfully updated {len(game_updates)} games with results",
+                "updated_games": len(game_updates),
+                "games_with_scores": games_with_scores,
+                "results_created": len(result_inserts),
+                "weather_pending": weather_pending
             }
             
         except Exception as e:
@@ -614,47 +672,192 @@ class GameService:
                 "games_with_scores": 0
             }
 
-    def sync_weather_for_existing_games(self) -> Dict[str, Any]:
+    def _publish(self, game_events: List[Dict[str, Any]], standings: StandingsService, seasons):
+        """
+        Publish committed changes for live clients: a GAME_UPDATE per changed
+        game and a RECORD_UPDATE per season whose record changed.
+        """
+        for game_event in game_events:
+            events.publish(GAME_UPDATE, game_event)
+        for season in sorted(seasons):
+            events.publish(RECORD_UPDATE, standings.to_dict(standings.get_record(DODGERS, season)))
+
+    def _parse_scoreboard_event(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Extract ESPN ID, scores and final status from a scoreboard event.
+        """
+        try:
+            espn_id = event.get('id')
+            if not espn_id:
+                return None
+            
+            # Get competition data
+            competition = event.get('competitions', [{}])[0] if event.get('competitions') else {}
+            
+            # Extract scores
+            home_score = None
+            away_score = None
+            
+            for competitor in competition.get('competitors', []):
+                score = competitor.get('score')
+                # Scoreboard scores are plain strings, schedule scores are objects
+                score_val = score.get('value') if isinstance(score, dict) else score
+                if score_val is None or score_val == '':
+                    continue
+                if competitor.get('homeAway') == 'home':
+                    home_score = int(float(score_val))
+                elif competitor.get('homeAway') == 'away':
+                    away_score = int(float(score_val))
+            
+            return {
+                'espn_id': espn_id,
+                'home_score': home_score,
+                'away_score': away_score,
+                'is_final': competition.get('status', {}).get('type', {}).get('state') == 'post'
+            }
+            
+        except Exception as e:
+            print(f"Error parsing scoreboard event {event.get('id', 'unknown')}: {e}")
+            return None
+
+    def sync_weather_for_existing_games(self, game_ids: Optional[List[int]] = None,
+                                        progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
         """
         Sync weather data for existing games that don't have weather information.
+        Pass `game_ids` to limit the run to specific games (e.g. those queued
+        by sync_game_results).
+        
+        Games are grouped by stadium-day so doubleheaders share one lookup.
+        Days already in the weather cache are served locally. The rest are
+        fetched by a worker pool under the WeatherAPI rate limit, and results
+        are committed in batches from this thread; `progress(done, total)` is
+        called with the stadium-day count after each batch.
         """
+        started = time.monotonic()
         try:
             # Get all games that don't have weather data but have venues
-            games_to_update = self.db.query(Game).filter(
+            query = self.db.query(Game).filter(
                 Game.venue.isnot(None),
                 Game.weather_temp.is_(None)
-            ).all()
-            
-            updated_games = 0
+            )
+            if game_ids is not None:
+                query = query.filter(Game.id.in_(game_ids))
+            games_to_update = query.all()
             
+            # Group games by stadium-day; games synced with a stadium_id skip name matching
+            groups: Dict[tuple, List[Game]] = {}
+            unresolved = 0
             for game in games_to_update:
-                try:
-                    weather_data = self.stadium_service.get_weather_for_game(
-                        game.venue,
+                stadium_id = game.stadium_id or self.stadium_service.resolve_stadium_id(game.venue)
+                if stadium_id is None:
+                    unresolved += 1
+                    continue
+                groups.setdefault((stadium_id, game.game_date), []).append(game)
+            
+            stadiums_by_id = {
+                stadium.id: stadium
+                for stadium in self.db.query(Stadium).filter(
+                    Stadium.id.in_({stadium_id for stadium_id, _ in groups})
+                )
+            }
+            
+            # Serve stadium-days already in the weather cache without any network
+            cached_days: Dict[tuple, List[Dict]] = {}
+            if groups:
+                observations = self.db.query(WeatherObservation).filter(
+                    WeatherObservation.stadium_id.in_({stadium_id for stadium_id, _ in groups}),
+                    WeatherObservation.obs_date.in_({day for _, day in groups})
+                ).order_by(WeatherObservation.hour).all()
+                for observation in observations:
+                    key = (observation.stadium_id, observation.obs_date)
+                    if key in groups:
+                        cached_days.setdefault(key, []).append(
+                            self.stadium_service._observation_to_hour(observation)
+                        )
+            
+            updated_games = 0
+            pending_commit = 0
+            pending_updates = 0
+            applied_days = 0
+            failures = []
+            
+            def commit_batch():
+                nonlocal pending_commit, pending_updates
+                if pending_updates:
+                    bump_version(self.db, GAMES)
+                self.db.commit()
+                pending_commit = 0
+                pending_updates = 0
+            
+            def apply(key: tuple, hourly: List[Dict]):
+                nonlocal updated_games, pending_commit, pending_updates, applied_days
+                for game in groups[key]:
+                    game_start = self.stadium_service.game_start_datetime(
                         game.game_date.strftime("%Y-%m-%d"),
                         game.game_time.strftime("%H:%M") if game.game_time else None
                     )
-                    
+                    weather_data = self.stadium_service.summarize_game_weather(hourly, game_start)
                     if weather_data:
                         game.weather_temp = weather_data['temperature']
                         game.weather_conditions = weather_data['conditions']
                         game.wind_speed = weather_data['wind_speed']
                         game.wind_direction = weather_data['wind_direction']
                         game.humidity = weather_data['humidity']
-                        
                         updated_games += 1
-                        print(f"Added weather for {game.venue} on {game.game_date}: {weather_data['temperature']}°F, {weather_data['conditions']}")
-                
-                except Exception as e:
-                    print(f"Error getting weather for game {game.espn_id}: {e}")
-                    continue
+                        pending_updates += 1
+                pending_commit += 1
+                applied_days += 1
+                if pending_commit >= settings.WEATHER_BACKFILL_BATCH_SIZE:
+                    commit_batch()
+                    if progress:
+                        progress(applied_days, len(groups))
+            
+            for key, hourly in cached_days.items():
+                apply(key, hourly)
+            
+            # Fetch the remaining stadium-days concurrently; DB writes stay on this thread
+            to_fetch = [key for key in groups if key not in cached_days]
+            if to_fetch:
+                with ThreadPoolExecutor(max_workers=settings.WEATHER_BACKFILL_WORKERS) as executor:
+                    futures = {
+                        executor.submit(
+                            self.stadium_service.fetch_weather_day,
+                            stadiums_by_id[stadium_id].coordinates,
+                            day
+                        ): (stadium_id, day)
+                        for stadium_id, day in to_fetch
+                    }
+                    for future in as_completed(futures):
+                        stadium_id, day = futures[future]
+                        try:
+                            hourly = future.result()
+                        except Exception as e:
+                            failures.append({
+                                "stadium": stadiums_by_id[stadium_id].name,
+                                "date": day.isoformat(),
+                                "error": str(e)
+                            })
+                            continue
+                        if hourly and day < date.today():
+                            self.stadium_service.store_weather_day(stadium_id, day, hourly)
+                        apply((stadium_id, day), hourly)
             
-            self.db.commit()
+            commit_batch()
+            
+            elapsed = time.monotonic() - started
+            print(f"Weather backfill: {updated_games} games, {len(groups)} stadium-days ({len(to_fetch)} fetched) in {elapsed:.1f}s, {len(failures)} failures")
             
             return {
                 "synced": True,
                 "reason": f"Successfully added weather for {updated_games} games",
-                "updated_games": updated_games
+                "updated_games": updated_games,
+                "stadium_days": len(groups),
+                "cache_hits": len(cached_days),
+                "fetched": len(to_fetch) - len(failures),
+                "unresolved_venues": unresolved,
+                "failures": failures,
+                "elapsed_seconds": round(elapsed, 2),
+                "games_per_second": round(updated_games / elapsed, 1) if elapsed > 0 else None
             }
             
         except Exception as e:
@@ -0,0 +1,265 @@
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import insert, or_, update
+from sqlalchemy.orm import Session
+
+from ..core import http
+from ..core.config import settings
+from ..core.events import events, GAME_UPDATE, RECORD_UPDATE
+from ..db.database import SessionLocal
+from ..db.models import Game, GameResult
+from ..db.data_versions import bump_version, GAMES
+from .game_service import GameService
+from .standings_service import StandingsService, DODGERS
+
+# ESPN statuses that pause a game; postponed/suspended games end up in state
+# "post" without being completed and are no longer followed
+DELAYED_STATUSES = {'STATUS_DELAYED', 'STATUS_RAIN_DELAY'}
+
+# Start polling this long before first pitch
+PREGAME_LEAD = timedelta(minutes=10)
+
+
+class LiveGameService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.espn_base_url = settings.ESPN_BASE_URL
+
+    def find_live_game(self, today: Optional[date] = None) -> Optional[Game]:
+        """
+        The Dodgers game to follow: the earliest game from today (or a late
+        game from last night) that hasn't finished or been called off.
+        """
+        today = today or date.today()
+        return self.db.query(Game).filter(
+            or_(Game.home_team == DODGERS, Game.away_team == DODGERS),
+            Game.game_date.in_([today - timedelta(days=1), today]),
+            Game.is_final.isnot(True),
+            or_(Game.game_state.is_(None), Game.game_state != 'post')
+        ).order_by(Game.game_date, Game.game_time, Game.id).first()
+
+    def poll_game(self, game: Game) -> Dict[str, Any]:
+        """
+        Fetch one game's summary and store it if anything changed.
+
+        Only changed columns are written, and each change is published as a
+        GAME_UPDATE event (plus RECORD_UPDATE when the game goes final).
+        Returns what changed and how long to wait before the next poll.
+        """
+        data = http.fetch_json(f"{self.espn_base_url}/summary", params={"event": game.espn_id}, cache="summary")
+        live = self.parse_summary(data)
+        if not live:
+            return {
+                "synced": False,
+                "reason": f"No status in summary for {game.espn_id}",
+                "next_poll_seconds": settings.LIVE_POLL_IDLE_SECONDS
+            }
+
+        values = {
+            'home_score': live['home_score'] if live['home_score'] is not None else game.home_score,
+            'away_score': live['away_score'] if live['away_score'] is not None else game.away_score,
+            'is_final': live['is_final'],
+            'game_state': live['state'],
+            'inning': live['inning'],
+            'status_detail': live['detail'],
+            'game_result': game.game_result,
+        }
+        if values['is_final'] and values['home_score'] is not None and values['away_score'] is not None:
+            values['game_result'] = self._dodgers_result(game, values['home_score'], values['away_score'])
+
+        changes = {column: value for column, value in values.items() if getattr(game, column) != value}
+        went_final = bool(changes.get('is_final'))
+
+        record = None
+        if changes:
+            try:
+                if went_final and not StandingsService(self.db).claim_final_game(game.id):
+                    went_final = False  # The results sync already counted it
+                self.db.execute(update(Game), [dict(changes, id=game.id)])
+                if went_final:
+                    record = self._finalize(game, values['home_score'], values['away_score'])
+                bump_version(self.db, GAMES)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+            self.db.refresh(game)
+
+            events.publish(GAME_UPDATE, dict(changes, game_id=game.id, espn_id=game.espn_id))
+            if record:
+                events.publish(RECORD_UPDATE, record)
+            print(f"Live update {game.espn_id}: {changes}")
+
+        return {
+            "synced": True,
+            "espn_id": game.espn_id,
+            "state": live['state'],
+            "detail": live['detail'],
+            "changed": sorted(changes),
+            "next_poll_seconds": self.next_poll_seconds(live)
+        }
+
+    def parse_summary(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Extract scores, state and inning from a /summary response.
+        """
+        competitions = data.get('header', {}).get('competitions') or []
+        if not competitions:
+            return None
+        competition = competitions[0]
+        status = competition.get('status', {})
+        status_type = status.get('type', {})
+        if not status_type.get('state'):
+            return None
+
+        scores = {}
+        # Pre-game summaries report 0-0; don't store that as a score
+        competitors = competition.get('competitors', []) if status_type['state'] != 'pre' else []
+        for competitor in competitors:
+            score = competitor.get('score')
+            score = score.get('value') if isinstance(score, dict) else score
+            if score not in (None, ''):
+                scores[competitor.get('homeAway')] = int(float(score))
+
+        detail = status_type.get('shortDetail') or status_type.get('detail')
+        half = detail.split()[0].lower() if detail and status_type['state'] == 'in' else None
+
+        start_time = None
+        if competition.get('date'):
+            try:
+                start_time = datetime.fromisoformat(competition['date'].replace('Z', '+00:00'))
+            except ValueError:
+                pass
+
+        return {
+            'state': status_type['state'],
+            'status_name': status_type.get('name'),
+            'is_final': bool(status_type.get('completed')) and status_type['state'] == 'post',
+            'detail': detail,
+            'inning': status.get('period') or None,
+            'half': half,  # top, bottom, mid, end
+            'home_score': scores.get('home'),
+            'away_score': scores.get('away'),
+            'start_time': start_time,
+        }
+
+    @staticmethod
+    def next_poll_seconds(live: Dict[str, Any], now: Optional[datetime] = None) -> float:
+        """
+        Poll fast while an inning is being played, slower between innings and
+        during delays; before first pitch sleep until shortly before it.
+        """
+        if live['status_name'] in DELAYED_STATUSES:
+            return settings.LIVE_POLL_DELAY_SECONDS
+        if live['state'] == 'in':
+            if live['half'] in ('mid', 'end'):
+                return settings.LIVE_POLL_BREAK_SECONDS
+            return settings.LIVE_POLL_PLAY_SECONDS
+        if live['state'] == 'pre':
+            if live['start_time']:
+                now = now or datetime.now(timezone.utc)
+                until_lead = (live['start_time'] - PREGAME_LEAD - now).total_seconds()
+                if until_lead > settings.LIVE_POLL_PREGAME_SECONDS:
+                    return min(until_lead, settings.LIVE_POLL_IDLE_SECONDS)
+            return settings.LIVE_POLL_PREGAME_SECONDS
+        return settings.LIVE_POLL_IDLE_SECONDS
+
+    def _dodgers_result(self, game: Game, home_score: int, away_score: int) -> Optional[str]:
+        if game.home_team == DODGERS:
+            return 'W' if home_score > away_score else 'L'
+        if game.away_team == DODGERS:
+            return 'W' if away_score > home_score else 'L'
+        return None
+
+    def _finalize(self, game: Game, home_score: int, away_score: int) -> Optional[Dict[str, Any]]:
+        """
+        Store the final result and fold it into the season record (no commit).
+        Returns the updated record for publishing.
+        """
+        result = self.db.query(GameResult).filter(GameResult.game_id == game.id).first()
+        if result is None:
+            self.db.execute(insert(GameResult), [{
+                'game_id': game.id,
+                'home_team': game.home_team,
+                'away_team': game.away_team,
+                'home_score': home_score,
+                'away_score': away_score
+            }])
+        else:
+            result.home_score, result.away_score = home_score, away_score
+
+        standings = StandingsService(self.db)
+        standings.apply_final_games([{
+            'game_date': game.game_date,
+            'home_team': game.home_team,
+            'away_team': game.away_team,
+            'home_score': home_score,
+            'away_score': away_score
+        }])
+        return standings.to_dict(standings.get_record(season=game.game_date.year))
+
+
+class LiveGamePoller:
+    """
+    Background thread that follows the current Dodgers game.
+    With no game on it checks again every LIVE_POLL_IDLE_SECONDS.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.last_poll: Optional[Dict[str, Any]] = None
+        self.next_poll_at: Optional[datetime] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="live-game-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def poll_once(self) -> float:
+        """
+        Poll the live game (if any) once; returns seconds until the next poll.
+        """
+        db = self.session_factory()
+        try:
+            service = LiveGameService(db)
+            game = service.find_live_game()
+            if game is None:
+                self.last_poll = {"synced": True, "espn_id": None, "next_poll_seconds": settings.LIVE_POLL_IDLE_SECONDS}
+            else:
+                self.last_poll = service.poll_game(game)
+                if self.last_poll.get("changed") and game.is_final and game.venue and game.weather_temp is None:
+                    GameService(db).sync_weather_for_existing_games(game_ids=[game.id])
+        except Exception as e:
+            print(f"Error polling live game: {e}")
+            self.last_poll = {"synced": False, "reason": str(e), "next_poll_seconds": settings.LIVE_POLL_BREAK_SECONDS}
+        finally:
+            db.close()
+        return self.last_poll["next_poll_seconds"]
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "last_poll": self.last_poll,
+            "next_poll_at": self.next_poll_at.isoformat() if self.next_poll_at else None,
+        }
+
+    def _run(self):
+        while not self._stop.is_set():
+            interval = self.poll_once()
+            self.next_poll_at = datetime.now() + timedelta(seconds=interval)
+            self._stop.wait(interval)
+
+
+live_game_poller = LiveGamePoller()
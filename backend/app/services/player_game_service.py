@@ -1,58 +1,111 @@
-import requests
-from bs4 import BeautifulSoup
 import re
-from datetime import datetime
-from typing import List, Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
-from ..db.models.players import Player
+from ..db.models.players import Player, PlayerPosition
 from ..db.models.games import Game, PlayerGameStats
+from ..db.models.jobs import GameLogCheckpoint
+from ..db.upsert import upsert_rows
+from ..core import http
+from ..core.config import settings
+from ..core.rate_limit import TokenBucket
+from .player_registry import player_registry
+from .standings_service import DODGERS
+
+# Shared by all game-log workers so a roster backfill stays polite to espn.com
+espn_web_limiter = TokenBucket(settings.ESPN_WEB_RATE_LIMIT)
+
+# Primary positions whose game logs are pitching lines, which the batting
+# parser can't read; their lines come from the box scores instead
+PITCHER_POSITIONS = ('SP', 'RP', 'P')
+
+# ESPN abbreviations as shown in game logs -> team names as stored on games
+TEAM_ABBREVIATIONS = {
+    "ARI": "Arizona Diamondbacks", "ATL": "Atlanta Braves", "BAL": "Baltimore Orioles",
+    "BOS": "Boston Red Sox", "CHC": "Chicago Cubs", "CHW": "Chicago White Sox",
+    "CIN": "Cincinnati Reds", "CLE": "Cleveland Guardians", "COL": "Colorado Rockies",
+    "DET": "Detroit Tigers", "HOU": "Houston Astros", "KC": "Kansas City Royals",
+    "LAA": "Los Angeles Angels", "LAD": "Los Angeles Dodgers", "MIA": "Miami Marlins",
+    "MIL": "Milwaukee Brewers", "MIN": "Minnesota Twins", "NYM": "New York Mets",
+    "NYY": "New York Yankees", "ATH": "Athletics", "PHI": "Philadelphia Phillies",
+    "PIT": "Pittsburgh Pirates", "SD": "San Diego Padres", "SF": "San Francisco Giants",
+    "SEA": "Seattle Mariners", "STL": "St. Louis Cardinals", "TB": "Tampa Bay Rays",
+    "TEX": "Texas Rangers", "TOR": "Toronto Blue Jays", "WSH": "Washington Nationals",
+}
+ABBREVIATION_ALIASES = {"OAK": "ATH", "CWS": "CHW", "WAS": "WSH", "AZ": "ARI"}
+TEAM_NAME_ABBREVIATIONS = {name: abbreviation for abbreviation, name in TEAM_ABBREVIATIONS.items()}
+TEAM_NAME_ABBREVIATIONS["Oakland Athletics"] = "ATH"
+
+ISO_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# _parse_game_row fields stored on PlayerGameStats (the rate stats are season-to-date)
+GAME_LOG_COLUMNS = [
+    'at_bats', 'runs', 'hits', 'doubles', 'triples', 'home_runs', 'rbis',
+    'walks', 'hit_by_pitch', 'strikeouts', 'stolen_bases', 'caught_stealing',
+]
+
+ProgressCallback = Callable[[int, int], None]
+
 
 class PlayerGameService:
     def __init__(self, db: Session):
         self.db = db
         self.base_url = "https://www.espn.com/mlb/player/gamelog/_/id"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self._season: Optional[int] = None
+
+    @property
+    def season(self) -> int:
+        """
+        Season of the latest Dodgers game on the schedule. Game logs show the
+        current season and their dates have no year.
+        """
+        if self._season is None:
+            latest = self.db.query(func.max(Game.game_date)).filter(
+                or_(Game.home_team == DODGERS, Game.away_team == DODGERS)
+            ).scalar()
+            self._season = latest.year if latest else date.today().year
+        return self._season
 
     def get_player_espn_id(self, player_name: str) -> Optional[str]:
-        """Get ESPN player ID from player name"""
-        # This would need to be implemented based on how we map our players to ESPN IDs
-        # For now, we'll use a simple mapping approach
-        espn_id_mapping = {
-            'Freddie Freeman': '30193',
-            'Mookie Betts': '34081',
-            'Shohei Ohtani': '39832',
-            # Add more mappings as needed
-        }
-        return espn_id_mapping.get(player_name)
+        """Get ESPN player ID from player name (via the player registry)"""
+        return player_registry.resolve(self.db, [player_name])[player_name]
 
-    def scrape_player_game_log(self, espn_id: str, player_name: str) -> List[Dict]:
-        """Scrape player game log data from ESPN"""
-        try:
-            url = f"https://www.espn.com/mlb/player/gamelog/_/id/{espn_id}/{player_name.lower().replace(' ', '-')}"
-            response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find the game log table
-            game_log_table = soup.find('table', {'class': 'Table'})
-            if not game_log_table:
-                print(f"Game log table not found for {player_name}")
-                return []
-            
-            games = []
-            rows = game_log_table.find_all('tr')[1:]  # Skip header row
-            
-            for row in rows:
+    def game_log_url(self, espn_id: str, player_name: str) -> str:
+        return f"{self.base_url}/{espn_id}/{player_registry.slug(self.db, espn_id, player_name)}"
+
+    def fetch_game_log(self, url: str) -> List[Dict]:
+        """
+        Fetch and parse one game log page. Does no database work, so it is
+        safe to call from worker threads; errors are raised to the caller.
+        """
+        html = http.fetch_text(url, headers=http.BROWSER_HEADERS, cache="gamelog", limiter=espn_web_limiter)
+        return self.parse_game_log_html(html)
+
+    def parse_game_log_html(self, html: str) -> List[Dict]:
+        """
+        Game rows from every monthly table of a game log page, newest first.
+        Monthly total rows and pitcher logs (fewer columns) are skipped.
+        """
+        from bs4 import BeautifulSoup, SoupStrainer  # Only game-log scraping needs the parser
+        soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('table'))
+
+        games = []
+        for table in soup.find_all('table', {'class': 'Table'}):
+            for row in table.find_all('tr'):
                 cells = row.find_all('td')
                 if len(cells) >= 19:  # Ensure we have all columns
                     game_data = self._parse_game_row(cells)
-                    if game_data:
+                    if game_data and ISO_DATE_PATTERN.match(game_data['game_date']):
                         games.append(game_data)
-            
+        return games
+
+    def scrape_player_game_log(self, espn_id: str, player_name: str) -> List[Dict]:
+        """Scrape player game log data from ESPN"""
+        try:
+            games = self.fetch_game_log(self.game_log_url(espn_id, player_name))
             print(f"Scraped {len(games)} games for {player_name}")
             return games
             
@@ -109,7 +162,7 @@ class PlayerGameService:
         """Parse ESPN date format (e.g., 'Sat 8/30') to ISO format"""
         try:
             # ESPN format: "Sat 8/30" -> convert to 2025-08-30
-            current_year = 2025
+            current_year = self.season
             date_match = re.search(r'(\w+)\s+(\d+)/(\d+)', date_text)
             if date_match:
                 month = int(date_match.group(2))
@@ -122,13 +175,11 @@ class PlayerGameService:
     def _parse_opponent(self, opp_text: str) -> tuple:
         """Parse opponent text to get team abbreviation and home/away"""
         try:
-            # ESPN format: "vs ARI", "@ SD", etc.
-            if opp_text.startswith('vs '):
-                return opp_text[3:], True  # Home game
-            elif opp_text.startswith('@'):
-                return opp_text[1:], False  # Away game
-            else:
-                return opp_text, True  # Default to home
+            # ESPN format: "vs ARI", "@ SD", etc. (or "vsARI" with the cell's spans joined)
+            match = re.match(r'^(vs|@)\s*(\S+)$', opp_text)
+            if match:
+                return match.group(2), match.group(1) == 'vs'
+            return opp_text, True  # Default to home
         except:
             return opp_text, True
 
@@ -159,8 +210,190 @@ class PlayerGameService:
         except:
             return 0.0
 
+    def _final_games(self) -> List[Game]:
+        """Final Dodgers games of the season, oldest first"""
+        return self.db.query(Game).filter(
+            or_(Game.home_team == DODGERS, Game.away_team == DODGERS),
+            Game.is_final.is_(True),
+            Game.game_date >= date(self.season, 1, 1),
+            Game.game_date <= date(self.season, 12, 31)
+        ).order_by(Game.game_date, Game.game_time, Game.espn_id).all()
+
+    def _games_by_date(self, games: List[Game]) -> Dict[date, List[Tuple[Optional[str], int]]]:
+        """(opponent abbreviation, game ID) per date, in start order"""
+        by_date: Dict[date, List[Tuple[Optional[str], int]]] = {}
+        for game in games:
+            opponent = game.away_team if game.home_team == DODGERS else game.home_team
+            by_date.setdefault(game.game_date, []).append((TEAM_NAME_ABBREVIATIONS.get(opponent), game.id))
+        return by_date
+
+    def _match_games(self, rows: List[Dict], by_date: Dict[date, List[Tuple[Optional[str], int]]]) -> List[Tuple[int, Dict]]:
+        """
+        Pair game-log rows with games by date and opponent. Rows are walked
+        oldest first so the two rows of a doubleheader take its games in order.
+        """
+        matched = []
+        taken = set()
+        for row in reversed(rows):
+            day = date.fromisoformat(row['game_date'])
+            candidates = [game_id for _, game_id in by_date.get(day, []) if game_id not in taken]
+            opponent = ABBREVIATION_ALIASES.get(row['opponent'], row['opponent'])
+            same_opponent = [game_id for abbreviation, game_id in by_date.get(day, [])
+                             if abbreviation == opponent and game_id not in taken]
+            if same_opponent:
+                game_id = same_opponent[0]
+            elif len(candidates) == 1 and opponent not in TEAM_ABBREVIATIONS:
+                game_id = candidates[0]  # Unknown abbreviation, but only one game that day
+            else:
+                continue
+            taken.add(game_id)
+            matched.append((game_id, row))
+        return matched
+
+    def _store_game_log(self, player_id: int, rows: List[Dict], games: List[Game], force: bool = False) -> int:
+        """
+        Upsert a player's game-log rows for the final `games` they don't have
+        a line for yet (all of them with `force`) and checkpoint the player.
+        Does not commit. Returns the number of rows written.
+
+        Nothing is checkpointed when no row matches a game (e.g. an empty or
+        changed page), so the player is fetched again next run.
+        """
+        matched = self._match_games(rows, self._games_by_date(games))
+        if not matched:
+            return 0
+        last_matched = max(date.fromisoformat(row['game_date']) for _, row in matched)
+
+        if not force:
+            stored = set(self.db.execute(
+                select(PlayerGameStats.game_id).where(
+                    PlayerGameStats.player_id == player_id,
+                    PlayerGameStats.game_id.in_([game_id for game_id, _ in matched])
+                )
+            ).scalars())
+            matched = [(game_id, row) for game_id, row in matched if game_id not in stored]
+        stats = [
+            {'player_id': player_id, 'game_id': game_id, **{column: row[column] for column in GAME_LOG_COLUMNS}}
+            for game_id, row in matched
+        ]
+        # Only the game-log columns are overwritten; box-score fields are kept
+        upsert_rows(self.db, PlayerGameStats, stats, ['player_id', 'game_id'], GAME_LOG_COLUMNS)
+
+        upsert_rows(
+            self.db, GameLogCheckpoint,
+            [{'player_id': player_id, 'season': self.season, 'synced_through': last_matched, 'games': len(games)}],
+            ['player_id', 'season'], ['synced_through', 'games']
+        )
+        return len(stats)
+
+    def ingest_game_logs(self, player_ids: Optional[List[int]] = None, force: bool = False,
+                         progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+        """
+        Store the season game logs of the roster (or of `player_ids`) in
+        PlayerGameStats.
+
+        Pages are fetched concurrently (GAME_LOG_WORKERS, rate limited by
+        espn_web_limiter); DB writes stay on this thread and commit once per
+        player together with the player's checkpoint. Players checkpointed
+        since the last game went final are skipped, so an interrupted run
+        picks up where it stopped; `force` refetches everyone. Pitchers are
+        not fetched and are listed under skipped_pitchers.
+        """
+        started = time.monotonic()
+        try:
+            games = self._final_games()
+            if not games:
+                return {"synced": False, "reason": "No final games to match game logs against", "stored": 0}
+            synced_through = games[-1].game_date
+
+            query = self.db.query(Player)
+            if player_ids is not None:
+                query = query.filter(Player.id.in_(player_ids))
+            else:
+                query = query.filter(or_(Player.status.is_(None), Player.status != 'Inactive'))
+            players = query.order_by(Player.id).all()
+            pitchers = set(self.db.execute(
+                select(PlayerPosition.player_id).where(
+                    PlayerPosition.player_id.in_([player.id for player in players]),
+                    PlayerPosition.is_primary.is_(True),
+                    PlayerPosition.position.in_(PITCHER_POSITIONS)
+                )
+            ).scalars())
+            skipped_pitchers = [player.name for player in players if player.id in pitchers]
+            players = [player for player in players if player.id not in pitchers]
+
+            # Final games each player was last synced against; a doubleheader's
+            # second game or a resumed suspended game raises the count
+            checkpoints = {
+                player_id: final_games for player_id, final_games in self.db.execute(
+                    select(GameLogCheckpoint.player_id, GameLogCheckpoint.games)
+                    .where(GameLogCheckpoint.season == self.season)
+                )
+            }
+            resolved = player_registry.resolve(self.db, [player.name for player in players if not player.espn_id])
+
+            to_fetch = []
+            unresolved = []
+            up_to_date = 0
+            for player in players:
+                espn_id = player.espn_id or resolved.get(player.name)
+                if not espn_id:
+                    unresolved.append(player.name)
+                elif not force and (checkpoints.get(player.id) or 0) >= len(games):
+                    up_to_date += 1
+                else:
+                    to_fetch.append((player.id, player.name, self.game_log_url(espn_id, player.name)))
+
+            stored = 0
+            done = 0
+            failures = []
+            if to_fetch:
+                with ThreadPoolExecutor(max_workers=settings.GAME_LOG_WORKERS) as executor:
+                    futures = {
+                        executor.submit(self.fetch_game_log, url): (player_id, name)
+                        for player_id, name, url in to_fetch
+                    }
+                    for future in as_completed(futures):
+                        player_id, name = futures[future]
+                        done += 1
+                        try:
+                            rows = future.result()
+                            stored += self._store_game_log(player_id, rows, games, force=force)
+                            self.db.commit()
+                        except Exception as e:
+                            self.db.rollback()
+                            failures.append({"player": name, "error": str(e)})
+                        if progress:
+                            progress(done, len(to_fetch))
+
+            elapsed = time.monotonic() - started
+            print(f"Game logs: {stored} stat lines from {len(to_fetch)} players in {elapsed:.1f}s, "
+                  f"{up_to_date} up to date, {len(skipped_pitchers)} pitchers skipped, {len(failures)} failures")
+
+            return {
+                "synced": True,
+                "reason": f"Stored {stored} game-log lines for {len(to_fetch) - len(failures)} players",
+                "stored": stored,
+                "players_fetched": len(to_fetch) - len(failures),
+                "players_up_to_date": up_to_date,
+                "synced_through": synced_through.isoformat(),
+                "unresolved_players": unresolved,
+                "skipped_pitchers": skipped_pitchers,
+                "failures": failures,
+                "elapsed_seconds": round(elapsed, 2)
+            }
+
+        except Exception as e:
+            self.db.rollback()
+            print(f"Error ingesting game logs: {e}")
+            return {
+                "synced": False,
+                "reason": f"Error: {str(e)}",
+                "stored": 0
+            }
+
     def sync_player_season_stats(self, player_id: int) -> Dict:
-        """Sync complete season stats for a player"""
+        """Scrape a player's season game log and store it"""
         try:
             # Get player from database
             player = self.db.query(Player).filter(Player.id == player_id).first()
@@ -168,7 +401,7 @@ class PlayerGameService:
                 return {"error": "Player not found"}
             
             # Get ESPN ID for player
-            espn_id = self.get_player_espn_id(player.name)
+            espn_id = player.espn_id or self.get_player_espn_id(player.name)
             if not espn_id:
                 return {"error": f"ESPN ID not found for {player.name}"}
             
@@ -177,16 +410,22 @@ class PlayerGameService:
             if not games:
                 return {"error": f"No games found for {player.name}"}
             
-            # Store games in database (this would need PlayerGameStats model)
-            # For now, return the scraped data
+            final_games = self._final_games()
+            stored = 0
+            if final_games:
+                stored = self._store_game_log(player.id, games, final_games)
+                self.db.commit()
+            
             return {
                 "success": True,
                 "player_name": player.name,
                 "games_scraped": len(games),
+                "games_stored": stored,
                 "games": games[:10]  # Return first 10 for preview
             }
             
         except Exception as e:
+            self.db.rollback()
             return {"error": f"Failed to sync player stats: {str(e)}"}
 
     def get_player_season_summary(self, player_id: int) -> Dict:
@@ -0,0 +1,126 @@
+import re
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..db.models import Player, PlayerIdentity
+from ..db.upsert import upsert_rows
+
+# Other workers may record identities; reload at least this often
+REFRESH_SECONDS = 300
+
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv"}
+
+
+def normalize_player_name(name: str) -> str:
+    """
+    Normalize a player name for lookups: no accents, case, periods or suffixes
+    ("José Ramírez Jr." -> "jose ramirez").
+    """
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    name = re.sub(r"[^a-z0-9 '-]+", " ", name.lower().replace(".", ""))
+    words = [word for word in name.split() if word not in NAME_SUFFIXES]
+    return " ".join(words)
+
+
+def slugify(name: str) -> str:
+    return normalize_player_name(name).replace("'", "").replace(" ", "-")
+
+
+class PlayerRegistry:
+    """
+    In-memory player name -> ESPN ID index.
+
+    Built from player_identities (every athlete seen on a roster page) and
+    players.espn_id; current players win over older identities with the same
+    name. Loaded on first use and reloaded after `invalidate()` or
+    REFRESH_SECONDS, so resolving a whole roster is a few dict lookups.
+    """
+
+    def __init__(self):
+        self._by_name: Dict[str, str] = {}
+        self._slugs: Dict[str, str] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def load(self, db: Session):
+        """
+        (Re)build the index from the identity and player tables.
+        """
+        by_name: Dict[str, str] = {}
+        slugs: Dict[str, str] = {}
+        identities = db.execute(
+            select(PlayerIdentity.espn_id, PlayerIdentity.name, PlayerIdentity.slug)
+            .order_by(PlayerIdentity.updated_at, PlayerIdentity.espn_id)
+        )
+        for espn_id, name, slug in identities:
+            by_name[normalize_player_name(name)] = espn_id
+            if slug:
+                slugs[espn_id] = slug
+        for espn_id, name in db.execute(select(Player.espn_id, Player.name).where(Player.espn_id.isnot(None))):
+            by_name[normalize_player_name(name)] = espn_id
+
+        with self._lock:
+            self._by_name = by_name
+            self._slugs = slugs
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        """
+        Force a reload on the next lookup (call after identities change).
+        """
+        with self._lock:
+            self._loaded_at = None
+
+    def _ensure_loaded(self, db: Session):
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > REFRESH_SECONDS:
+            self.load(db)
+
+    def resolve(self, db: Session, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Resolve player names to ESPN IDs in one pass (None if unknown).
+        """
+        self._ensure_loaded(db)
+        by_name = self._by_name
+        return {name: by_name.get(normalize_player_name(name)) for name in names}
+
+    def slug(self, db: Session, espn_id: str, name: str) -> str:
+        """
+        URL slug for a player's ESPN pages, as linked from the roster page.
+        """
+        self._ensure_loaded(db)
+        return self._slugs.get(espn_id) or slugify(name)
+
+    def record(self, db: Session, players: List[Dict[str, Any]]) -> int:
+        """
+        Store the identities of players parsed from a roster page
+        (`espn_id`, `name`, `espn_slug`); only new or changed ones are
+        written. Does not commit; call `invalidate()` after committing.
+        Returns the number of rows written.
+        """
+        incoming: Dict[str, Tuple[str, Optional[str]]] = {
+            player['espn_id']: (player['name'], player.get('espn_slug'))
+            for player in players if player.get('espn_id')
+        }
+        if not incoming:
+            return 0
+
+        existing = {
+            espn_id: (name, slug) for espn_id, name, slug in db.execute(
+                select(PlayerIdentity.espn_id, PlayerIdentity.name, PlayerIdentity.slug)
+                .where(PlayerIdentity.espn_id.in_(list(incoming)))
+            )
+        }
+        rows = [
+            {'espn_id': espn_id, 'name': name, 'slug': slug}
+            for espn_id, (name, slug) in incoming.items()
+            if existing.get(espn_id) != (name, slug)
+        ]
+        return upsert_rows(db, PlayerIdentity, rows, ['espn_id'], ['name', 'slug'])
+
+
+player_registry = PlayerRegistry()
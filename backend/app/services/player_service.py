@@ -1,13 +1,23 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, delete, func, insert, or_, update
 from typing import List, Optional
-from datetime import date
-import requests
-from bs4 import BeautifulSoup
-import re
+from datetime import date, datetime, timedelta
 
-from ..db.models import Player, PlayerPosition
+from ..db.models import JobRun, Player, PlayerPosition
+from ..db.data_versions import bump_version, ROSTER
 from ..db.schemas import PlayerCreate, PlayerUpdate
+from ..core import http
+from .roster_parser import parse_roster_html
+from .player_registry import player_registry
+
+# Player columns owned by the roster sync; status is only set for new and returning players
+ROSTER_COLUMNS = ['name', 'uniform_number', 'team', 'bats', 'throws', 'height', 'weight']
+
+# Status of players who are no longer on the ESPN roster
+INACTIVE = 'Inactive'
+
+# Minimum time between roster syncs
+ROSTER_SYNC_INTERVAL = timedelta(hours=24)
 
 class PlayerService:
     def __init__(self, db: Session):
@@ -17,13 +27,17 @@ class PlayerService:
         """
         Get all players with optional filtering by position and status.
         """
-        query = self.db.query(Player)
+        # Positions are serialized with every player; load them in one extra query
+        query = self.db.query(Player).options(selectinload(Player.positions))
         
         if position:
-            query = query.filter(Player.position == position)
+            query = query.filter(Player.positions.any(PlayerPosition.position == position))
         
         if status:
             query = query.filter(Player.status == status)
+        else:
+            # Players who left the roster are kept (for their stats) but not listed
+            query = query.filter(or_(Player.status.is_(None), Player.status != INACTIVE))
         
         return query.order_by(Player.uniform_number, Player.name).all()
     
@@ -31,7 +45,7 @@ class PlayerService:
         """
         Get a player by their ID.
         """
-        return self.db.query(Player).filter(Player.id == player_id).first()
+        return self.db.query(Player).options(selectinload(Player.positions)).filter(Player.id == player_id).first()
     
     def get_player_by_name(self, name: str) -> Optional[Player]:
         """
@@ -62,6 +76,7 @@ class PlayerService:
             )
             self.db.add(position)
         
+        bump_version(self.db, ROSTER)
         self.db.commit()
         self.db.refresh(db_player)
         return db_player
@@ -78,6 +93,7 @@ class PlayerService:
         for field, value in update_data.items():
             setattr(db_player, field, value)
         
+        bump_version(self.db, ROSTER)
         self.db.commit()
         self.db.refresh(db_player)
         return db_player
@@ -91,6 +107,7 @@ class PlayerService:
             return False
         
         self.db.delete(db_player)
+        bump_version(self.db, ROSTER)
         self.db.commit()
         return True
     
@@ -98,13 +115,17 @@ class PlayerService:
         """
         Get all players at a specific position.
         """
-        return self.db.query(Player).filter(Player.position == position).order_by(Player.uniform_number).all()
+        return self.db.query(Player).options(selectinload(Player.positions)).filter(
+            Player.positions.any(PlayerPosition.position == position)
+        ).order_by(Player.uniform_number).all()
     
     def get_active_players(self) -> List[Player]:
         """
         Get all active players.
         """
-        return self.db.query(Player).filter(Player.status == "Active").order_by(Player.uniform_number, Player.name).all()
+        return self.db.query(Player).options(selectinload(Player.positions)).filter(
+            Player.status == "Active"
+        ).order_by(Player.uniform_number, Player.name).all()
     
     def search_players(self, search_term: str) -> List[Player]:
         """
@@ -114,11 +135,15 @@ class PlayerService:
     
     def should_sync_roster(self) -> bool:
         """
-        Check if roster should be synced (more than 24 hours since last update).
-        TEMPORARILY DISABLED for testing - always returns True
+        Check if roster should be synced: no roster sync job has succeeded in
+        the last 24 hours. Failed and skipped runs don't count.
         """
-        print("24-hour lock temporarily disabled for testing - sync allowed")
-        return True
+        from .sync_jobs import SYNC_ROSTER
+
+        last_synced = self.db.query(func.max(JobRun.finished_at)).filter(
+            JobRun.job_name == SYNC_ROSTER, JobRun.status == 'succeeded'
+        ).scalar()
+        return last_synced is None or datetime.now() - last_synced >= ROSTER_SYNC_INTERVAL
 
     def sync_roster_from_espn(self) -> List[dict]:
         """
@@ -130,30 +155,11 @@ class PlayerService:
         try:
             print("Fetching roster data from ESPN...", flush=True)
             
-            # Add proper headers to avoid being blocked
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            print(f"Response status: {response.status_code}")
-            print(f"Response length: {len(response.text)} characters")
-            print("First 1000 characters of HTML:")
-            print(response.text[:1000])
-            print("...")
-            
-            # Parse HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Send browser headers to avoid being blocked
+            html = http.fetch_text(url, headers=http.BROWSER_HEADERS, cache="roster")
             
             # Extract roster data from the page
-            players = self._parse_espn_roster(soup)
+            players = self._parse_espn_roster(html)
             
             print(f"Successfully parsed {len(players)} players from ESPN", flush=True)
             return players
@@ -166,9 +172,14 @@ class PlayerService:
         """
         Sync current roster from ESPN and save to database.
         Returns sync result with player count and sync status.
-        """
-        from datetime import datetime
         
+        Players are matched by ESPN ID (by name for rows that don't have one
+        yet), so their IDs and stats survive the sync: new players are
+        inserted, changed fields updated and players no longer on the roster
+        marked Inactive, all in bulk statements. Unchanged players aren't
+        written at all. The players' ESPN IDs and URL slugs are recorded in
+        the player registry in the same transaction.
+        """
         # Check if we should sync
         if not self.should_sync_roster():
             return {
@@ -187,50 +198,122 @@ class PlayerService:
             }
         
         try:
-            # Clear existing roster data
-            print("Clearing existing roster data...")
-            self.db.query(PlayerPosition).delete()
-            self.db.query(Player).delete()
-            self.db.commit()
-            
-            # Add new roster data
             current_time = datetime.now().isoformat()
-            added_players = 0
+            
+            existing = self.db.query(Player).options(selectinload(Player.positions)).all()
+            by_espn_id = {player.espn_id: player for player in existing if player.espn_id}
+            by_name = {player.name: player for player in existing}
+            
+            to_insert = []
+            new_positions = []
+            to_update = []
+            position_updates = {}  # player id -> positions
+            seen_ids = set()
+            inserted_espn_ids = set()
+            skipped = []
+            unchanged = 0
             
             for player_data in players_data:
-                # Create player
-                player = Player(
-                    name=player_data['name'],
-                    uniform_number=player_data['uniform_number'],
-                    team=player_data['team'],
-                    status=player_data['status'],
-                    bats=player_data.get('bats'),
-                    throws=player_data.get('throws'),
-                    height=player_data.get('height'),
-                    weight=player_data.get('weight'),
-                    last_updated=current_time
-                )
-                self.db.add(player)
-                self.db.flush()  # Get the ID
+                espn_id = player_data.get('espn_id')
+                current = by_espn_id.get(espn_id) if espn_id else None
+                if current is None:
+                    # Players stored before ESPN IDs were recorded
+                    current = by_name.get(player_data['name'])
+                    if current is not None and current.espn_id and current.espn_id != espn_id:
+                        current = None
+                
+                row = {column: player_data.get(column) for column in ROSTER_COLUMNS}
+                row['espn_id'] = espn_id
                 
-                # Create position records
-                for i, pos in enumerate(player_data['positions']):
-                    is_primary = (i == 0)  # First position is primary
-                    position = PlayerPosition(
-                        player_id=player.id,
-                        position=pos,
-                        is_primary=is_primary
-                    )
-                    self.db.add(position)
+                # Call-ups can be listed before they get a number; a known player
+                # keeps the stored one, a new one waits for the next sync
+                if row['uniform_number'] is None:
+                    if current is None:
+                        skipped.append(player_data['name'])
+                        continue
+                    row['uniform_number'] = current.uniform_number
                 
-                added_players += 1
+                if current is None:
+                    if espn_id and espn_id in inserted_espn_ids:
+                        continue
+                    inserted_espn_ids.add(espn_id)
+                    to_insert.append(dict(row, status='Active', last_updated=current_time))
+                    new_positions.append(player_data['positions'])
+                    continue
+                if current.id in seen_ids:
+                    continue
+                seen_ids.add(current.id)
+                
+                if espn_id is None:
+                    row['espn_id'] = current.espn_id
+                # Status is edited by hand (Injured, ...); the sync only brings players back
+                if current.status == INACTIVE:
+                    row['status'] = 'Active'
+                fields_changed = any(getattr(current, column) != value for column, value in row.items())
+                current_positions = [
+                    position.position for position in sorted(current.positions, key=lambda p: not p.is_primary)
+                ]
+                
+                if fields_changed:
+                    to_update.append(dict(row, id=current.id, last_updated=current_time))
+                if current_positions != player_data['positions']:
+                    position_updates[current.id] = player_data['positions']
+                if not fields_changed and current_positions == player_data['positions']:
+                    unchanged += 1
+            
+            departed = [
+                player.id for player in existing
+                if player.id not in seen_ids and player.status != INACTIVE
+            ]
+            
+            if to_update:
+                self.db.execute(update(Player), to_update)
+            if departed:
+                self.db.execute(
+                    update(Player)
+                    .where(Player.id.in_(departed))
+                    .values(status=INACTIVE, last_updated=current_time)
+                    .execution_options(synchronize_session=False)
+                )
+            if to_insert:
+                new_ids = self.db.scalars(
+                    insert(Player).returning(Player.id, sort_by_parameter_order=True), to_insert
+                ).all()
+                position_updates.update(zip(new_ids, new_positions))
             
+            if position_updates:
+                self.db.execute(
+                    delete(PlayerPosition)
+                    .where(PlayerPosition.player_id.in_(list(position_updates)))
+                    .execution_options(synchronize_session=False)
+                )
+                self.db.execute(insert(PlayerPosition), [
+                    {'player_id': player_id, 'position': position, 'is_primary': i == 0}
+                    for player_id, positions in position_updates.items()
+                    for i, position in enumerate(positions)
+                ])
+            
+            identities = player_registry.record(self.db, players_data)
+            
+            changed = bool(to_insert or to_update or departed or position_updates)
+            if changed:
+                bump_version(self.db, ROSTER)
             self.db.commit()
+            if to_insert or to_update or identities:
+                player_registry.invalidate()
+            
+            print(f"Roster sync: {len(to_insert)} added, {len(to_update)} updated, "
+                  f"{len(departed)} inactive, {unchanged} unchanged")
             
             return {
                 "synced": True,
-                "reason": "Roster successfully synced from ESPN",
-                "players_count": added_players,
+                "reason": "Roster successfully synced from ESPN" if changed else "Roster already up to date",
+                "players_count": len(seen_ids) + len(to_insert),
+                "added": len(to_insert),
+                "updated": len(to_update),
+                "inactivated": len(departed),
+                "unchanged": unchanged,
+                "skipped_players": skipped,
                 "sync_time": current_time
             }
             
@@ -243,228 +326,14 @@ class PlayerService:
                 "players_count": 0
             }
     
-    def _parse_espn_roster(self, soup: BeautifulSoup) -> List[dict]:
+    def _parse_espn_roster(self, html: str) -> List[dict]:
         """
-        Parse the ESPN HTML to extract roster information.
+        Parse the ESPN roster page HTML to extract roster information.
         """
-        players = []
-        
         try:
-            # ESPN has multiple roster tables organized by position groups
-            # Look for all tables with class 'Table' within roster sections
-            roster_tables = soup.find_all('table', class_='Table')
-            
-            if not roster_tables:
-                print("No roster tables found on ESPN page")
-                return players
-            
-            print(f"Found {len(roster_tables)} ESPN roster tables")
-            
-            # Debug: Let's look at the first table structure
-            if roster_tables:
-                first_table = roster_tables[0]
-                header_row = first_table.find('tr')
-                if header_row:
-                    headers = header_row.find_all('th')
-                    print("Table headers found:")
-                    for i, header in enumerate(headers):
-                        print(f"  Column {i}: {header.get_text().strip()}")
-                    print()
-            
-            for table_idx, table in enumerate(roster_tables):
-                # Find all rows in the table
-                rows = table.find_all('tr')
-                print(f"Processing table {table_idx + 1} with {len(rows)} rows")
-                
-                for row in rows:
-                    # Skip header rows
-                    if row.find('th'):
-                        continue
-                    
-                    # Get all cells in the row
-                    cells = row.find_all('td')
-                    
-                    # Debug: Show what we're getting in this row
-                    if len(cells) > 0:
-                        print(f"Row has {len(cells)} cells:")
-                        for i, cell in enumerate(cells[:8]):  # Show first 8 cells
-                            cell_text = cell.get_text().strip()
-                            print(f"  Cell {i}: '{cell_text}'")
-                    
-                    if len(cells) >= 7:  # ESPN has: Headshot, Name, Position, Bats, Throws, Age, Height, Weight, Birth Place
-                        try:
-                            # Extract player name (second column, index 1)
-                            name_cell = cells[1]
-                            name_link = name_cell.find('a')
-                            player_name = name_link.get_text().strip() if name_link else name_cell.get_text().strip()
-                            
-                            # Extract position (third column, index 2)
-                            position = cells[2].get_text().strip() if len(cells) > 2 else 'Unknown'
-                            
-                            # Extract bats (fourth column, index 3)
-                            bats = cells[3].get_text().strip() if len(cells) > 3 else None
-                            
-                            # Extract throws (fifth column, index 4)
-                            throws = cells[4].get_text().strip() if len(cells) > 4 else None
-                            
-                            # Extract age (sixth column, index 5)
-                            age_text = cells[5].get_text().strip() if len(cells) > 5 else None
-                            age = None
-                            if age_text and age_text.isdigit():
-                                age = int(age_text)
-                            
-                            # Extract height (seventh column, index 6)
-                            height = cells[6].get_text().strip() if len(cells) > 6 else None
-                            
-                            # Extract weight (eighth column, index 7)
-                            weight_text = cells[7].get_text().strip() if len(cells) > 7 else None
-                            weight = None
-                            if weight_text:
-                                # Extract number from "212 lbs" format
-                                weight_match = re.search(r'(\d+)', weight_text)
-                                if weight_match:
-                                    weight = int(weight_match.group(1))
-                            
-                            # Extract jersey number from name cell (it's in a span with class 'n10')
-                            uniform_number = None
-                            jersey_span = name_cell.find('span', class_='n10')
-                            if jersey_span:
-                                jersey_text = jersey_span.get_text().strip()
-                                number_match = re.search(r'(\d+)', jersey_text)
-                                if number_match:
-                                    uniform_number = int(number_match.group(1))
-                            
-                            # If no uniform number found in span, try to extract from name
-                            if uniform_number is None:
-                                name_number_match = re.search(r'(\d+)$', player_name)
-                                if name_number_match:
-                                    uniform_number = int(name_number_match.group(1))
-                                    # Clean the name by removing the number
-                                    player_name = re.sub(r'\d+$', '', player_name).strip()
-                            
-                            # Only add if we have a valid player name
-                            if player_name and len(player_name) > 2 and self._is_valid_player_name(player_name):
-                                player_info = {
-                                    'name': player_name,
-                                    'uniform_number': uniform_number,
-                                    'positions': [position],  # Start with primary position
-                                    'bats': bats,
-                                    'throws': throws,
-                                    'height': height,
-                                    'weight': weight,
-                                    'status': 'Active',
-                                    'team': 'Los Angeles Dodgers'
-                                }
-                                players.append(player_info)
-                                print(f"Table {table_idx + 1}: Found player: {player_name} - {position} - #{uniform_number} - B:{bats}/T:{throws} - {height} {weight}lbs")
-                    
-                        except Exception as e:
-                            print(f"Error parsing row: {e}")
-                            continue
-            
-            print(f"Total players found: {len(players)}")
-            
+            return parse_roster_html(html)
         except Exception as e:
             print(f"Error parsing ESPN roster: {e}")
-        
-        return players
-    
-    def _is_valid_player_name(self, text: str) -> bool:
-        """
-        Check if text looks like a valid player name.
-        """
-        if not text or len(text) < 3:
-            return False
-        
-        # Filter out common non-player entries
-        invalid_patterns = [
-            r'league|division|conference|association',
-            r'\d{4}[-–]\d{4}',  # Year ranges like "1890-1891"
-            r'present|current|former',
-            r'championship|title|award',
-            r'stadium|ballpark|venue',
-            r'coach|manager|owner|executive',
-            r'minor league|triple-a|double-a|single-a',
-            r'rookie|veteran|all-star|mvp'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in invalid_patterns:
-            if re.search(pattern, text_lower):
-                return False
-        
-        # Must look like a person's name (first and last name)
-        if not re.match(r'^[A-Z][a-z]+ [A-Z][a-z]+', text):
-            return False
-        
-        return True
-    
-    def _extract_player_info_from_table(self, row) -> Optional[dict]:
-        """
-        Extract player information from a table row.
-        """
-        try:
-            cells = row.find_all(['td', 'th'])
-            if len(cells) < 2:
-                return None
-            
-            name = cells[0].get_text().strip()
-            if not self._is_valid_player_name(name):
-                return None
-            
-            position = cells[1].get_text().strip() if len(cells) > 1 else 'Unknown'
-            
-            # Try to extract jersey number from name or position
-            uniform_number = None
-            number_match = re.search(r'#(\d+)', name + ' ' + position)
-            if number_match:
-                uniform_number = int(number_match.group(1))
-            
-            return {
-                'name': name,
-                'position': position,
-                'uniform_number': uniform_number,
-                'status': 'Active',
-                'team': 'Los Angeles Dodgers'
-            }
-            
-        except Exception as e:
-            print(f"Error extracting player info from table row: {e}")
-            return None
-    
-    def _extract_player_info(self, player_text: str) -> Optional[dict]:
-        """
-        Extract player information from text.
-        """
-        try:
-            # Basic parsing - this will need refinement based on actual data format
-            player_info = {
-                'name': player_text.strip(),
-                'position': 'Unknown',
-                'uniform_number': None,
-                'status': 'Active',
-                'team': 'Los Angeles Dodgers'
-            }
-            
-            # Try to extract position if it's in parentheses or after a dash
-            if '(' in player_text:
-                # Look for position in parentheses
-                match = re.search(r'\(([^)]+)\)', player_text)
-                if match:
-                    position = match.group(1).strip()
-                    if any(pos in position.upper() for pos in ['P', 'C', '1B', '2B', '3B', 'SS', 'LF', 'CF', 'RF', 'DH']):
-                        player_info['position'] = position
-                        player_info['name'] = player_text.split('(')[0].strip()
-            
-            # Try to extract jersey number
-            number_match = re.search(r'#(\d+)', player_text)
-            if number_match:
-                player_info['uniform_number'] = int(number_match.group(1))
-            
-            return player_info
-            
-        except Exception as e:
-            print(f"Error extracting player info from '{player_text}': {e}")
-            return None
+            return []
     
 
@@ -0,0 +1,137 @@
+import re
+from typing import Any, Dict, List, Optional, Union
+
+# Player pages are linked as https://www.espn.com/mlb/player/_/id/<id>/<slug>
+PLAYER_LINK_PATTERN = re.compile(r'/id/(\d+)(?:/([^/?#]+))?')
+NUMBER_PATTERN = re.compile(r'(\d+)')
+
+# Rows of ESPN's roster tables (Pitchers, Catchers, Infielders, ...); header rows have no <td>
+ROW_XPATH = "//table[contains(concat(' ', normalize-space(@class), ' '), ' Table ')]//tr[td]"
+
+INVALID_NAME_PATTERNS = re.compile(
+    r'league|division|conference|association'
+    r'|\d{4}[-–]\d{4}'  # Year ranges like "1890-1891"
+    r'|present|current|former'
+    r'|championship|title|award'
+    r'|stadium|ballpark|venue'
+    r'|coach|manager|owner|executive'
+    r'|minor league|triple-a|double-a|single-a'
+    r'|rookie|veteran|all-star|mvp'
+)
+
+# One word of a name: letters in any script (Ángel, Kiké Hernández) with dotted
+# initials (J.P.), apostrophes and hyphens (d'Arnaud, Smith-Njigba)
+NAME_WORD_PATTERN = re.compile(r"^[^\W\d_](?:[^\W\d_]|[.'’-])*$")
+
+
+def is_valid_player_name(text: str) -> bool:
+    """
+    Check if text looks like a player's name rather than a table caption or note.
+    """
+    if not text or len(text) < 3:
+        return False
+    if INVALID_NAME_PATTERNS.search(text.lower()):
+        return False
+    words = text.split()
+    if len(words) < 2 or not all(NAME_WORD_PATTERN.match(word) for word in words):
+        return False
+    # Capitalized first name; later words may start with a lowercase particle (d'Arnaud, de la Cruz)
+    return words[0][0].isupper() and any(character.isupper() for word in words[1:] for character in word)
+
+
+def _table_region(html: str) -> str:
+    """
+    The slice of the page holding the roster tables. ESPN pages are mostly
+    navigation, inline JSON and scripts; parsing only this part is most of
+    the speedup.
+    """
+    start = html.find('<table')
+    end = html.rfind('</table>')
+    if start == -1 or end == -1:
+        return ''
+    return html[start:end + len('</table>')]
+
+
+def _text(element) -> str:
+    return element.text_content().strip() if element is not None else ''
+
+
+def _parse_row(cells) -> Optional[Dict[str, Any]]:
+    # Headshot, Name, POS, BAT, THW, Age, HT, WT, Birth Place
+    name_cell = cells[1]
+    link = name_cell.find('.//a')
+    player_name = _text(link) if link is not None else _text(name_cell)
+
+    uniform_number = None
+    for span in name_cell.iter('span'):
+        if 'n10' in (span.get('class') or '').split():
+            match = NUMBER_PATTERN.search(_text(span))
+            if match:
+                uniform_number = int(match.group(1))
+            break
+    if uniform_number is None:
+        match = re.search(r'(\d+)$', player_name)
+        if match:
+            uniform_number = int(match.group(1))
+            player_name = player_name[:match.start()].strip()
+
+    if not is_valid_player_name(player_name):
+        return None
+
+    espn_id = espn_slug = None
+    if link is not None:
+        match = PLAYER_LINK_PATTERN.search(link.get('href') or '')
+        if match:
+            espn_id, espn_slug = match.groups()
+
+    weight = None
+    if len(cells) > 7:
+        match = NUMBER_PATTERN.search(_text(cells[7]))
+        if match:
+            weight = int(match.group(1))
+
+    return {
+        'name': player_name,
+        'espn_id': espn_id,
+        'espn_slug': espn_slug,
+        'uniform_number': uniform_number,
+        'positions': [_text(cells[2])],  # Start with primary position
+        'bats': _text(cells[3]) or None,
+        'throws': _text(cells[4]) or None,
+        'height': _text(cells[6]) or None,
+        'weight': weight,
+        'status': 'Active',
+        'team': 'Los Angeles Dodgers'
+    }
+
+
+def parse_roster_html(html: Union[str, bytes]) -> List[Dict[str, Any]]:
+    """
+    Extract players from an ESPN team roster page.
+
+    Only the region containing the roster tables is parsed, with lxml, and
+    rows are selected directly by XPath. lxml is imported here so only the
+    roster sync needs it.
+    """
+    import lxml.html
+
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    region = _table_region(html)
+    if not region:
+        return []
+
+    root = lxml.html.fragment_fromstring(region, create_parent='div')
+    players = []
+    for row in root.xpath(ROW_XPATH):
+        cells = row.findall('td')
+        if len(cells) < 7:
+            continue
+        try:
+            player = _parse_row(cells)
+        except (ValueError, IndexError) as e:
+            print(f"Error parsing roster row: {e}")
+            continue
+        if player:
+            players.append(player)
+    return players
@@ -0,0 +1,145 @@
+import re
+import threading
+import time
+from typing import Dict, Optional, Set
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ..db.models.stadiums import Stadium
+
+# Venue names ESPN has used (sponsor changes, former names, short forms) -> our stadium name
+STADIUM_ALIASES = {
+    "Daikin Park": "Minute Maid Park",
+    "Rate Field": "Guaranteed Rate Field",
+    "U.S. Cellular Field": "Guaranteed Rate Field",
+    "Miller Park": "American Family Field",
+    "Marlins Park": "loanDepot Park",
+    "loanDepot park": "loanDepot Park",
+    "SunTrust Park": "Truist Park",
+    "AT&T Park": "Oracle Park",
+    "SBC Park": "Oracle Park",
+    "Pacific Bell Park": "Oracle Park",
+    "Bank One Ballpark": "Chase Field",
+    "Jacobs Field": "Progressive Field",
+    "SkyDome": "Rogers Centre",
+    "Camden Yards": "Oriole Park at Camden Yards",
+    "Angel Stadium of Anaheim": "Angel Stadium",
+    "Steinbrenner Field": "George M. Steinbrenner Field",
+    "Globe Life Park": "Globe Life Field",
+}
+
+# Minimum trigram similarity for a fuzzy match
+FUZZY_THRESHOLD = 0.45
+
+# Other workers may add stadiums; reload at least this often
+REFRESH_SECONDS = 300
+
+
+def normalize_venue(name: str) -> str:
+    """
+    Normalize a venue name for lookups: lowercase, '&' -> 'and', no punctuation.
+    """
+    name = name.lower().replace("&", " and ")
+    name = re.sub(r"[^a-z0-9 ]+", " ", name)
+    return " ".join(name.split())
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class StadiumResolver:
+    """
+    In-memory venue name -> stadium ID index.
+
+    Exact names and aliases resolve through a dict; anything else goes through
+    substring and trigram matching, and the answer is memoized. The index is
+    loaded from the stadiums table on first use and reloaded after
+    `invalidate()` or REFRESH_SECONDS.
+    """
+
+    def __init__(self):
+        self._exact: Dict[str, int] = {}
+        self._trigram_index: Dict[str, Set[str]] = {}
+        self._memo: Dict[str, Optional[int]] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def load(self, db: Session):
+        """
+        (Re)build the index from the stadiums table.
+        """
+        stadium_ids = {name: stadium_id for stadium_id, name in db.execute(select(Stadium.id, Stadium.name))}
+
+        exact: Dict[str, int] = {}
+        for name, stadium_id in stadium_ids.items():
+            exact[normalize_venue(name)] = stadium_id
+        for alias, name in STADIUM_ALIASES.items():
+            if name in stadium_ids:
+                exact.setdefault(normalize_venue(alias), stadium_ids[name])
+
+        trigram_index: Dict[str, Set[str]] = {}
+        for key in exact:
+            for trigram in _trigrams(key):
+                trigram_index.setdefault(trigram, set()).add(key)
+
+        with self._lock:
+            self._exact = exact
+            self._trigram_index = trigram_index
+            self._memo = {}
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        """
+        Force a reload on the next lookup (call after stadiums change).
+        """
+        with self._lock:
+            self._loaded_at = None
+
+    def resolve(self, db: Session, venue_name: Optional[str]) -> Optional[int]:
+        """
+        Resolve a venue name to a stadium ID, or None if nothing matches.
+        """
+        if not venue_name:
+            return None
+
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > REFRESH_SECONDS:
+            self.load(db)
+
+        key = normalize_venue(venue_name)
+        stadium_id = self._exact.get(key)
+        if stadium_id is not None:
+            return stadium_id
+
+        if key in self._memo:
+            return self._memo[key]
+
+        stadium_id = self._fuzzy_match(key)
+        with self._lock:
+            self._memo[key] = stadium_id
+        return stadium_id
+
+    def _fuzzy_match(self, key: str) -> Optional[int]:
+        # A known name inside the venue string (or vice versa), longest first
+        contained = [name for name in self._exact if name in key or key in name]
+        if contained:
+            return self._exact[max(contained, key=len)]
+
+        query = _trigrams(key)
+        shared: Dict[str, int] = {}
+        for trigram in query:
+            for name in self._trigram_index.get(trigram, ()):
+                shared[name] = shared.get(name, 0) + 1
+
+        best_name, best_score = None, 0.0
+        for name, count in shared.items():
+            score = count / (len(query) + len(_trigrams(name)) - count)
+            if score > best_score:
+                best_name, best_score = name, score
+
+        if best_name and best_score >= FUZZY_THRESHOLD:
+            return self._exact[best_name]
+        return None
+
+
+stadium_resolver = StadiumResolver()
@@ -1,9 +1,16 @@
-import requests
 from typing import Dict, Optional, Tuple, List
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
 from sqlalchemy.orm import Session
 from ..core.config import settings
+from ..core import http
+from ..core.rate_limit import TokenBucket
 from ..db.models.stadiums import Stadium
+from ..db.models.weather import WeatherObservation
+from ..db.upsert import upsert_rows
+from .stadium_resolver import stadium_resolver
+
+# Shared by every thread that calls WeatherAPI
+weather_api_limiter = TokenBucket(settings.WEATHER_API_RATE_LIMIT)
 
 class StadiumService:
     """
@@ -17,33 +24,18 @@ class StadiumService:
     
     def get_stadium_by_name(self, venue_name: str) -> Optional[Stadium]:
         """
-        Get stadium by name (with fuzzy matching).
+        Get stadium by name (with alias and fuzzy matching).
         """
-        if not venue_name:
+        stadium_id = self.resolve_stadium_id(venue_name)
+        if stadium_id is None:
             return None
-            
-        # Try exact match first
-        stadium = self.db.query(Stadium).filter(
-            Stadium.name == venue_name
-        ).first()
-        
-        if stadium:
-            return stadium
-        
-        # Try partial matches
-        stadium = self.db.query(Stadium).filter(
-            Stadium.name.contains(venue_name)
-        ).first()
-        
-        if stadium:
-            return stadium
-        
-        # Try reverse partial match
-        stadium = self.db.query(Stadium).filter(
-            venue_name.contains(Stadium.name)
-        ).first()
-        
-        return stadium
+        return self.db.get(Stadium, stadium_id)
+    
+    def resolve_stadium_id(self, venue_name: str) -> Optional[int]:
+        """
+        Resolve a venue name to a stadium ID through the in-memory resolver index.
+        """
+        return stadium_resolver.resolve(self.db, venue_name)
     
     def get_stadium_coordinates(self, venue_name: str) -> Optional[Dict[str, float]]:
         """
@@ -69,6 +61,7 @@ class StadiumService:
         self.db.add(stadium)
         self.db.commit()
         self.db.refresh(stadium)
+        stadium_resolver.invalidate()
         return stadium
     
     def update_stadium_coordinates(self, stadium_id: int, latitude: float, longitude: float) -> bool:
@@ -80,6 +73,7 @@ class StadiumService:
             stadium.latitude = latitude
             stadium.longitude = longitude
             self.db.commit()
+            stadium_resolver.invalidate()
             return True
         return False
     
@@ -435,6 +429,8 @@ class StadiumService:
     def get_weather_for_game(self, venue_name: str, game_date: str, game_time: Optional[str] = None) -> Optional[Dict]:
         """
         Get weather data for a specific game using stadium coordinates.
+        Hourly observations come from the weather_observations cache, which
+        is filled with one WeatherAPI call per stadium-day.
         """
         try:
             # Get stadium coordinates from database
@@ -443,89 +439,144 @@ class StadiumService:
                 print(f"No stadium found for venue: {venue_name}")
                 return None
             
-            coords = stadium.coordinates
-            
-            # Parse game date and time
-            game_datetime = datetime.strptime(game_date, "%Y-%m-%d")
-            
-            # Default to 7:00 PM if no game time
-            if game_time:
-                try:
-                    time_obj = datetime.strptime(game_time, "%H:%M").time()
-                    game_datetime = datetime.combine(game_datetime.date(), time_obj)
-                except ValueError:
-                    # If time parsing fails, default to 7:00 PM
-                    game_datetime = datetime.combine(game_datetime.date(), datetime.strptime("19:00", "%H:%M").time())
-            else:
-                game_datetime = datetime.combine(game_datetime.date(), datetime.strptime("19:00", "%H:%M").time())
-            
-            # Calculate 3-hour window around game time
-            start_time = game_datetime - timedelta(hours=1.5)
-            end_time = game_datetime + timedelta(hours=1.5)
-            
-            # Format for WeatherAPI
-            date_str = game_date
-            time_str = start_time.strftime("%H:%M")
-            
-            # Build API URL
-            url = f"{self.weather_base_url}/history.json"
-            params = {
-                "key": self.weather_api_key,
-                "q": f"{coords['lat']},{coords['lon']}",
-                "dt": date_str,
-                "hour": time_str
-            }
-            
-            # Make API request
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Extract relevant weather data
-            if 'forecast' in data and 'forecastday' in data['forecast']:
-                forecast_day = data['forecast']['forecastday'][0]
-                
-                # Get hourly data for the 3-hour window
-                hourly_data = []
-                for hour_data in forecast_day['hour']:
-                    hour_time = datetime.strptime(hour_data['time'], "%Y-%m-%d %H:%M")
-                    if start_time <= hour_time <= end_time:
-                        hourly_data.append({
-                            'time': hour_data['time'],
-                            'temp_f': hour_data['temp_f'],
-                            'condition': hour_data['condition']['text'],
-                            'wind_mph': hour_data['wind_mph'],
-                            'wind_dir': hour_data['wind_dir'],
-                            'humidity': hour_data['humidity'],
-                            'precip_in': hour_data['precip_in']
-                        })
-                
-                if hourly_data:
-                    # Calculate averages for the game window
-                    avg_temp = sum(h['temp_f'] for h in hourly_data) / len(hourly_data)
-                    avg_wind = sum(h['wind_mph'] for h in hourly_data) / len(hourly_data)
-                    avg_humidity = sum(h['humidity'] for h in hourly_data) / len(hourly_data)
-                    
-                    # Get most common condition
-                    conditions = [h['condition'] for h in hourly_data]
-                    most_common_condition = max(set(conditions), key=conditions.count)
-                    
-                    return {
-                        'temperature': round(avg_temp),
-                        'conditions': most_common_condition,
-                        'wind_speed': round(avg_wind),
-                        'wind_direction': hourly_data[0]['wind_dir'],  # Use first hour's direction
-                        'humidity': round(avg_humidity),
-                        'hourly_data': hourly_data
-                    }
-            
-            return None
+            game_datetime = self.game_start_datetime(game_date, game_time)
+            hourly = self.get_hourly_weather(stadium, game_datetime.date())
+            return self.summarize_game_weather(hourly, game_datetime)
             
         except Exception as e:
             print(f"Error getting weather for {venue_name} on {game_date}: {e}")
             return None
     
+    def get_hourly_weather(self, stadium: Stadium, day: date) -> List[Dict]:
+        """
+        Get a stadium's hourly weather for a day, from the cache when possible.
+        Past days are stored after the first fetch; today and later are not,
+        since they are still forecasts.
+        """
+        cached = self.db.query(WeatherObservation).filter(
+            WeatherObservation.stadium_id == stadium.id,
+            WeatherObservation.obs_date == day
+        ).order_by(WeatherObservation.hour).all()
+        
+        if cached:
+            return [self._observation_to_hour(observation) for observation in cached]
+        
+        hourly = self.fetch_weather_day(stadium.coordinates, day)
+        if hourly and day < date.today():
+            self.store_weather_day(stadium.id, day, hourly)
+        return hourly
+    
+    def fetch_weather_day(self, coords: Dict[str, float], day: date) -> List[Dict]:
+        """
+        Fetch all 24 hourly observations for a location and day from WeatherAPI.
+        Does no database work, so it is safe to call from worker threads.
+        """
+        url = f"{self.weather_base_url}/history.json"
+        params = {
+            "key": self.weather_api_key,
+            "q": f"{coords['lat']},{coords['lon']}",
+            "dt": day.strftime("%Y-%m-%d")
+        }
+        
+        data = http.fetch_json(url, params=params, cache="weather", limiter=weather_api_limiter)
+        
+        if 'forecast' not in data or 'forecastday' not in data['forecast'] or not data['forecast']['forecastday']:
+            return []
+        
+        return [
+            {
+                'time': hour_data['time'],
+                'temp_f': hour_data['temp_f'],
+                'condition': hour_data['condition']['text'],
+                'wind_mph': hour_data['wind_mph'],
+                'wind_dir': hour_data['wind_dir'],
+                'humidity': hour_data['humidity'],
+                'precip_in': hour_data['precip_in']
+            }
+            for hour_data in data['forecast']['forecastday'][0]['hour']
+        ]
+    
+    def store_weather_day(self, stadium_id: int, day: date, hourly: List[Dict]):
+        """
+        Write a stadium-day of observations to the cache in one statement.
+        Does not commit; callers commit with the rest of their sync.
+        """
+        rows = [
+            {
+                'stadium_id': stadium_id,
+                'obs_date': day,
+                'hour': datetime.strptime(hour['time'], "%Y-%m-%d %H:%M").hour,
+                'temp_f': hour['temp_f'],
+                'condition': hour['condition'],
+                'wind_mph': hour['wind_mph'],
+                'wind_dir': hour['wind_dir'],
+                'humidity': hour['humidity'],
+                'precip_in': hour['precip_in']
+            }
+            for hour in hourly
+        ]
+        upsert_rows(self.db, WeatherObservation, rows, ['stadium_id', 'obs_date', 'hour'], [])
+    
+    def summarize_game_weather(self, hourly: List[Dict], game_datetime: datetime) -> Optional[Dict]:
+        """
+        Average the hourly observations over a 3-hour window around first pitch.
+        """
+        # Calculate 3-hour window around game time
+        start_time = game_datetime - timedelta(hours=1.5)
+        end_time = game_datetime + timedelta(hours=1.5)
+        
+        hourly_data = [
+            hour for hour in hourly
+            if start_time <= datetime.strptime(hour['time'], "%Y-%m-%d %H:%M") <= end_time
+        ]
+        
+        if not hourly_data:
+            return None
+        
+        # Calculate averages for the game window
+        avg_temp = sum(h['temp_f'] for h in hourly_data) / len(hourly_data)
+        avg_wind = sum(h['wind_mph'] for h in hourly_data) / len(hourly_data)
+        avg_humidity = sum(h['humidity'] for h in hourly_data) / len(hourly_data)
+        
+        # Get most common condition
+        conditions = [h['condition'] for h in hourly_data]
+        most_common_condition = max(set(conditions), key=conditions.count)
+        
+        return {
+            'temperature': round(avg_temp),
+            'conditions': most_common_condition,
+            'wind_speed': round(avg_wind),
+            'wind_direction': hourly_data[0]['wind_dir'],  # Use first hour's direction
+            'humidity': round(avg_humidity),
+            'hourly_data': hourly_data
+        }
+    
+    def game_start_datetime(self, game_date: str, game_time: Optional[str] = None) -> datetime:
+        """
+        Combine game date and time, defaulting to 7:00 PM.
+        """
+        game_day = datetime.strptime(game_date, "%Y-%m-%d").date()
+        default_time = datetime.strptime("19:00", "%H:%M").time()
+        
+        if game_time:
+            try:
+                return datetime.combine(game_day, datetime.strptime(game_time, "%H:%M").time())
+            except ValueError:
+                # If time parsing fails, default to 7:00 PM
+                pass
+        return datetime.combine(game_day, default_time)
+    
+    def _observation_to_hour(self, observation: WeatherObservation) -> Dict:
+        return {
+            'time': f"{observation.obs_date.strftime('%Y-%m-%d')} {observation.hour:02d}:00",
+            'temp_f': observation.temp_f,
+            'condition': observation.condition,
+            'wind_mph': observation.wind_mph,
+            'wind_dir': observation.wind_dir,
+            'humidity': observation.humidity,
+            'precip_in': observation.precip_in
+        }
+    
     def get_weather_summary(self, venue_name: str, game_date: str) -> Optional[str]:
         """
         Get a simple weather summary for display.
@@ -0,0 +1,237 @@
+from datetime import date
+from typing import Dict, List, Optional, Any
+from sqlalchemy import select, func, case, and_, or_, update
+from sqlalchemy.orm import Session
+from ..db.models import Game, TeamRecord
+
+DODGERS = 'Los Angeles Dodgers'
+
+class StandingsService:
+    """
+    Service for the materialized team_records table.
+
+    Records are rebuilt with a single aggregate query and then kept current
+    incrementally as games go final, so reading a record is one indexed row.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_record(self, team: str = DODGERS, season: Optional[int] = None) -> Optional[TeamRecord]:
+        """
+        Get a team's materialized record (latest season if none is given).
+        A season that has never been materialized is computed from games
+        into a transient TeamRecord that is not added to the session: reads
+        never write, rows are materialized by the syncs.
+        """
+        query = self.db.query(TeamRecord).filter(TeamRecord.team == team)
+        if season:
+            query = query.filter(TeamRecord.season == season)
+        record = query.order_by(TeamRecord.season.desc()).first()
+
+        if record is None:
+            season = season or self._latest_season(team)
+            if season is None:
+                return None
+            record = TeamRecord(team=team, season=season, **self._season_totals(team, season))
+        return record
+
+    def rebuild_record(self, team: str, season: int) -> TeamRecord:
+        """
+        Recompute a team's season record from final games.
+        Does not commit; callers commit with the rest of their sync.
+        """
+        totals = self._season_totals(team, season)
+
+        record = self.db.query(TeamRecord).filter(
+            TeamRecord.team == team,
+            TeamRecord.season == season
+        ).first()
+        if record is None:
+            record = TeamRecord(team=team, season=season)
+            self.db.add(record)
+
+        for column, value in totals.items():
+            setattr(record, column, value)
+        self.db.flush()
+        return record
+
+    def _season_totals(self, team: str, season: int) -> Dict[str, Any]:
+        """
+        Aggregate a team's season from final games into TeamRecord column values.
+        """
+        team_won = or_(
+            and_(Game.home_team == team, Game.home_score > Game.away_score),
+            and_(Game.away_team == team, Game.away_score > Game.home_score)
+        )
+        team_lost = or_(
+            and_(Game.home_team == team, Game.home_score < Game.away_score),
+            and_(Game.away_team == team, Game.away_score < Game.home_score)
+        )
+        is_home = Game.home_team == team
+
+        totals = self.db.execute(
+            select(
+                func.sum(case((team_won, 1), else_=0)).label('wins'),
+                func.sum(case((team_lost, 1), else_=0)).label('losses'),
+                func.sum(case((Game.home_score == Game.away_score, 1), else_=0)).label('ties'),
+                func.sum(case((and_(is_home, team_won), 1), else_=0)).label('home_wins'),
+                func.sum(case((and_(is_home, team_lost), 1), else_=0)).label('home_losses'),
+                func.sum(case((and_(~is_home, team_won), 1), else_=0)).label('away_wins'),
+                func.sum(case((and_(~is_home, team_lost), 1), else_=0)).label('away_losses'),
+                func.max(Game.game_date).label('last_game_date')
+            ).where(self._final_games_filter(team, season))
+        ).one()
+
+        # Streak and last-10 need results in order; one narrow query
+        ordered = self.db.execute(
+            select(
+                case((team_won, 'W'), (team_lost, 'L'), else_='T')
+            ).where(self._final_games_filter(team, season))
+            .order_by(Game.game_date.desc(), Game.id.desc())
+        ).scalars().all()
+
+        return {
+            'wins': totals.wins or 0,
+            'losses': totals.losses or 0,
+            'ties': totals.ties or 0,
+            'home_wins': totals.home_wins or 0,
+            'home_losses': totals.home_losses or 0,
+            'away_wins': totals.away_wins or 0,
+            'away_losses': totals.away_losses or 0,
+            'last_game_date': totals.last_game_date,
+            'recent_results': ''.join(ordered[:10]),
+            'streak': self._streak(ordered),
+        }
+
+    def claim_final_game(self, game_id: int) -> bool:
+        """
+        Mark a game final unless another writer already has (no commit).
+
+        The live poller and the results sync can both see a game go final;
+        only the one that gets True may pass it to apply_final_games, so the
+        game is counted once.
+        """
+        result = self.db.execute(
+            update(Game)
+            .where(Game.id == game_id, Game.is_final.isnot(True))
+            .values(is_final=True)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    def apply_final_games(self, games: List[Dict[str, Any]], team: str = DODGERS):
+        """
+        Fold newly final games into the team's records without rescanning the season.
+
+        Each game is a dict with game_date, home_team, away_team, home_score and
+        away_score, and must have been claimed with claim_final_game. A season
+        is rebuilt instead when it has no record yet or a game predates the
+        record's last game. The record row is locked (and re-read) before
+        its counts are changed, so two writers finalizing different games
+        don't lose an update. Does not commit.
+        """
+        by_season: Dict[int, List[Dict[str, Any]]] = {}
+        for game in games:
+            if team in (game['home_team'], game['away_team']):
+                by_season.setdefault(game['game_date'].year, []).append(game)
+
+        for season, season_games in by_season.items():
+            season_games.sort(key=lambda game: game['game_date'])
+            record = self.db.query(TeamRecord).filter(
+                TeamRecord.team == team,
+                TeamRecord.season == season
+            ).with_for_update().populate_existing().first()
+
+            if record is None or (
+                record.last_game_date and season_games[0]['game_date'] < record.last_game_date
+            ):
+                self.rebuild_record(team, season)
+                continue
+
+            for game in season_games:
+                self._apply_game(record, game, team)
+        self.db.flush()
+
+    def _apply_game(self, record: TeamRecord, game: Dict[str, Any], team: str):
+        is_home = game['home_team'] == team
+        if is_home:
+            team_score, opponent_score = game['home_score'], game['away_score']
+        else:
+            team_score, opponent_score = game['away_score'], game['home_score']
+
+        if team_score > opponent_score:
+            outcome = 'W'
+            record.wins += 1
+            if is_home:
+                record.home_wins += 1
+            else:
+                record.away_wins += 1
+        elif team_score < opponent_score:
+            outcome = 'L'
+            record.losses += 1
+            if is_home:
+                record.home_losses += 1
+            else:
+                record.away_losses += 1
+        else:
+            outcome = 'T'
+            record.ties += 1
+
+        record.recent_results = (outcome + (record.recent_results or ''))[:10]
+        if record.streak and record.streak[0] == outcome:
+            record.streak = f"{outcome}{int(record.streak[1:]) + 1}"
+        else:
+            record.streak = f"{outcome}1"
+        record.last_game_date = game['game_date']
+
+    def to_dict(self, record: Optional[TeamRecord]) -> Dict[str, Any]:
+        """
+        Shape a TeamRecord for the /games/record response.
+        """
+        if record is None:
+            return {"wins": 0, "losses": 0, "ties": 0, "record": "0-0"}
+
+        recent = record.recent_results or ''
+        return {
+            "season": record.season,
+            "wins": record.wins,
+            "losses": record.losses,
+            "ties": record.ties,
+            "record": f"{record.wins}-{record.losses}",
+            "total_games": record.wins + record.losses + record.ties,
+            "last_game": record.last_game_date,
+            "streak": record.streak,
+            "last_10": f"{recent.count('W')}-{recent.count('L')}",
+            "home_record": f"{record.home_wins}-{record.home_losses}",
+            "away_record": f"{record.away_wins}-{record.away_losses}"
+        }
+
+    def _final_games_filter(self, team: str, season: int):
+        return and_(
+            or_(Game.home_team == team, Game.away_team == team),
+            Game.is_final == True,
+            Game.home_score.isnot(None),
+            Game.away_score.isnot(None),
+            Game.game_date >= date(season, 1, 1),
+            Game.game_date <= date(season, 12, 31)
+        )
+
+    def _latest_season(self, team: str) -> Optional[int]:
+        latest = self.db.query(func.max(Game.game_date)).filter(
+            or_(Game.home_team == team, Game.away_team == team),
+            Game.is_final == True
+        ).scalar()
+        return latest.year if latest else None
+
+    @staticmethod
+    def _streak(ordered_results) -> Optional[str]:
+        if not ordered_results:
+            return None
+        current = ordered_results[0]
+        length = 0
+        for outcome in ordered_results:
+            if outcome != current:
+                break
+            length += 1
+        return f"{current}{length}"
@@ -0,0 +1,115 @@
+from typing import Any, Dict
+
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.scheduler import AdaptiveTrigger, CronTrigger, IntervalTrigger, JobProgress, scheduler
+from ..db.database import SessionLocal
+from .box_score_service import BoxScoreService
+from .game_service import GameService
+from .player_game_service import PlayerGameService
+from .player_service import PlayerService
+
+# Job names (also the /jobs/{name}/run path segment)
+SYNC_SCHEDULE = "sync_schedule"
+SYNC_RESULTS = "sync_results"
+SYNC_WEATHER = "sync_weather"
+SYNC_ROSTER = "sync_roster"
+SYNC_GAME_LOGS = "sync_game_logs"
+SYNC_BOX_SCORES = "sync_box_scores"
+
+
+def sync_schedule_job(db: Session, progress: JobProgress) -> Dict[str, Any]:
+    progress(0, "Fetching schedule from ESPN")
+    return GameService(db).sync_dodgers_schedule()
+
+
+def sync_results_job(db: Session, progress: JobProgress) -> Dict[str, Any]:
+    """
+    Sync scores, then fetch weather for games that just went final.
+    """
+    game_service = GameService(db)
+    progress(0, "Fetching scoreboard from ESPN")
+    result = game_service.sync_game_results()
+    if result["synced"] and result["weather_pending"]:
+        progress(50, f"Fetching weather for {len(result['weather_pending'])} games")
+        result["weather"] = game_service.sync_weather_for_existing_games(game_ids=result["weather_pending"])
+    return result
+
+
+def sync_weather_job(db: Session, progress: JobProgress) -> Dict[str, Any]:
+    def report(done: int, total: int):
+        progress(100 * done / total, f"{done}/{total} stadium-days")
+
+    progress(0, "Finding games without weather")
+    return GameService(db).sync_weather_for_existing_games(progress=report)
+
+
+def sync_roster_job(db: Session, progress: JobProgress) -> Dict[str, Any]:
+    player_service = PlayerService(db)
+    if not player_service.should_sync_roster():
+        return {"skipped": True, "reason": "Roster updated within last 24 hours"}
+    progress(0, "Fetching roster from ESPN")
+    return player_service.sync_roster_to_database()
+
+
+def sync_game_logs_job(db: Session, progress: JobProgress) -> Dict[str, Any]:
+    def report(done: int, total: int):
+        progress(100 * done / total, f"{done}/{total} players")
+
+    progress(0, "Finding players with new games")
+    return PlayerGameService(db).ingest_game_logs(progress=report)
+
+
+def sync_box_scores_job(db: Session, progress: JobProgress) -> Dict[str, Any]:
+    def report(done: int, total: int):
+        progress(100 * done / total, f"{done}/{total} games")
+
+    progress(0, "Finding final games without box scores")
+    return BoxScoreService(db).sync_missing_box_scores(progress=report)
+
+
+def dodgers_game_in_progress() -> bool:
+    db = SessionLocal()
+    try:
+        return GameService(db).has_live_game_window()
+    finally:
+        db.close()
+
+
+def register_sync_jobs():
+    scheduler.add_job(
+        SYNC_SCHEDULE, sync_schedule_job, CronTrigger(settings.SCHEDULE_SYNC_CRON),
+        "Sync the Dodgers schedule from ESPN"
+    )
+    # The live poller follows the Dodgers game itself; the league-wide
+    # scoreboard only needs the fast cadence when the poller is off
+    if settings.LIVE_POLLER_ENABLED:
+        results_trigger = IntervalTrigger(settings.RESULTS_SYNC_IDLE_SECONDS)
+    else:
+        results_trigger = AdaptiveTrigger(
+            settings.RESULTS_SYNC_LIVE_SECONDS, settings.RESULTS_SYNC_IDLE_SECONDS, dodgers_game_in_progress
+        )
+    scheduler.add_job(
+        SYNC_RESULTS, sync_results_job, results_trigger,
+        "Sync scores and final status from the ESPN scoreboard, then weather for newly final games"
+    )
+    scheduler.add_job(
+        SYNC_WEATHER, sync_weather_job, CronTrigger(settings.WEATHER_SYNC_CRON),
+        "Backfill weather for games that don't have it"
+    )
+    scheduler.add_job(
+        SYNC_BOX_SCORES, sync_box_scores_job, CronTrigger(settings.BOX_SCORE_SYNC_CRON),
+        "Store ESPN box scores for final games that don't have them"
+    )
+    scheduler.add_job(
+        SYNC_ROSTER, sync_roster_job, CronTrigger(settings.ROSTER_SYNC_CRON),
+        "Sync the roster from ESPN (at most once a day)"
+    )
+    scheduler.add_job(
+        SYNC_GAME_LOGS, sync_game_logs_job, CronTrigger(settings.GAME_LOG_SYNC_CRON),
+        "Store the roster's ESPN game logs for games played since the last run"
+    )
+
+
+register_sync_jobs()
@@ -0,0 +1,52 @@
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.db.database import Base, engine, SQLALCHEMY_DATABASE_URL
+import app.db.models  # noqa: F401  (registers every table on Base.metadata)
+
+config = context.config
+
+# The app configures its own logging when it runs migrations at startup
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """
+    Emit the migration SQL without connecting (`alembic upgrade head --sql`).
+    """
+    context.configure(
+        url=SQLALCHEMY_DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=SQLALCHEMY_DATABASE_URL.startswith("sqlite"),
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """
+    Run migrations against the app engine (or one passed in by upgrade_database()).
+    Each revision gets its own transaction so data migrations can commit in batches.
+    """
+    connectable = config.attributes.get("engine", engine)
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True,
+            # SQLite can't ALTER most things; batch mode copies the table instead
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
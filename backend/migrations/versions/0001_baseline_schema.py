@@ -0,0 +1,243 @@
+"""Baseline schema
+
+Creates every table as of the first tracked revision. Databases created by
+`create_all` or the old sqlite3 scripts already have most of it, so each
+table, column and index is only added when missing (this replaces
+migrate_add_dodger_result.py, migrate_add_stadiums.py and migrate_add_indexes.py).
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-08-01 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import (
+    add_column_if_missing,
+    create_index_if_missing,
+    create_table_if_missing,
+)
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamps():
+    return [
+        sa.Column('created_at', sa.String(), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.String(), server_default=sa.func.now()),
+    ]
+
+
+def upgrade():
+    create_table_if_missing(
+        'stadiums',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(100), nullable=False, unique=True),
+        sa.Column('city', sa.String(100), nullable=False),
+        sa.Column('state', sa.String(50), nullable=False),
+        sa.Column('country', sa.String(50)),
+        sa.Column('latitude', sa.Float(), nullable=False),
+        sa.Column('longitude', sa.Float(), nullable=False),
+        sa.Column('capacity', sa.Integer()),
+        sa.Column('surface_type', sa.String(50)),
+        sa.Column('roof_type', sa.String(50)),
+        sa.Column('primary_team', sa.String(100)),
+        sa.Column('league', sa.String(10)),
+        sa.Column('is_active', sa.Boolean()),
+        sa.Column('opened_year', sa.Integer()),
+        *_timestamps(),
+    )
+    create_index_if_missing('ix_stadiums_id', 'stadiums', ['id'])
+
+    create_table_if_missing(
+        'teams',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(100), nullable=False, unique=True),
+        sa.Column('city', sa.String(100), nullable=False),
+        sa.Column('state', sa.String(50)),
+        sa.Column('division', sa.String(50)),
+        sa.Column('league', sa.String(20)),
+        sa.Column('founded', sa.Integer()),
+        sa.Column('description', sa.Text()),
+        *_timestamps(),
+    )
+    create_index_if_missing('ix_teams_id', 'teams', ['id'])
+
+    create_table_if_missing(
+        'team_records',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('team', sa.String(100), nullable=False),
+        sa.Column('season', sa.Integer(), nullable=False),
+        sa.Column('wins', sa.Integer(), nullable=False),
+        sa.Column('losses', sa.Integer(), nullable=False),
+        sa.Column('ties', sa.Integer(), nullable=False),
+        sa.Column('home_wins', sa.Integer(), nullable=False),
+        sa.Column('home_losses', sa.Integer(), nullable=False),
+        sa.Column('away_wins', sa.Integer(), nullable=False),
+        sa.Column('away_losses', sa.Integer(), nullable=False),
+        sa.Column('streak', sa.String(5)),
+        sa.Column('recent_results', sa.String(10)),
+        sa.Column('last_game_date', sa.Date()),
+        *_timestamps(),
+        sa.UniqueConstraint('team', 'season', name='uq_team_records_team_season'),
+    )
+    create_index_if_missing('ix_team_records_id', 'team_records', ['id'])
+
+    create_table_if_missing(
+        'players',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('uniform_number', sa.Integer(), nullable=False),
+        sa.Column('height', sa.String(10)),
+        sa.Column('weight', sa.Integer()),
+        sa.Column('birth_date', sa.Date()),
+        sa.Column('bats', sa.String(5)),
+        sa.Column('throws', sa.String(5)),
+        sa.Column('team', sa.String(50)),
+        sa.Column('status', sa.String(20)),
+        *_timestamps(),
+        sa.Column('last_updated', sa.String(), server_default=sa.func.now()),
+        sa.UniqueConstraint('team', 'uniform_number', name='uq_team_uniform_number'),
+    )
+    create_index_if_missing('ix_players_id', 'players', ['id'])
+    create_index_if_missing('ix_players_name', 'players', ['name'])
+    create_index_if_missing('ix_players_status', 'players', ['status'])
+
+    create_table_if_missing(
+        'player_positions',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('player_id', sa.Integer(), sa.ForeignKey('players.id'), nullable=False),
+        sa.Column('position', sa.String(20), nullable=False),
+        sa.Column('is_primary', sa.Boolean()),
+        *_timestamps(),
+    )
+    create_index_if_missing('ix_player_positions_id', 'player_positions', ['id'])
+    create_index_if_missing('ix_player_positions_player_position', 'player_positions', ['player_id', 'position'])
+
+    create_table_if_missing(
+        'games',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('espn_id', sa.String(50), nullable=False, unique=True),
+        sa.Column('game_date', sa.Date(), nullable=False),
+        sa.Column('home_team', sa.String(50), nullable=False),
+        sa.Column('away_team', sa.String(50), nullable=False),
+        sa.Column('home_score', sa.Integer()),
+        sa.Column('away_score', sa.Integer()),
+        sa.Column('venue', sa.String(100)),
+        sa.Column('stadium_id', sa.Integer(), sa.ForeignKey('stadiums.id')),
+        sa.Column('attendance', sa.Integer()),
+        sa.Column('game_time', sa.Time()),
+        sa.Column('game_duration', sa.String(20)),
+        sa.Column('extra_innings', sa.Boolean()),
+        sa.Column('neutral_site', sa.Boolean()),
+        sa.Column('is_final', sa.Boolean()),
+        sa.Column('day_of_week', sa.String(10)),
+        sa.Column('is_night_game', sa.Boolean()),
+        sa.Column('days_since_last_game', sa.Integer()),
+        sa.Column('game_result', sa.String(5)),
+        sa.Column('weather_temp', sa.Integer()),
+        sa.Column('weather_conditions', sa.String(100)),
+        sa.Column('wind_speed', sa.Integer()),
+        sa.Column('wind_direction', sa.String(10)),
+        sa.Column('humidity', sa.Integer()),
+        *_timestamps(),
+    )
+    # Columns the old migration scripts added to early databases
+    add_column_if_missing('games', sa.Column('game_result', sa.String(5)))
+    add_column_if_missing('games', sa.Column('stadium_id', sa.Integer(), sa.ForeignKey('stadiums.id')))
+    create_index_if_missing('ix_games_id', 'games', ['id'])
+    create_index_if_missing('ix_games_game_date', 'games', ['game_date'])
+    create_index_if_missing('ix_games_home_team_date', 'games', ['home_team', 'game_date'])
+    create_index_if_missing('ix_games_away_team_date', 'games', ['away_team', 'game_date'])
+    create_index_if_missing('ix_games_stadium_id', 'games', ['stadium_id'])
+    no_result = sa.text('game_result IS NULL')
+    create_index_if_missing(
+        'ix_games_final_without_result', 'games', ['is_final'],
+        sqlite_where=no_result, postgresql_where=no_result
+    )
+    no_weather = sa.text('weather_temp IS NULL')
+    create_index_if_missing(
+        'ix_games_venue_without_weather', 'games', ['venue'],
+        sqlite_where=no_weather, postgresql_where=no_weather
+    )
+
+    create_table_if_missing(
+        'game_results',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('game_id', sa.Integer(), sa.ForeignKey('games.id'), nullable=False),
+        sa.Column('home_team', sa.String(50), nullable=False),
+        sa.Column('away_team', sa.String(50), nullable=False),
+        sa.Column('home_score', sa.Integer(), nullable=False),
+        sa.Column('away_score', sa.Integer(), nullable=False),
+        sa.Column('home_record_after', sa.String(20)),
+        sa.Column('away_record_after', sa.String(20)),
+        sa.Column('home_hits', sa.Integer()),
+        sa.Column('home_errors', sa.Integer()),
+        sa.Column('home_lob', sa.Integer()),
+        sa.Column('home_risp', sa.String(20)),
+        sa.Column('away_hits', sa.Integer()),
+        sa.Column('away_errors', sa.Integer()),
+        sa.Column('away_lob', sa.Integer()),
+        sa.Column('away_risp', sa.String(20)),
+        *_timestamps(),
+    )
+    create_index_if_missing('ix_game_results_id', 'game_results', ['id'])
+    create_index_if_missing('ix_game_results_game_id', 'game_results', ['game_id'])
+
+    stat_columns = [
+        'at_bats', 'runs', 'hits', 'doubles', 'triples', 'home_runs', 'rbis', 'walks',
+        'strikeouts', 'stolen_bases', 'caught_stealing', 'hit_by_pitch', 'sacrifice_bunts',
+        'sacrifice_flies', 'left_on_base',
+    ]
+    pitching_columns = [
+        'hits_allowed', 'runs_allowed', 'earned_runs', 'walks_allowed', 'strikeouts_pitched',
+        'home_runs_allowed', 'wild_pitches', 'balks', 'hit_batters', 'pitches_thrown', 'strikes_thrown',
+    ]
+    fielding_columns = ['putouts', 'assists', 'errors', 'double_plays', 'passed_balls']
+    create_table_if_missing(
+        'player_game_stats',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('game_id', sa.Integer(), sa.ForeignKey('games.id'), nullable=False),
+        sa.Column('player_id', sa.Integer(), sa.ForeignKey('players.id'), nullable=False),
+        sa.Column('is_starter', sa.Boolean()),
+        sa.Column('position', sa.String(20)),
+        *[sa.Column(name, sa.Integer()) for name in stat_columns],
+        sa.Column('innings_pitched', sa.Float()),
+        *[sa.Column(name, sa.Integer()) for name in pitching_columns],
+        *[sa.Column(name, sa.Integer()) for name in fielding_columns],
+        *[sa.Column(name, sa.Boolean()) for name in ('win', 'loss', 'save', 'hold', 'blown_save')],
+        *_timestamps(),
+    )
+    create_index_if_missing('ix_player_game_stats_id', 'player_game_stats', ['id'])
+    create_index_if_missing('ix_player_game_stats_player_game', 'player_game_stats', ['player_id', 'game_id'])
+    create_index_if_missing('ix_player_game_stats_game_id', 'player_game_stats', ['game_id'])
+
+    create_table_if_missing(
+        'weather_observations',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('stadium_id', sa.Integer(), sa.ForeignKey('stadiums.id'), nullable=False),
+        sa.Column('obs_date', sa.Date(), nullable=False),
+        sa.Column('hour', sa.Integer(), nullable=False),
+        sa.Column('temp_f', sa.Float()),
+        sa.Column('condition', sa.String(100)),
+        sa.Column('wind_mph', sa.Float()),
+        sa.Column('wind_dir', sa.String(10)),
+        sa.Column('humidity', sa.Integer()),
+        sa.Column('precip_in', sa.Float()),
+        sa.Column('created_at', sa.String(), server_default=sa.func.now()),
+        sa.UniqueConstraint('stadium_id', 'obs_date', 'hour', name='uq_weather_stadium_date_hour'),
+    )
+    create_index_if_missing('ix_weather_observations_id', 'weather_observations', ['id'])
+
+
+def downgrade():
+    for table_name in (
+        'weather_observations', 'player_game_stats', 'game_results', 'games',
+        'player_positions', 'players', 'team_records', 'teams', 'stadiums',
+    ):
+        op.drop_table(table_name)
@@ -0,0 +1,69 @@
+"""Add stadiums missing from the original seed
+
+Angel Stadium and Steinbrenner Field (the Rays' 2025 home); replaces add_missing_stadiums.py.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-08-01 00:00:01
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+stadiums = sa.table(
+    'stadiums',
+    sa.column('name', sa.String), sa.column('city', sa.String), sa.column('state', sa.String),
+    sa.column('country', sa.String), sa.column('latitude', sa.Float), sa.column('longitude', sa.Float),
+    sa.column('capacity', sa.Integer), sa.column('surface_type', sa.String), sa.column('roof_type', sa.String),
+    sa.column('primary_team', sa.String), sa.column('league', sa.String), sa.column('is_active', sa.Boolean),
+    sa.column('opened_year', sa.Integer),
+)
+
+MISSING_STADIUMS = [
+    {
+        "name": "Angel Stadium",
+        "city": "Anaheim",
+        "state": "CA",
+        "latitude": 33.8003,
+        "longitude": -117.8827,
+        "primary_team": "Los Angeles Angels",
+        "capacity": 45517,
+        "surface_type": "Grass",
+        "roof_type": "Open",
+        "opened_year": 1966
+    },
+    {
+        "name": "George M. Steinbrenner Field",
+        "city": "Tampa",
+        "state": "FL",
+        "latitude": 27.9806,
+        "longitude": -82.5036,
+        "primary_team": "New York Yankees",
+        "capacity": 11000,
+        "surface_type": "Grass",
+        "roof_type": "Open",
+        "opened_year": 1996
+    }
+]
+
+
+def upgrade():
+    bind = op.get_bind()
+    existing = set(bind.execute(sa.select(stadiums.c.name)).scalars())
+    rows = [
+        dict(stadium, country="USA", league="MLB", is_active=True)
+        for stadium in MISSING_STADIUMS
+        if stadium["name"] not in existing
+    ]
+    if rows:
+        op.bulk_insert(stadiums, rows)
+
+
+def downgrade():
+    op.execute(stadiums.delete().where(stadiums.c.name.in_([s["name"] for s in MISSING_STADIUMS])))
@@ -0,0 +1,73 @@
+"""Backfill games.stadium_id and games.game_result
+
+Online data migration: rows are updated one id range at a time, each range
+in its own short transaction, so syncs and reads keep running meanwhile.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-08-01 00:00:02
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.db.migration_helpers import backfill_in_batches
+from app.services.stadium_resolver import StadiumResolver
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+DODGERS = 'Los Angeles Dodgers'
+
+games = sa.table(
+    'games',
+    sa.column('id', sa.Integer), sa.column('venue', sa.String), sa.column('stadium_id', sa.Integer),
+    sa.column('home_team', sa.String), sa.column('away_team', sa.String),
+    sa.column('home_score', sa.Integer), sa.column('away_score', sa.Integer),
+    sa.column('is_final', sa.Boolean), sa.column('game_result', sa.String),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+
+    # Venue names -> stadium IDs with the same matching the syncs use
+    venues = bind.execute(
+        sa.select(games.c.venue).where(games.c.stadium_id.is_(None), games.c.venue.isnot(None)).distinct()
+    ).scalars().all()
+    resolver = StadiumResolver()
+    session = Session(bind=bind)
+    stadium_ids = {venue: resolver.resolve(session, venue) for venue in venues}
+    session.close()
+
+    for venue, stadium_id in stadium_ids.items():
+        if stadium_id is not None:
+            backfill_in_batches(
+                games, {'stadium_id': stadium_id},
+                sa.and_(games.c.venue == venue, games.c.stadium_id.is_(None))
+            )
+
+    dodgers_won = sa.or_(
+        sa.and_(games.c.home_team == DODGERS, games.c.home_score > games.c.away_score),
+        sa.and_(games.c.away_team == DODGERS, games.c.away_score > games.c.home_score)
+    )
+    backfill_in_batches(
+        games,
+        {'game_result': sa.case((dodgers_won, 'W'), else_='L')},
+        sa.and_(
+            games.c.is_final == sa.true(),
+            games.c.game_result.is_(None),
+            games.c.home_score.isnot(None),
+            games.c.away_score.isnot(None),
+            sa.or_(games.c.home_team == DODGERS, games.c.away_team == DODGERS)
+        )
+    )
+
+
+def downgrade():
+    # Derived data; nothing to undo
+    pass
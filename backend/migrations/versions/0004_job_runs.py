@@ -0,0 +1,38 @@
+"""Job run history
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-08-15 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'job_runs',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('job_name', sa.String(50), nullable=False),
+        sa.Column('trigger', sa.String(20), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('progress', sa.Float()),
+        sa.Column('message', sa.String(200)),
+        sa.Column('result', sa.Text()),
+        sa.Column('error', sa.Text()),
+        sa.Column('started_at', sa.DateTime(), server_default=sa.func.now()),
+        sa.Column('finished_at', sa.DateTime()),
+    )
+    op.create_index('ix_job_runs_id', 'job_runs', ['id'])
+    op.create_index('ix_job_runs_job_name_id', 'job_runs', ['job_name', 'id'])
+    op.create_index('ix_job_runs_status', 'job_runs', ['status'])
+
+
+def downgrade():
+    op.drop_table('job_runs')
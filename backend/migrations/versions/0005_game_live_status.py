@@ -0,0 +1,28 @@
+"""Live game status columns
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-08-20 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('games', sa.Column('game_state', sa.String(10)))
+    op.add_column('games', sa.Column('inning', sa.Integer()))
+    op.add_column('games', sa.Column('status_detail', sa.String(50)))
+
+
+def downgrade():
+    with op.batch_alter_table('games') as batch_op:
+        batch_op.drop_column('status_detail')
+        batch_op.drop_column('inning')
+        batch_op.drop_column('game_state')
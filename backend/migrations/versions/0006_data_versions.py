@@ -0,0 +1,32 @@
+"""Data version counters
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-08-22 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    data_versions = op.create_table(
+        'data_versions',
+        sa.Column('name', sa.String(50), primary_key=True),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.bulk_insert(data_versions, [
+        {'name': 'games', 'version': 1},
+        {'name': 'roster', 'version': 1},
+    ])
+
+
+def downgrade():
+    op.drop_table('data_versions')
@@ -0,0 +1,36 @@
+"""Identify players by ESPN ID
+
+Adds players.espn_id (unique) for the differential roster sync and drops the
+team + uniform number unique constraint, which inactive players and shared
+numbers violate.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-08-25 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import (
+    add_column_if_missing, create_index_if_missing, drop_unique_constraint_if_present
+)
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_column_if_missing('players', sa.Column('espn_id', sa.String(20)))
+    create_index_if_missing('ix_players_espn_id', 'players', ['espn_id'], unique=True)
+    drop_unique_constraint_if_present('players', 'uq_team_uniform_number')
+
+
+def downgrade():
+    with op.batch_alter_table('players') as batch_op:
+        batch_op.drop_index('ix_players_espn_id')
+        batch_op.drop_column('espn_id')
+        batch_op.create_unique_constraint('uq_team_uniform_number', ['team', 'uniform_number'])
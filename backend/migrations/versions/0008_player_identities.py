@@ -0,0 +1,29 @@
+"""ESPN player identity registry
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-08-27 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'player_identities',
+        sa.Column('espn_id', sa.String(20), primary_key=True),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('slug', sa.String(100)),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now()),
+    )
+
+
+def downgrade():
+    op.drop_table('player_identities')
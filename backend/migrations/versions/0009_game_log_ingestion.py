@@ -0,0 +1,42 @@
+"""Game-log ingestion: one stat line per player and game, per-player checkpoints
+
+Makes ix_player_game_stats_player_game unique (the ingestion upserts on it),
+keeping the first line of any duplicates, and adds game_log_checkpoints.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-08-29 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "DELETE FROM player_game_stats WHERE id NOT IN "
+        "(SELECT MIN(id) FROM player_game_stats GROUP BY player_id, game_id)"
+    )
+    op.drop_index('ix_player_game_stats_player_game', table_name='player_game_stats')
+    op.create_index('ix_player_game_stats_player_game', 'player_game_stats', ['player_id', 'game_id'], unique=True)
+
+    op.create_table(
+        'game_log_checkpoints',
+        sa.Column('player_id', sa.Integer(), sa.ForeignKey('players.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('season', sa.Integer(), primary_key=True),
+        sa.Column('synced_through', sa.Date(), nullable=False),
+        sa.Column('games', sa.Integer()),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now()),
+    )
+
+
+def downgrade():
+    op.drop_table('game_log_checkpoints')
+    op.drop_index('ix_player_game_stats_player_game', table_name='player_game_stats')
+    op.create_index('ix_player_game_stats_player_game', 'player_game_stats', ['player_id', 'game_id'])
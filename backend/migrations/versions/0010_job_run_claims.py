@@ -0,0 +1,41 @@
+"""Atomic job run claims
+
+Adds job_runs.owner (host:pid of the process running a job) and a partial
+unique index allowing one "running" row per job. Older duplicate running
+rows are marked failed first.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2025-09-02 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import add_column_if_missing
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_column_if_missing('job_runs', sa.Column('owner', sa.String(100)))
+    op.execute(
+        "UPDATE job_runs SET status = 'failed', error = 'Superseded by a newer run' "
+        "WHERE status = 'running' AND id NOT IN "
+        "(SELECT MAX(id) FROM job_runs WHERE status = 'running' GROUP BY job_name)"
+    )
+    running = sa.text("status = 'running'")
+    op.create_index(
+        'ux_job_runs_running', 'job_runs', ['job_name'], unique=True,
+        sqlite_where=running, postgresql_where=running
+    )
+
+
+def downgrade():
+    op.drop_index('ux_job_runs_running', table_name='job_runs')
+    with op.batch_alter_table('job_runs') as batch_op:
+        batch_op.drop_column('owner')
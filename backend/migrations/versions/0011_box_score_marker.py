@@ -0,0 +1,40 @@
+"""Box score marker on games
+
+Adds games.box_score_synced_at, set when a game's box score is stored, so the
+box score job no longer refetches games whose summary has no team stats.
+Games that already have team hits on their result are marked as synced.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2025-09-03 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import add_column_if_missing
+
+# revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_column_if_missing('games', sa.Column('box_score_synced_at', sa.DateTime()))
+    op.execute(
+        "UPDATE games SET box_score_synced_at = CURRENT_TIMESTAMP WHERE box_score_synced_at IS NULL AND id IN "
+        "(SELECT game_id FROM game_results WHERE home_hits IS NOT NULL)"
+    )
+    missing = sa.text("box_score_synced_at IS NULL")
+    op.create_index(
+        'ix_games_final_without_box_score', 'games', ['is_final'],
+        sqlite_where=missing, postgresql_where=missing
+    )
+
+
+def downgrade():
+    op.drop_index('ix_games_final_without_box_score', table_name='games')
+    with op.batch_alter_table('games') as batch_op:
+        batch_op.drop_column('box_score_synced_at')
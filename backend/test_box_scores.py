@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Box score ingestion checks, using a saved ESPN /summary response (fixtures/):
+batting, pitching and fielding land on our players' stat lines in one bulk
+write without clearing stats the game logs stored, team hits/errors/LOB/RISP
+on the game result, and the batch mode fetches only final games that are
+still missing a box score, including games whose summary had no team stats.
+
+Run with `python test_box_scores.py` or `python -m pytest test_box_scores.py`.
+"""
+
+import sys
+import os
+import copy
+import json
+from datetime import date
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.models import Game, GameResult, Player, PlayerGameStats
+from app.db.query_counter import count_queries
+from app.services.box_score_service import BoxScoreService
+from testing import FakeUpstream, fake_upstream, new_database
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "espn_summary_lad_sd.json")
+
+with open(FIXTURE, encoding="utf-8") as f:
+    SUMMARY = json.load(f)
+
+
+def espn_summaries(summary=SUMMARY):
+    """Serves `summary` for every /summary request, recording the requested events."""
+    return FakeUpstream(lambda url, params: summary, key=lambda url, params: params["event"])
+
+
+def make_session():
+    # Fetches run on worker threads; the in-memory database must outlive them
+    engine, db = new_database(threads=True)
+    for day in range(1, 5):
+        db.add(Game(
+            espn_id=f"40169630{day}", game_date=date(2025, 9, day),
+            home_team="Los Angeles Dodgers", away_team="San Diego Padres",
+            home_score=5, away_score=2, is_final=day < 4
+        ))
+    db.add_all([
+        Player(name="Shohei Ohtani", uniform_number=17, espn_id="39832"),
+        Player(name="Freddie Freeman", uniform_number=5, espn_id="30193"),
+        Player(name="Max Muncy", uniform_number=13, espn_id="31662"),
+        Player(name="Blake Treinen", uniform_number=49, espn_id="28976"),
+        Player(name="Mookie Betts", uniform_number=50),  # Saved before ESPN IDs were recorded
+    ])
+    db.commit()
+    return engine, db
+
+
+def run(db, espn, call):
+    with fake_upstream(fetch_json=espn):
+        return call(BoxScoreService(db))
+
+
+def line(db, player_name, espn_id="401696301"):
+    return db.query(PlayerGameStats).join(Game).join(Player).filter(
+        Player.name == player_name, Game.espn_id == espn_id
+    ).one()
+
+
+def test_parses_box_score():
+    service = BoxScoreService(None)
+    batting = service.parse_player_batting_stats(SUMMARY)
+    assert len(batting) == 13
+    assert batting["39832"]["home_runs"] == 1 and batting["39832"]["position"] == "DH"
+
+    pitching = service.parse_player_pitching_stats(SUMMARY)
+    assert pitching["4872598"]["innings_pitched"] == 4.67 and pitching["4872598"]["win"]
+    assert (pitching["33172"]["pitches_thrown"], pitching["33172"]["strikes_thrown"]) == (98, 64)
+
+    assert service.parse_team_stats(SUMMARY) == {
+        "home": {"hits": 9, "errors": 1, "lob": 7, "risp": "3-9"},
+        "away": {"hits": 6, "errors": 1, "lob": 5, "risp": "1-6"},
+    }
+
+
+def test_stores_game_in_one_bulk_write():
+    engine, db = make_session()
+    # A game-log line already exists; box score columns update it in place
+    game = db.query(Game).filter(Game.espn_id == "401696301").one()
+    freeman = db.query(Player).filter(Player.name == "Freddie Freeman").one()
+    db.add(PlayerGameStats(game_id=game.id, player_id=freeman.id, hits=1, doubles=1))
+    db.commit()
+
+    with count_queries(engine) as counter:
+        result = run(db, espn_summaries(), lambda service: service.sync_game_player_stats("401696301"))
+    assert result["synced"] and result["players"] == 5
+    stat_writes = [s for s in counter.statements if "player_game_stats" in s and s.lstrip().upper().startswith("INSERT")]
+    assert len(stat_writes) == 1, stat_writes
+
+    db.expire_all()
+    ohtani = line(db, "Shohei Ohtani")
+    assert (ohtani.at_bats, ohtani.hits, ohtani.home_runs, ohtani.rbis) == (4, 2, 1, 3)
+    assert (ohtani.innings_pitched, ohtani.strikeouts_pitched, ohtani.is_starter, ohtani.position) == (3.0, 4, True, "DH")
+    assert line(db, "Blake Treinen").save and not line(db, "Blake Treinen").win
+    assert (line(db, "Max Muncy").assists, line(db, "Max Muncy").errors) == (3, 1)
+    assert line(db, "Mookie Betts").hits == 1  # Matched by name
+    assert (line(db, "Freddie Freeman").hits, line(db, "Freddie Freeman").doubles) == (2, 1)
+    assert db.query(PlayerGameStats).count() == 5
+
+    # Null batting columns of a pitcher-only line don't clear the game log's
+    game = db.query(Game).filter(Game.espn_id == "401696301").one()
+    treinen = db.query(Player).filter(Player.name == "Blake Treinen").one()
+    db.query(PlayerGameStats).filter(PlayerGameStats.player_id == treinen.id).update({PlayerGameStats.at_bats: 1})
+    db.commit()
+    run(db, espn_summaries(), lambda service: service.sync_game_player_stats("401696301"))
+    db.expire_all()
+    assert (line(db, "Blake Treinen").at_bats, line(db, "Blake Treinen").save) == (1, True)
+
+    result_row = db.query(GameResult).one()
+    assert (result_row.home_hits, result_row.home_errors, result_row.home_lob, result_row.home_risp) == (9, 1, 7, "3-9")
+    assert (result_row.away_hits, result_row.away_lob, result_row.away_risp) == (6, 5, "1-6")
+
+
+def test_batch_ingests_missing_games_and_resumes():
+    engine, db = make_session()
+    run(db, espn_summaries(), lambda service: service.sync_game_player_stats("401696301"))
+
+    espn = espn_summaries()
+    espn.failing = {"401696303"}
+    result = run(db, espn, lambda service: service.sync_missing_box_scores())
+    # Game 1 already has its box score and game 4 isn't final
+    assert sorted(espn.requested) == ["401696302", "401696303"]
+    assert result["games"] == 1 and [failure["espn_id"] for failure in result["failures"]] == ["401696303"]
+
+    espn = espn_summaries()
+    result = run(db, espn, lambda service: service.sync_missing_box_scores())
+    assert espn.requested == ["401696303"] and result["games"] == 1
+    assert db.query(PlayerGameStats).count() == 15
+    assert db.query(GameResult).filter(GameResult.home_hits == 9).count() == 3
+
+
+def test_game_without_team_stats_not_refetched():
+    engine, db = make_session()
+    summary = copy.deepcopy(SUMMARY)
+    summary["boxscore"]["teams"] = []
+    for competitor in summary["header"]["competitions"][0]["competitors"]:
+        competitor.pop("hits", None)
+        competitor.pop("errors", None)
+
+    espn = espn_summaries(summary)
+    result = run(db, espn, lambda service: service.sync_missing_box_scores())
+    assert result["games"] == 3 and db.query(GameResult).filter(GameResult.home_hits.isnot(None)).count() == 0
+
+    espn = espn_summaries(summary)
+    run(db, espn, lambda service: service.sync_missing_box_scores())
+    assert espn.requested == []
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
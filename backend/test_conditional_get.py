@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Conditional GET checks: read endpoints carry ETags built from data versions,
+answer a current If-None-Match with 304 without touching the data, and get a
+new ETag once a write bumps the version. Cached bodies are served with just
+the version lookup and dropped when the write commits.
+
+Run with `python test_conditional_get.py` or `python -m pytest test_conditional_get.py`.
+"""
+
+import sys
+import os
+import json
+from datetime import date
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import Request
+
+from app.api.games import get_dodgers_games
+from app.api.roster import get_roster
+from app.core.read_cache import read_cache, LocalCache
+from app.db.data_versions import bump_version, get_versions, GAMES, ROSTER
+from app.db.models import Game, Player
+from app.db.query_counter import assert_max_queries
+from app.services.player_service import PlayerService
+from app.db.schemas import PlayerUpdate
+from testing import new_database
+
+
+def make_session():
+    """In-memory database with one game and one player."""
+    # Also clears the read cache: versions restart at 1 in every test database
+    engine, db = new_database()
+    db.add(Game(espn_id="1", game_date=date(2025, 4, 1), home_team="Los Angeles Dodgers", away_team="San Diego Padres"))
+    db.add(Player(name="Mookie Betts", uniform_number=50))
+    db.commit()
+    return engine, db
+
+
+def make_request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "query_string": b""})
+
+
+def test_etag_and_not_modified():
+    engine, db = make_session()
+    response = get_dodgers_games(make_request(), db=db, limit=10)
+    assert len(json.loads(response.body)) == 1
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    assert "max-age" in response.headers["cache-control"]
+
+    # A current tag is answered with a single version lookup and no body
+    with assert_max_queries(engine, 1):
+        not_modified = get_dodgers_games(make_request(etag), db=db, limit=10)
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+
+
+def test_write_changes_etag():
+    engine, db = make_session()
+    etag = get_roster(make_request(), db=db).headers["etag"]
+
+    player = db.query(Player).first()
+    PlayerService(db).update_player(player.id, PlayerUpdate(status="Injured"))
+
+    response = get_roster(make_request(etag), db=db)
+    assert response.status_code == 200
+    assert json.loads(response.body)[0]["status"] == "Injured"
+    assert response.headers["etag"] != etag
+
+
+def test_cached_body_and_invalidation():
+    engine, db = make_session()
+    read_cache._backend = LocalCache(max_entries=8, ttl=60)
+
+    first = get_dodgers_games(make_request(), db=db, limit=10)
+    # A cache hit costs only the version lookup
+    with assert_max_queries(engine, 1):
+        second = get_dodgers_games(make_request(), db=db, limit=10)
+    assert second.body == first.body
+    assert len(read_cache.backend) == 1
+
+    # Committing a write drops the group's entries and the next read rebuilds
+    game = db.query(Game).first()
+    game.home_score = 5
+    bump_version(db, GAMES)
+    db.commit()
+    assert len(read_cache.backend) == 0
+    assert json.loads(get_dodgers_games(make_request(), db=db, limit=10).body)[0]["home_score"] == 5
+
+    # A rolled back write keeps them
+    bump_version(db, GAMES)
+    db.rollback()
+    get_dodgers_games(make_request(), db=db, limit=10)
+    assert len(read_cache.backend) == 1
+    read_cache._backend = None
+
+
+def test_local_cache_lru_and_ttl():
+    cache = LocalCache(max_entries=2, ttl=60)
+    cache.set("games:1:a", b"a")
+    cache.set("games:1:b", b"b")
+    cache.get("games:1:a")
+    cache.set("roster:1:c", b"c")
+    assert cache.get("games:1:b") is None  # least recently used
+    assert cache.get("games:1:a") == b"a"
+    cache.invalidate("games:")
+    assert cache.get("games:1:a") is None and cache.get("roster:1:c") == b"c"
+
+    expired = LocalCache(max_entries=2, ttl=-1)
+    expired.set("k", b"v")
+    assert expired.get("k") is None
+
+
+def test_bump_version():
+    engine, db = make_session()
+    assert get_versions(db, [GAMES, ROSTER]) == {GAMES: 1, ROSTER: 1}
+    bump_version(db, GAMES)
+    bump_version(db, GAMES)
+    db.commit()
+    assert get_versions(db, [GAMES, ROSTER]) == {GAMES: 3, ROSTER: 1}
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Database engine checks: DATABASE_URL is taken from the environment in every
+ENVIRONMENT and provider-style postgres:// URLs are normalized, server
+databases get the configured connection pool, and SQLite connections are
+opened in WAL mode with the configured pragmas.
+
+Run with `python test_database.py` or `python -m pytest test_database.py`.
+"""
+
+import sys
+import os
+import subprocess
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, event, text
+
+from app.core.config import settings
+from app.db import database
+from testing import temp_database_url
+
+BACKEND = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_database_url_normalization():
+    assert database._database_url("postgres://u:p@db:5432/dodgers") == "postgresql+psycopg2://u:p@db:5432/dodgers"
+    assert database._database_url("postgresql://u:p@db/dodgers") == "postgresql+psycopg2://u:p@db/dodgers"
+    assert database._database_url("postgresql+psycopg2://db/dodgers") == "postgresql+psycopg2://db/dodgers"
+    assert database._database_url("sqlite:///./dodgers.db") == "sqlite:///./dodgers.db"
+
+
+def test_database_url_survives_environment_overrides():
+    url = temp_database_url("prod")
+    env = dict(os.environ, ENVIRONMENT="production", DATABASE_URL=url)
+    output = subprocess.run(
+        [sys.executable, "-c", "from app.core.config import settings; print(settings.DATABASE_URL)"],
+        cwd=BACKEND, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == url
+
+
+def test_server_databases_are_pooled():
+    options = database._engine_options("postgresql+psycopg2://db/dodgers")
+    assert options == {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+    original = settings.DB_POOL_SIZE
+    settings.DB_POOL_SIZE = 20
+    try:
+        assert database._engine_options("postgresql+psycopg2://db/dodgers")["pool_size"] == 20
+    finally:
+        settings.DB_POOL_SIZE = original
+
+    # SQLite keeps the default pool, shared across the threadpool's threads
+    assert database._engine_options("sqlite:///./dodgers.db") == {"connect_args": {"check_same_thread": False}}
+
+
+def test_sqlite_connections_use_wal():
+    url = temp_database_url("wal")
+    engine = create_engine(url, **database._engine_options(url))
+    event.listen(engine, "connect", database._set_sqlite_pragmas)
+
+    with engine.connect() as connection:
+        pragma = lambda name: connection.execute(text(f"PRAGMA {name}")).scalar()
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("busy_timeout") == settings.SQLITE_BUSY_TIMEOUT_MS
+    engine.dispose()
+
+    # The application engine registers the pragmas when it is SQLite
+    assert event.contains(database.engine, "connect", database._set_sqlite_pragmas) == (
+        database.engine.dialect.name == "sqlite"
+    )
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
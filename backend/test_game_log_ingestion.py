@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Roster game-log ingestion checks, using a saved ESPN game log page (fixtures/)
+for every player: rows land on the right games (doubleheaders, old team
+abbreviations), re-runs skip players that are up to date, a run that failed
+part-way resumes with only the players it missed, games that go final after
+a later game (doubleheaders, suspended games) are still picked up, and a page
+that matches nothing leaves no checkpoint, and pitchers (whose logs are
+pitching lines) are skipped rather than fetched on every run.
+
+Run with `python test_game_log_ingestion.py` or `python -m pytest test_game_log_ingestion.py`.
+"""
+
+import sys
+import os
+from datetime import date, time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.models import Game, GameLogCheckpoint, Player, PlayerGameStats, PlayerPosition
+from app.services.player_game_service import PlayerGameService
+from testing import FakeUpstream, fake_upstream, new_database
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "espn_gamelog_lad.html")
+
+with open(FIXTURE, encoding="utf-8") as f:
+    GAME_LOG_PAGE = f.read()
+
+# (date, opponent, Dodgers at home, start time) of the games in the fixture
+SCHEDULE = [
+    (date(2025, 7, 29), "Chicago White Sox", True, time(19, 10)),
+    (date(2025, 7, 30), "Athletics", False, time(19, 5)),
+    (date(2025, 7, 31), "Tampa Bay Rays", True, time(19, 10)),
+    (date(2025, 8, 24), "San Diego Padres", False, time(13, 10)),
+    (date(2025, 8, 26), "Cincinnati Reds", False, time(12, 10)),
+    (date(2025, 8, 26), "Cincinnati Reds", False, time(18, 40)),
+    (date(2025, 8, 27), "Cincinnati Reds", False, time(15, 40)),
+    (date(2025, 8, 29), "Arizona Diamondbacks", True, time(19, 10)),
+    (date(2025, 8, 30), "Arizona Diamondbacks", True, time(18, 10)),
+]
+
+
+def espn_game_logs(page=GAME_LOG_PAGE):
+    """Serves `page` for every game log URL, recording the players' ESPN IDs."""
+    return FakeUpstream(lambda url, params: page, key=lambda url, params: url.split("/")[-2])
+
+
+def make_session(final_through=date(2025, 8, 30), pending=()):
+    # Fetches run on worker threads; the in-memory database must outlive them
+    _, db = new_database(threads=True)
+    for number, (day, opponent, home, start) in enumerate(SCHEDULE):
+        db.add(Game(
+            espn_id=f"4015{number:02d}", game_date=day, game_time=start,
+            home_team="Los Angeles Dodgers" if home else opponent,
+            away_team=opponent if home else "Los Angeles Dodgers",
+            is_final=day <= final_through and f"4015{number:02d}" not in pending
+        ))
+    db.add_all([
+        # A two-way player bats as the DH; only primary pitchers are skipped
+        Player(name="Shohei Ohtani", uniform_number=17, espn_id="39832", status="Active", positions=[
+            PlayerPosition(position="DH", is_primary=True), PlayerPosition(position="SP", is_primary=False)
+        ]),
+        Player(name="Freddie Freeman", uniform_number=5, espn_id="30193", status="Active"),
+        Player(name="Mookie Betts", uniform_number=50, espn_id="33039", status="Active"),
+        Player(name="Clayton Kershaw", uniform_number=22, espn_id="28963", status="Inactive"),
+        Player(name="Yoshinobu Yamamoto", uniform_number=18, espn_id="4683219", status="Active",
+               positions=[PlayerPosition(position="SP", is_primary=True)]),
+    ])
+    db.commit()
+    return db
+
+
+def ingest(db, espn, **kwargs):
+    with fake_upstream(fetch_text=espn):
+        return PlayerGameService(db).ingest_game_logs(**kwargs)
+
+
+def stat_line(db, player_name, day, start=None):
+    query = db.query(PlayerGameStats).join(Game).join(Player).filter(
+        Player.name == player_name, Game.game_date == day
+    )
+    if start:
+        query = query.filter(Game.game_time == start)
+    return query.one()
+
+
+def test_ingests_roster_game_logs():
+    db = make_session()
+    espn = espn_game_logs()
+    result = ingest(db, espn)
+
+    assert result["synced"] and result["failures"] == []
+    assert result["players_fetched"] == 3 and result["stored"] == 27
+    assert len(espn.requested) == 3  # Inactive players and pitchers are not fetched
+    assert result["skipped_pitchers"] == ["Yoshinobu Yamamoto"]
+    assert db.query(PlayerGameStats).count() == 27
+
+    ohtani_hr = stat_line(db, "Shohei Ohtani", date(2025, 8, 29))
+    assert (ohtani_hr.at_bats, ohtani_hr.hits, ohtani_hr.home_runs, ohtani_hr.rbis) == (5, 3, 1, 2)
+    # Doubleheader rows are listed newest first; each lands on its own game
+    assert stat_line(db, "Mookie Betts", date(2025, 8, 26), time(12, 10)).hits == 2
+    assert stat_line(db, "Mookie Betts", date(2025, 8, 26), time(18, 40)).hits == 0
+    # "@OAK" is the Athletics, "vs CWS" the White Sox
+    assert stat_line(db, "Freddie Freeman", date(2025, 7, 30)).strikeouts == 3
+    assert stat_line(db, "Freddie Freeman", date(2025, 7, 29)).home_runs == 2
+
+    checkpoints = db.query(GameLogCheckpoint).all()
+    assert len(checkpoints) == 3
+    assert {checkpoint.synced_through for checkpoint in checkpoints} == {date(2025, 8, 30)}
+
+
+def test_rerun_skips_players_up_to_date():
+    db = make_session()
+    ingest(db, espn_game_logs())
+
+    espn = espn_game_logs()
+    result = ingest(db, espn)
+    assert espn.requested == []
+    assert result["players_up_to_date"] == 3 and result["stored"] == 0
+    # The pitcher has no checkpoint but is still not pending
+    assert result["players_fetched"] == 0 and result["skipped_pitchers"] == ["Yoshinobu Yamamoto"]
+
+    # A forced run refetches and updates the same lines in place
+    result = ingest(db, espn, force=True)
+    assert result["stored"] == 27 and len(espn.requested) == 3
+    assert db.query(PlayerGameStats).count() == 27
+
+
+def test_interrupted_run_resumes():
+    db = make_session(final_through=date(2025, 8, 27))
+    espn = espn_game_logs()
+    espn.failing = {"30193"}
+    result = ingest(db, espn)
+    assert [failure["player"] for failure in result["failures"]] == ["Freddie Freeman"]
+    assert result["stored"] == 14  # Two players, games through 8/27
+
+    # Resuming only fetches the player that failed
+    espn = espn_game_logs()
+    result = ingest(db, espn)
+    assert espn.requested == ["30193"]
+    assert result["players_up_to_date"] == 2 and result["stored"] == 7
+
+    # Once more games are final, only the new rows are written
+    db.query(Game).update({Game.is_final: True})
+    db.commit()
+    result = ingest(db, espn_game_logs())
+    assert result["players_fetched"] == 3 and result["stored"] == 6
+    assert db.query(PlayerGameStats).count() == 27
+
+
+def test_game_final_after_later_games_is_ingested():
+    # Game 2 of the 8/26 doubleheader is suspended and finished after 8/30
+    db = make_session(pending={"401505"})
+    assert ingest(db, espn_game_logs())["stored"] == 24
+
+    db.query(Game).update({Game.is_final: True})
+    db.commit()
+    espn = espn_game_logs()
+    result = ingest(db, espn)
+    assert result["players_fetched"] == 3 and result["stored"] == 3
+    assert stat_line(db, "Mookie Betts", date(2025, 8, 26), time(18, 40)).hits == 0
+    assert ingest(db, espn_game_logs())["players_up_to_date"] == 3
+
+
+def test_unmatched_page_leaves_no_checkpoint():
+    db = make_session()
+    espn = espn_game_logs("<html><body>No games</body></html>")
+    result = ingest(db, espn)
+    assert result["stored"] == 0 and result["failures"] == []
+    assert db.query(GameLogCheckpoint).count() == 0
+
+    # Fetched again on the next run
+    espn = espn_game_logs()
+    assert ingest(db, espn)["stored"] == 27 and len(espn.requested) == 3
+
+
+def test_season_from_latest_game():
+    db = make_session()
+    assert PlayerGameService(db).season == 2025
+    db.add(Game(espn_id="401600", game_date=date(2026, 3, 26), home_team="Los Angeles Dodgers", away_team="Atlanta Braves"))
+    db.commit()
+    assert PlayerGameService(db).season == 2026
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Upstream response cache checks: garbage collection removes blobs left behind
+when a payload changes (live game summaries), entries past their maximum age,
+and the least recently fetched entries once the cache is over its size cap.
+Cached fetches only take a rate limiter token when they go to the network.
+
+Run with `python test_http_cache.py` or `python -m pytest test_http_cache.py`.
+"""
+
+import sys
+import os
+import json
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core import http
+from app.core.http_cache import ResponseCache, ORPHAN_GRACE_SECONDS
+
+
+def make_cache():
+    cache = ResponseCache(tempfile.mkdtemp())
+    cache._last_gc = time.time()  # Collect only when the test asks
+    return cache
+
+
+def backdate(cache, key, seconds):
+    """Pretend the entry under `key` (and its blob) was fetched `seconds` ago."""
+    entry = cache.lookup(key)
+    entry["fetched_at"] -= seconds
+    cache._atomic_write(cache._meta_path(key), json.dumps(entry).encode("utf-8"))
+    then = time.time() - seconds
+    os.utime(cache._blob_path(entry["content_hash"]), (then, then))
+
+
+def blob_count(cache):
+    return sum(len(names) for _, _, names in os.walk(os.path.join(cache.cache_dir, "blobs")))
+
+
+def test_superseded_blobs_removed():
+    cache = make_cache()
+    key = cache.request_key("https://espn.test/summary", {"event": "401696301"})
+    for inning in range(1, 4):
+        cache.store(key, "https://espn.test/summary", json.dumps({"inning": inning}).encode(), None, None)
+        backdate(cache, key, ORPHAN_GRACE_SECONDS + 1)
+    assert blob_count(cache) == 3
+
+    assert cache.collect_garbage() == {"entries": 0, "blobs": 2}
+    assert cache.read_json(cache.lookup(key)) == {"inning": 3}
+
+
+def test_recent_orphans_kept():
+    # A blob written moments ago may belong to a store() whose entry isn't written yet
+    cache = make_cache()
+    key = cache.request_key("https://espn.test/summary")
+    cache.store(key, "https://espn.test/summary", b"old", None, None)
+    cache.store(key, "https://espn.test/summary", b"new", None, None)
+    assert cache.collect_garbage() == {"entries": 0, "blobs": 0}
+    assert blob_count(cache) == 2
+
+
+def test_expired_and_oversized_entries_removed():
+    cache = make_cache()
+    keys = [cache.request_key("https://espn.test/page", {"n": n}) for n in range(4)]
+    for n, key in enumerate(keys):
+        cache.store(key, "https://espn.test/page", bytes([n]) * 100, None, None)
+        backdate(cache, key, (4 - n) * 100)  # keys[0] is the least recently fetched
+
+    # keys[0] is past the maximum age; keys[1] goes to fit two blobs in 250 bytes
+    assert cache.collect_garbage(max_age=350, max_bytes=250) == {"entries": 2, "blobs": 2}
+    assert [cache.lookup(key) is not None for key in keys] == [False, False, True, True]
+    assert blob_count(cache) == 2
+
+    # A blob shared by two entries stays while either still needs it
+    shared = cache.request_key("https://espn.test/mirror")
+    cache.store(shared, "https://espn.test/mirror", bytes([3]) * 100, None, None)
+    backdate(cache, shared, 250)
+    assert cache.collect_garbage(max_age=350, max_bytes=100) == {"entries": 2, "blobs": 1}
+    assert cache.lookup(shared) is None and cache.read_text(cache.lookup(keys[3])) == "\x03" * 100
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.tokens = 0
+
+    def acquire(self):
+        self.tokens += 1
+
+
+class FakeSession:
+    """Answers every GET with the same page and an ETag; stale revalidations get a 304."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        response = type("Response", (), {})()
+        response.status_code = 304 if (headers or {}).get("If-None-Match") == '"v1"' else 200
+        response.content = b"<html>game log</html>"
+        response.text = response.content.decode()
+        response.headers = {"ETag": '"v1"'}
+        response.raise_for_status = lambda: None
+        return response
+
+
+def test_limiter_only_for_network_fetches():
+    cache, session, limiter = make_cache(), FakeSession(), CountingLimiter()
+    original_cache, original_session = http.response_cache, http._session
+    http.response_cache, http._session = cache, session
+    try:
+        fetch = lambda: http.fetch_text("https://espn.test/gamelog", cache="gamelog", limiter=limiter)
+        assert fetch() == "<html>game log</html>"
+        assert (len(session.requests), limiter.tokens) == (1, 1)
+
+        # A fresh entry is served from disk without a token
+        assert fetch() == "<html>game log</html>"
+        assert (len(session.requests), limiter.tokens) == (1, 1)
+
+        # A stale one is revalidated over the network, which does take one
+        backdate(cache, cache.request_key("https://espn.test/gamelog"), 10 ** 6)
+        assert fetch() == "<html>game log</html>"
+        assert (len(session.requests), limiter.tokens) == (2, 2)
+        assert session.requests[-1]["If-None-Match"] == '"v1"'
+    finally:
+        http.response_cache, http._session = original_cache, original_session
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Cold-start checks: importing the app must be side-effect free, must not load
+the scraping/migration dependencies, and must stay within an import-time budget
+measured with `python -X importtime`.
+
+Run with `python test_import_time.py` or `python -m pytest test_import_time.py`.
+Override the budget with IMPORT_TIME_BUDGET_MS (e.g. on slow CI machines).
+"""
+
+import sys
+import os
+import re
+import subprocess
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Best of several runs, in milliseconds
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1200"))
+RUNS = 3
+
+# Only needed by sync jobs, migrations or `python -m app.main`
+LAZY_MODULES = ["bs4", "lxml", "requests", "urllib3", "alembic", "uvicorn"]
+
+
+def run_import(code: str, cwd: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=BACKEND_DIR, PYTHONDONTWRITEBYTECODE="1")
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def import_time_ms(module: str, stderr: str) -> float:
+    match = re.search(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$", stderr, re.MULTILINE)
+    assert match, f"{module} not found in -X importtime output"
+    return int(match.group(1)) / 1000
+
+
+def test_import_has_no_side_effects():
+    workdir = tempfile.mkdtemp()
+    result = run_import("import app.main", workdir)
+    assert result.stdout == "", f"Import printed output:\n{result.stdout}"
+    assert os.listdir(workdir) == [], f"Import created files: {os.listdir(workdir)}"
+
+
+def test_import_skips_lazy_dependencies():
+    code = (
+        "import sys, app.main\n"
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    loaded = run_import(code, tempfile.mkdtemp()).stdout.strip()
+    assert loaded == "", f"Imported at startup: {loaded}"
+
+
+def test_import_time_budget():
+    timings = [
+        import_time_ms("app.main", run_import("import app.main", tempfile.mkdtemp()).stderr)
+        for _ in range(RUNS)
+    ]
+    assert min(timings) <= IMPORT_TIME_BUDGET_MS, (
+        f"Importing app.main took {min(timings):.0f} ms (budget {IMPORT_TIME_BUDGET_MS:.0f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Live update fan-out checks: events published on a sync thread reach every
+connected client, new clients get a merged snapshot and reconnecting clients
+the events they missed, retained snapshots stay bounded, the SSE endpoint
+streams all of it and ends when the hub stops, the schedule and results
+syncs publish what they changed, and the Redis relay carries a sync's
+events to the streams of another worker.
+
+Run with `python test_live_hub.py` or `python -m pytest test_live_hub.py`.
+"""
+
+import sys
+import os
+import asyncio
+import json
+import queue
+import threading
+from datetime import date
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.api.games import stream_live_game
+from app.core.events import EventBus, RedisRelay, events, GAME_UPDATE, RECORD_UPDATE
+from app.core.live_hub import LiveHub, LATEST_SIZE, live_hub
+from app.db.models import Game
+from app.services.game_service import GameService
+from app.services.standings_service import DODGERS
+from testing import fake_upstream, new_database, serving
+
+
+def publish_from_thread(event_type, data):
+    # Syncs and the poller publish from worker threads, not the event loop
+    thread = threading.Thread(target=events.publish, args=(event_type, data))
+    thread.start()
+    thread.join()
+
+
+def parse(message):
+    """(event number, event type, data) of an SSE message; ids are "<hub>-<n>"."""
+    fields = dict(line.split(": ", 1) for line in message.strip().split("\n"))
+    event_id = fields.get("id")
+    return event_id and event_id.rsplit("-", 1)[1], fields["event"], json.loads(fields["data"])
+
+
+def test_fan_out_and_snapshot():
+    async def scenario():
+        hub = LiveHub()
+        hub.start(asyncio.get_running_loop())
+        first, initial = hub.connect()
+        second, _ = hub.connect()
+        assert initial == []
+
+        publish_from_thread(GAME_UPDATE, {"game_id": 1, "home_score": 1, "inning": 3})
+        publish_from_thread(GAME_UPDATE, {"game_id": 1, "away_score": 2})
+        for queue in (first, second):
+            messages = [parse(await asyncio.wait_for(queue.get(), 1)) for _ in range(2)]
+            assert messages == [
+                ("1", GAME_UPDATE, {"game_id": 1, "home_score": 1, "inning": 3}),
+                ("2", GAME_UPDATE, {"game_id": 1, "away_score": 2}),
+            ]
+
+        # A new client gets one merged snapshot of the game instead of every diff
+        _, initial = hub.connect()
+        assert [parse(message) for message in initial] == [
+            (None, GAME_UPDATE, {"game_id": 1, "home_score": 1, "inning": 3, "away_score": 2})
+        ]
+        hub.stop()
+
+    asyncio.run(scenario())
+
+
+def test_reconnect_replays_missed_events():
+    async def scenario():
+        hub = LiveHub()
+        hub.start(asyncio.get_running_loop())
+        for inning in range(1, 4):
+            publish_from_thread(GAME_UPDATE, {"game_id": 1, "inning": inning})
+        _, initial = hub.connect(last_event_id=f"{hub.hub_id}-1")
+        assert [parse(message)[0] for message in initial] == ["2", "3"]
+
+        # An id from another worker's hub (or garbage) gets the snapshot instead
+        for foreign in ("0badcafe-1", "1", "not-an-id"):
+            _, initial = hub.connect(last_event_id=foreign)
+            assert [parse(message) for message in initial] == [(None, GAME_UPDATE, {"game_id": 1, "inning": 3})]
+        hub.stop()
+
+    asyncio.run(scenario())
+
+
+def test_snapshots_are_bounded():
+    hub = LiveHub()
+    unsubscribe = events.subscribe(hub._on_event)
+    try:
+        events.publish(RECORD_UPDATE, {"record": "70-50"})
+        for game_id in range(LATEST_SIZE + 5):
+            events.publish(GAME_UPDATE, {"game_id": game_id, "inning": 1})
+    finally:
+        unsubscribe()
+    assert len(hub._latest) == LATEST_SIZE
+    # The oldest games went first; the record stays
+    assert (RECORD_UPDATE, None) in hub._latest and (GAME_UPDATE, 5) not in hub._latest
+    assert (GAME_UPDATE, 6) in hub._latest
+
+
+def test_stream_ends_when_hub_stops():
+    async def scenario():
+        live_hub.start(asyncio.get_running_loop())
+        publish_from_thread(GAME_UPDATE, {"game_id": 1, "inning": 7})
+        await asyncio.sleep(0)
+        response = await stream_live_game(last_event_id=None)
+        assert response.media_type == "text/event-stream"
+
+        stream = response.body_iterator
+        assert (await stream.__anext__()).startswith("retry: ")
+        assert parse(await stream.__anext__())[2]["inning"] == 7
+        publish_from_thread(GAME_UPDATE, {"game_id": 1, "inning": 8})
+        assert parse(await asyncio.wait_for(stream.__anext__(), 1))[2] == {"game_id": 1, "inning": 8}
+
+        live_hub.stop()
+        rest = [message async for message in stream]
+        assert rest == [] and live_hub.client_count == 0
+
+    asyncio.run(scenario())
+
+
+def schedule_event(espn_id, day):
+    return {
+        "id": espn_id, "date": f"2025-08-{day:02d}T02:10Z",
+        "name": f"San Diego Padres at {DODGERS}",
+        "competitions": [{
+            "status": {"type": {"state": "pre"}},
+            # Scores are left out until the game starts
+            "competitors": [{"homeAway": "home"}, {"homeAway": "away"}],
+        }],
+    }
+
+
+def run_sync(db, data, sync):
+    published = []
+    unsubscribe = events.subscribe(lambda event_type, payload: published.append((event_type, payload)))
+    try:
+        with fake_upstream(fetch_json=serving(data)):
+            assert sync(GameService(db))["synced"]
+        return published
+    finally:
+        unsubscribe()
+
+
+def test_syncs_publish_changes():
+    _, db = new_database()
+
+    published = run_sync(db, {"events": [schedule_event("401", 4), schedule_event("402", 5)]},
+                         lambda service: service.sync_dodgers_schedule())
+    assert sorted(payload["espn_id"] for event_type, payload in published if event_type == GAME_UPDATE) == ["401", "402"]
+
+    # A re-sync publishes only the changed fields of the changed game
+    published = run_sync(db, {"events": [schedule_event("401", 4), schedule_event("402", 6)]},
+                         lambda service: service.sync_dodgers_schedule())
+    game_id = db.query(Game.id).filter(Game.espn_id == "402").scalar()
+    assert published == [(GAME_UPDATE, {
+        "game_date": date(2025, 8, 6), "day_of_week": "Wednesday", "game_id": game_id, "espn_id": "402",
+    })]
+
+    scoreboard = {"events": [{"id": "401", "competitions": [{
+        "status": {"type": {"state": "post"}},
+        "competitors": [{"homeAway": "home", "score": "4"}, {"homeAway": "away", "score": "3"}],
+    }]}]}
+    published = run_sync(db, scoreboard, lambda service: service.sync_game_results())
+    assert [event_type for event_type, _ in published] == [GAME_UPDATE, RECORD_UPDATE]
+    assert {key: published[0][1][key] for key in ("home_score", "away_score", "is_final", "game_result")} == {
+        "home_score": 4, "away_score": 3, "is_final": True, "game_result": "W"
+    }
+    assert published[1][1]["record"] == "1-0"
+
+
+
+class FakeRedis:
+    """Pub/sub on in-memory queues: every client made from one FakeRedis shares its channels."""
+
+    def __init__(self):
+        self.subscribers = []
+
+    def publish(self, channel, message):
+        for subscriber in list(self.subscribers):
+            if channel in subscriber.channels:
+                subscriber.messages.put({"type": "message", "data": message.encode()})
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+
+class FakePubSub:
+    def __init__(self, server):
+        self.server = server
+        self.channels = set()
+        self.messages = queue.Queue()
+
+    def subscribe(self, channel):
+        self.channels.add(channel)
+        self.server.subscribers.append(self)
+
+    def listen(self):
+        while True:
+            message = self.messages.get()
+            if message is None:
+                return
+            yield message
+
+    def close(self):
+        if self in self.server.subscribers:
+            self.server.subscribers.remove(self)
+        self.messages.put(None)
+
+
+def test_relay_reaches_streams_in_other_workers():
+    # This process's bus is the worker that ran the sync; `other` is a worker with a stream client
+    server = FakeRedis()
+    other = EventBus()
+    other.start_relay(RedisRelay(other, server))
+    events.start_relay(RedisRelay(events, server))
+    while len(server.subscribers) < 2:
+        threading.Event().wait(0.01)
+
+    # The sync runs on a worker thread, as it does in the scheduler
+    _, db = new_database(threads=True)
+
+    async def scenario():
+        hub = LiveHub(bus=other)
+        hub.start(asyncio.get_running_loop())
+        client, _ = hub.connect()
+        published = await asyncio.to_thread(
+            run_sync, db, {"events": [schedule_event("401", 4)]}, lambda service: service.sync_dodgers_schedule()
+        )
+        # Delivered once here (no echo from the relay), and to the other worker's stream
+        assert [payload["espn_id"] for _, payload in published] == ["401"]
+        _, event_type, data = parse(await asyncio.wait_for(client.get(), 2))
+        assert event_type == GAME_UPDATE and (data["espn_id"], data["game_date"]) == ("401", "2025-08-04")
+        hub.stop()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        events.stop_relay()
+        other.stop_relay()
+    assert server.subscribers == []
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Live game poller checks: only changed columns are written and published, an
+unchanged summary writes nothing, the next poll is scheduled by game state,
+and a game going final stores its result and updates the record once, even
+when the results sync finalized it first.
+
+Run with `python test_live_poller.py` or `python -m pytest test_live_poller.py`.
+"""
+
+import sys
+import os
+from datetime import date, datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.events import events, GAME_UPDATE, RECORD_UPDATE
+from app.db.models import Game, GameResult, TeamRecord
+from app.db.query_counter import count_queries
+from app.services.live_game_service import LiveGameService
+from app.services.standings_service import StandingsService, DODGERS
+from testing import fake_upstream, new_database, serving, temp_database_url
+
+FIRST_PITCH = datetime(2025, 8, 4, 2, 10, tzinfo=timezone.utc)
+
+
+def summary(state, detail, home=None, away=None, name="STATUS_IN_PROGRESS", inning=None):
+    competitors = [
+        {"homeAway": "home", "score": str(home) if home is not None else ""},
+        {"homeAway": "away", "score": str(away) if away is not None else ""},
+    ]
+    return {"header": {"competitions": [{
+        "date": "2025-08-04T02:10Z",
+        "status": {
+            "period": inning,
+            "type": {"state": state, "name": name, "completed": state == "post", "shortDetail": detail},
+        },
+        "competitors": competitors,
+    }]}}
+
+
+def make_session(url="sqlite://"):
+    engine, db = new_database(url)
+    db.add(Game(
+        espn_id="401696301", game_date=date(2025, 8, 1), home_team=DODGERS, away_team="San Diego Padres",
+        home_score=5, away_score=2, is_final=True
+    ))
+    db.add(Game(espn_id="401696302", game_date=date(2025, 8, 3), home_team=DODGERS, away_team="San Diego Padres"))
+    db.commit()
+    StandingsService(db).rebuild_record(DODGERS, 2025)
+    db.commit()
+    return engine, db
+
+
+def live_game(db):
+    return db.query(Game).filter(Game.espn_id == "401696302").one()
+
+
+def poll(db, data):
+    """Poll the live game with `data` as the summary; returns the result and published events."""
+    published = []
+    unsubscribe = events.subscribe(lambda event_type, payload: published.append((event_type, payload)))
+    try:
+        with fake_upstream(fetch_json=serving(data)):
+            return LiveGameService(db).poll_game(live_game(db)), published
+    finally:
+        unsubscribe()
+
+
+def test_publishes_only_changes():
+    engine, db = make_session()
+    result, published = poll(db, summary("in", "Top 3rd", home=1, away=0, inning=3))
+    assert result["changed"] == ["away_score", "game_state", "home_score", "inning", "status_detail"]
+    assert published == [(GAME_UPDATE, {
+        "game_id": live_game(db).id, "espn_id": "401696302",
+        "game_state": "in", "home_score": 1, "away_score": 0, "inning": 3, "status_detail": "Top 3rd",
+    })]
+
+    result, published = poll(db, summary("in", "Top 3rd", home=1, away=2, inning=3))
+    assert result["changed"] == ["away_score"] and published[0][1]["away_score"] == 2
+
+
+def test_unchanged_summary_writes_nothing():
+    engine, db = make_session()
+    poll(db, summary("in", "Bot 5th", home=3, away=2, inning=5))
+
+    with count_queries(engine) as counter:
+        result, published = poll(db, summary("in", "Bot 5th", home=3, away=2, inning=5))
+    assert result["changed"] == [] and published == []
+    writes = [s for s in counter.statements if s.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))]
+    assert writes == []
+
+
+def test_next_poll_interval():
+    service = LiveGameService(None)
+    def interval(data, now=None):
+        return service.next_poll_seconds(service.parse_summary(data), now=now)
+
+    assert interval(summary("in", "Top 7th", home=1, away=0)) == settings.LIVE_POLL_PLAY_SECONDS
+    assert interval(summary("in", "Mid 7th", home=1, away=0)) == settings.LIVE_POLL_BREAK_SECONDS
+    assert interval(summary("in", "Rain Delay", name="STATUS_RAIN_DELAY")) == settings.LIVE_POLL_DELAY_SECONDS
+    assert interval(summary("post", "Final", home=1, away=0, name="STATUS_FINAL")) == settings.LIVE_POLL_IDLE_SECONDS
+
+    pregame = summary("pre", "8/3 - 7:10 PM PDT", name="STATUS_SCHEDULED")
+    # Hours out: wait, but no longer than the idle interval
+    assert interval(pregame, now=FIRST_PITCH - timedelta(hours=3)) == settings.LIVE_POLL_IDLE_SECONDS
+    # Twenty minutes out: sleep until ten minutes before first pitch
+    assert interval(pregame, now=FIRST_PITCH - timedelta(minutes=20)) == 600
+    assert interval(pregame, now=FIRST_PITCH - timedelta(minutes=5)) == settings.LIVE_POLL_PREGAME_SECONDS
+
+
+def test_final_stores_result_and_record():
+    engine, db = make_session()
+    poll(db, summary("in", "Top 9th", home=4, away=3, inning=9))
+    result, published = poll(db, summary("post", "Final", home=4, away=3, name="STATUS_FINAL", inning=9))
+
+    game = live_game(db)
+    assert game.is_final and game.game_result == "W"
+    assert (db.query(GameResult).one().home_score, db.query(GameResult).one().away_score) == (4, 3)
+    record = [payload for event_type, payload in published if event_type == RECORD_UPDATE]
+    assert len(record) == 1 and (record[0]["record"], record[0]["streak"]) == ("2-0", "W2")
+    assert db.query(TeamRecord).one().wins == 2
+
+
+def test_final_already_counted_by_results_sync():
+    engine, db = make_session(url=temp_database_url("live"))
+    game = live_game(db)  # The poller's view: not final yet
+
+    # Meanwhile the results sync finalizes and counts the game
+    sync_db = sessionmaker(bind=engine)()
+    standings = StandingsService(sync_db)
+    assert standings.claim_final_game(game.id)
+    standings.apply_final_games([{
+        "game_date": game.game_date, "home_team": DODGERS, "away_team": "San Diego Padres",
+        "home_score": 4, "away_score": 3,
+    }])
+    sync_db.commit()
+    sync_db.close()
+
+    result, published = poll(db, summary("post", "Final", home=4, away=3, name="STATUS_FINAL", inning=9))
+    assert "is_final" in result["changed"]
+    assert [event_type for event_type, _ in published] == [GAME_UPDATE]
+    db.expire_all()
+    assert (db.query(TeamRecord).one().wins, db.query(TeamRecord).one().losses) == (2, 0)
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Migration checks: a fresh database migrated to head matches the models, and a
+database in the pre-Alembic shape (old sqlite3 scripts) upgrades and backfills.
+
+Run with `python test_migrations.py` or `python -m pytest test_migrations.py`.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+
+from app.db.database import Base
+from app.db.migrate import upgrade_database
+import app.db.models  # noqa: F401
+
+
+def make_engine():
+    """Engine on a throwaway SQLite file (migrations commit, so :memory: won't do)."""
+    path = os.path.join(tempfile.mkdtemp(), "migrations.db")
+    return create_engine(f"sqlite:///{path}")
+
+
+def test_fresh_database_matches_models():
+    engine = make_engine()
+    upgrade_database(engine)
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn, opts={"compare_type": True})
+        diff = compare_metadata(context, Base.metadata)
+    assert diff == [], f"Models and migrations differ: {diff}"
+
+
+def test_legacy_database_upgrades_and_backfills():
+    engine = make_engine()
+    with engine.begin() as conn:
+        # Shape of a database created before game_result / stadium_id existed
+        conn.execute(text(
+            "CREATE TABLE stadiums (id INTEGER PRIMARY KEY, name VARCHAR(100) NOT NULL UNIQUE, "
+            "city VARCHAR(100) NOT NULL, state VARCHAR(50) NOT NULL, country VARCHAR(50), "
+            "latitude REAL NOT NULL, longitude REAL NOT NULL, capacity INTEGER, surface_type VARCHAR(50), "
+            "roof_type VARCHAR(50), primary_team VARCHAR(100), league VARCHAR(10), is_active BOOLEAN, "
+            "opened_year INTEGER, created_at VARCHAR, updated_at VARCHAR)"
+        ))
+        conn.execute(text(
+            "INSERT INTO stadiums (name, city, state, latitude, longitude) "
+            "VALUES ('Dodger Stadium', 'Los Angeles', 'CA', 34.07, -118.24), ('Oracle Park', 'San Francisco', 'CA', 37.78, -122.39)"
+        ))
+        conn.execute(text(
+            "CREATE TABLE games (id INTEGER PRIMARY KEY, espn_id VARCHAR(50) NOT NULL UNIQUE, "
+            "game_date DATE NOT NULL, home_team VARCHAR(50) NOT NULL, away_team VARCHAR(50) NOT NULL, "
+            "home_score INTEGER, away_score INTEGER, venue VARCHAR(100), is_final BOOLEAN, weather_temp INTEGER)"
+        ))
+        for number in range(1, 2501):
+            home = number % 2 == 0
+            conn.execute(text(
+                "INSERT INTO games (espn_id, game_date, home_team, away_team, home_score, away_score, venue, is_final) "
+                "VALUES (:espn_id, '2024-05-01', :home, :away, 5, 3, :venue, 1)"
+            ), {
+                "espn_id": str(number),
+                "home": "Los Angeles Dodgers" if home else "San Francisco Giants",
+                "away": "San Francisco Giants" if home else "Los Angeles Dodgers",
+                "venue": "Dodger Stadium" if home else "AT&T Park",
+            })
+
+    upgrade_database(engine)
+    upgrade_database(engine)  # Already at head: no-op
+
+    columns = {column["name"] for column in inspect(engine).get_columns("games")}
+    assert {"game_result", "stadium_id"} <= columns
+    with engine.connect() as conn:
+        results = dict(conn.execute(text("SELECT game_result, COUNT(*) FROM games GROUP BY game_result")).all())
+        venues = dict(conn.execute(text(
+            "SELECT g.venue, s.name FROM games g JOIN stadiums s ON s.id = g.stadium_id GROUP BY g.venue"
+        )).all())
+        stadiums = set(conn.execute(text("SELECT name FROM stadiums")).scalars())
+    assert results == {"W": 1250, "L": 1250}
+    assert venues == {"Dodger Stadium": "Dodger Stadium", "AT&T Park": "Oracle Park"}
+    assert {"Angel Stadium", "George M. Steinbrenner Field"} <= stadiums
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Player registry checks: the roster sync records every player's ESPN ID and
+URL slug once (fetching the roster alone writes nothing), and whole-roster
+name lookups resolve from memory in one pass.
+
+Run with `python test_player_registry.py` or `python -m pytest test_player_registry.py`.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.models import Player, PlayerIdentity
+from app.db.query_counter import assert_max_queries
+from app.services.player_game_service import PlayerGameService
+from app.services.player_registry import player_registry, normalize_player_name
+from app.services.player_service import PlayerService
+from app.services.roster_parser import parse_roster_html
+from testing import fake_upstream, new_database, serving
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "espn_roster_lad.html")
+
+with open(FIXTURE, encoding="utf-8") as f:
+    ROSTER_HTML = f.read()
+
+
+def record_roster(db):
+    player_registry.record(db, parse_roster_html(ROSTER_HTML))
+    db.commit()
+
+
+def test_roster_sync_records_identities():
+    engine, db = new_database()
+    service = PlayerService(db)
+    with fake_upstream(fetch_text=serving(ROSTER_HTML)):
+        # Fetching and parsing (the roster-espn-test endpoint) makes no changes
+        assert len(service.sync_roster_from_espn()) == 35
+        assert db.query(PlayerIdentity).count() == 0 and not db.new and not db.dirty
+
+        assert service.sync_roster_to_database()["synced"]
+    assert db.query(PlayerIdentity).count() == 35
+    assert db.get(PlayerIdentity, "39832").slug == "shohei-ohtani"
+
+    # Recording the same page again writes nothing
+    assert player_registry.record(db, parse_roster_html(ROSTER_HTML)) == 0
+
+
+def test_bulk_resolve():
+    engine, db = new_database()
+    record_roster(db)
+    names = [player.name for player in db.query(PlayerIdentity)] + ["Teoscar Hernandez", "Will Smith Jr.", "Nobody Here"]
+
+    resolved = player_registry.resolve(db, names)
+    assert resolved["Teoscar Hernandez"] == resolved["Teoscar Hernández"] == "33348"
+    assert resolved["Will Smith Jr."] == "39915"
+    assert resolved["Nobody Here"] is None
+    assert sum(1 for espn_id in resolved.values() if espn_id) == 37
+
+    # Once loaded, resolving the whole roster doesn't touch the database
+    with assert_max_queries(engine, 0):
+        player_registry.resolve(db, names)
+        assert PlayerGameService(db).get_player_espn_id("Freddie Freeman") == "30193"
+
+
+def test_players_table_wins():
+    engine, db = new_database()
+    record_roster(db)
+    # A current player with the same name as an older identity
+    db.add(Player(name="Will Smith", espn_id="31125", uniform_number=40))
+    db.commit()
+    player_registry.invalidate()
+    assert player_registry.resolve(db, ["Will Smith"]) == {"Will Smith": "31125"}
+    assert player_registry.slug(db, "31125", "Will Smith") == "will-smith"
+
+
+def test_normalize_player_name():
+    assert normalize_player_name("José Ramírez Jr.") == "jose ramirez"
+    assert normalize_player_name("J.P. Feyereisen") == "jp feyereisen"
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Query-count checks for the API read paths.
+Serializes services' results through the response schemas (as FastAPI does),
+or calls the endpoint itself, and fails if the number of queries grows with
+the number of rows (N+1).
+
+Run with `python test_query_counts.py` or `python -m pytest test_query_counts.py`.
+"""
+
+import sys
+import os
+import json
+from datetime import date
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import Request, Response
+
+from app.api import games as games_api
+from app.db.models import Player, PlayerPosition, Game, GameResult, Stadium
+from app.db.schemas import Player as PlayerSchema, Game as GameSchema
+from app.db.query_counter import assert_max_queries
+from app.services.player_service import PlayerService
+from app.services.game_service import GameService
+from testing import new_database
+
+
+def make_session(players: int = 40, games: int = 30):
+    """Create an in-memory database seeded with a roster and a schedule."""
+    engine, db = new_database()
+
+    stadium = Stadium(name="Dodger Stadium", city="Los Angeles", state="CA", latitude=34.0739, longitude=-118.24)
+    db.add(stadium)
+    db.flush()
+
+    for number in range(players):
+        player = Player(name=f"Player Number{number}", uniform_number=number)
+        player.positions = [
+            PlayerPosition(position="P" if number % 2 else "SS", is_primary=True),
+            PlayerPosition(position="DH", is_primary=False),
+        ]
+        db.add(player)
+
+    for day in range(games):
+        game = Game(
+            espn_id=str(day), game_date=date(2025, 4, 1 + day % 28), home_team="Los Angeles Dodgers",
+            away_team="San Diego Padres", home_score=3, away_score=2, is_final=True,
+            venue="Dodger Stadium", stadium_id=stadium.id
+        )
+        game.game_results = [GameResult(home_team=game.home_team, away_team=game.away_team, home_score=3, away_score=2)]
+        db.add(game)
+
+    db.commit()
+    db.expunge_all()
+    return engine, db
+
+
+def test_roster_serialization_is_constant():
+    engine, db = make_session()
+    with assert_max_queries(engine, 2):
+        players = PlayerService(db).get_players()
+        [PlayerSchema.model_validate(player) for player in players]
+    assert len(players) == 40
+
+
+def test_roster_position_filter_is_constant():
+    engine, db = make_session()
+    with assert_max_queries(engine, 2):
+        players = PlayerService(db).get_players(position="P")
+        [PlayerSchema.model_validate(player) for player in players]
+    assert len(players) == 20
+
+
+def make_request():
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""})
+
+
+def test_games_serialization_is_constant():
+    engine, db = make_session()
+    # The endpoint's encoded body: a version lookup and the games query
+    with assert_max_queries(engine, 2):
+        response = games_api.get_dodgers_games(make_request(), db=db, limit=25)
+    assert len(json.loads(response.body)) == 25
+
+
+def test_game_by_espn_id_is_constant():
+    engine, db = make_session()
+    with assert_max_queries(engine, 2):
+        game = games_api.get_game_by_espn_id("7", make_request(), Response(), db=db)
+        body = GameSchema.model_validate(game).model_dump_json()  # FastAPI's response_model step
+    assert json.loads(body)["espn_id"] == "7"
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
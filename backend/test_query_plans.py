@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Query-plan checks for the hot service queries.
+Runs each service call against a seeded database, EXPLAINs every SELECT it
+issued and fails if one falls back to a full table scan (a missing index).
+
+Run with `python test_query_plans.py` or `python -m pytest test_query_plans.py`.
+"""
+
+import sys
+import os
+from datetime import date, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.models import Player, PlayerPosition, Game, GameResult, PlayerGameStats, Stadium
+from app.db.query_plans import assert_no_full_scans
+from app.services.player_service import PlayerService
+from app.services.game_service import GameService
+from app.services.box_score_service import BoxScoreService
+from app.services.standings_service import StandingsService
+from testing import new_database
+
+OPPONENTS = ["San Diego Padres", "San Francisco Giants", "Arizona Diamondbacks", "Colorado Rockies"]
+
+
+def make_session(players: int = 40, games: int = 200):
+    """Create an in-memory database with a roster, a few seasons of games and box scores."""
+    engine, db = new_database()
+
+    stadium = Stadium(name="Dodger Stadium", city="Los Angeles", state="CA", latitude=34.0739, longitude=-118.24)
+    db.add(stadium)
+    db.flush()
+
+    roster = []
+    for number in range(players):
+        player = Player(name=f"Player Number{number}", uniform_number=number,
+                        status="Active" if number % 5 else "Injured")
+        player.positions = [PlayerPosition(position="P" if number % 2 else "SS", is_primary=True)]
+        roster.append(player)
+        db.add(player)
+    db.flush()
+
+    for number in range(games):
+        opponent = OPPONENTS[number % len(OPPONENTS)]
+        home = number % 2 == 0
+        game = Game(
+            espn_id=str(number), game_date=date(2023, 4, 1) + timedelta(days=number * 4),
+            home_team="Los Angeles Dodgers" if home else opponent,
+            away_team=opponent if home else "Los Angeles Dodgers",
+            home_score=5, away_score=3, is_final=True, game_result="W" if home else "L",
+            venue="Dodger Stadium", stadium_id=stadium.id, weather_temp=72
+        )
+        game.game_results = [GameResult(home_team=game.home_team, away_team=game.away_team, home_score=5, away_score=3)]
+        game.player_stats = [PlayerGameStats(player_id=player.id, at_bats=4, hits=1) for player in roster[:9]]
+        db.add(game)
+
+    db.commit()
+    db.expunge_all()
+    return engine, db
+
+
+def test_dodgers_games_use_team_indexes():
+    engine, db = make_session()
+    with assert_no_full_scans(engine):
+        GameService(db).get_dodgers_games(limit=25)
+
+
+def test_game_by_espn_id_uses_index():
+    engine, db = make_session()
+    with assert_no_full_scans(engine):
+        GameService(db).get_game_by_espn_id("7")
+
+
+def test_existing_game_results_use_partial_index():
+    engine, db = make_session()
+    with assert_no_full_scans(engine):
+        GameService(db).calculate_existing_game_results()
+
+
+def test_weather_backfill_uses_partial_index():
+    engine, db = make_session()
+    # The stadium lookup table is small and read whole on purpose
+    with assert_no_full_scans(engine, allow=("stadiums",)):
+        GameService(db).sync_weather_for_existing_games()
+
+
+def test_standings_rebuild_uses_team_indexes():
+    engine, db = make_session()
+    with assert_no_full_scans(engine):
+        StandingsService(db).rebuild_record("Los Angeles Dodgers", 2024)
+
+
+def test_box_score_reads_use_indexes():
+    engine, db = make_session()
+    service = BoxScoreService(db)
+    with assert_no_full_scans(engine):
+        service.get_player_game_stats(10)
+        service.get_players_season_stats([1, 2, 3], 2024)
+
+
+def test_roster_filters_use_indexes():
+    engine, db = make_session()
+    service = PlayerService(db)
+    with assert_no_full_scans(engine):
+        service.get_players(status="Injured")
+        service.get_player_by_id(3)
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Results sync checks: scoreboard events are reconciled against the stored
+games in bulk, so only changed games and results are written, games that
+still need weather come back as weather_pending instead of being fetched
+inline, and the number of statements does not grow with the scoreboard.
+
+Run with `python test_results_sync.py` or `python -m pytest test_results_sync.py`.
+"""
+
+import sys
+import os
+from datetime import date
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.models import Game, GameResult
+from app.db.query_counter import count_queries
+from app.services.game_service import GameService
+from app.services.standings_service import DODGERS
+from testing import fake_upstream, new_database, serving
+
+
+def make_session(games=3):
+    engine, db = new_database()
+    for day in range(1, games + 1):
+        db.add(Game(
+            espn_id=f"40{day:02d}", game_date=date(2025, 8, day), home_team=DODGERS,
+            away_team="San Diego Padres", venue="Dodger Stadium"
+        ))
+    db.commit()
+    return engine, db
+
+
+def scoreboard_event(espn_id, home, away, state="post"):
+    # Scoreboard scores are plain strings
+    return {"id": espn_id, "competitions": [{
+        "status": {"type": {"state": state}},
+        "competitors": [{"homeAway": "home", "score": str(home)}, {"homeAway": "away", "score": str(away)}],
+    }]}
+
+
+def sync_results(db, *scoreboard_events):
+    with fake_upstream(fetch_json=serving({"events": list(scoreboard_events)})):
+        return GameService(db).sync_game_results()
+
+
+def game(db, espn_id):
+    return db.query(Game).filter(Game.espn_id == espn_id).one()
+
+
+def test_reconciles_changed_games():
+    _, db = make_session()
+    game(db, "4002").weather_temp = 70
+    db.commit()
+
+    result = sync_results(
+        db,
+        scoreboard_event("4001", 5, 2),
+        scoreboard_event("4002", 1, 3),
+        scoreboard_event("4003", 2, 2, state="in"),
+        scoreboard_event("9999", 1, 0),  # Not one of our games
+    )
+    assert result["synced"] and result["updated_games"] == 3 and result["results_created"] == 3
+
+    db.expire_all()
+    assert (game(db, "4001").is_final, game(db, "4001").game_result) == (True, "W")
+    assert (game(db, "4002").home_score, game(db, "4002").game_result) == (1, "L")
+    assert (game(db, "4003").is_final, game(db, "4003").game_result) == (False, None)
+    assert {(row.home_score, row.away_score) for row in db.query(GameResult)} == {(5, 2), (1, 3), (2, 2)}
+    # Final games without weather are queued for the caller
+    assert result["weather_pending"] == [game(db, "4001").id]
+
+
+def test_updates_existing_results():
+    _, db = make_session()
+    sync_results(db, scoreboard_event("4003", 2, 2, state="in"))
+    result = sync_results(db, scoreboard_event("4003", 4, 2))
+    assert result["updated_games"] == 1 and result["results_created"] == 0
+
+    db.expire_all()
+    result_row = db.query(GameResult).one()
+    assert (result_row.home_score, result_row.away_score) == (4, 2)
+    assert game(db, "4003").game_result == "W"
+
+
+def test_unchanged_scoreboard_writes_nothing():
+    engine, db = make_session()
+    events = [scoreboard_event("4001", 5, 2), scoreboard_event("4002", 1, 3)]
+    sync_results(db, *events)
+
+    with count_queries(engine) as counter:
+        result = sync_results(db, *events)
+    assert result["updated_games"] == 0
+    writes = [s for s in counter.statements if s.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))]
+    assert writes == []
+
+
+def test_statements_do_not_grow_with_scoreboard():
+    def statements(games):
+        engine, db = make_session(games)
+        with count_queries(engine) as counter:
+            result = sync_results(db, *[scoreboard_event(f"40{day:02d}", 3, 1, state="in") for day in range(1, games + 1)])
+        assert result["updated_games"] == games
+        return counter.count
+
+    assert statements(20) == statements(4)
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Roster parser checks against a saved ESPN roster page (fixtures/): every
+player is extracted with the right fields, and a parse stays within a time
+budget. Running the script also prints the timing next to BeautifulSoup's.
+
+Run with `python test_roster_parser.py` or `python -m pytest test_roster_parser.py`.
+Override the budget with ROSTER_PARSE_BUDGET_MS (e.g. on slow CI machines).
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.roster_parser import parse_roster_html, is_valid_player_name
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "espn_roster_lad.html")
+
+# Best of several runs, in milliseconds
+ROSTER_PARSE_BUDGET_MS = float(os.getenv("ROSTER_PARSE_BUDGET_MS", "25"))
+RUNS = 5
+
+
+def load_fixture() -> str:
+    with open(FIXTURE, encoding="utf-8") as f:
+        return f.read()
+
+
+def best_parse_ms(html: str, parse) -> float:
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        parse(html)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def test_parses_every_player():
+    players = parse_roster_html(load_fixture())
+    assert len(players) == 35
+    assert len({player["espn_id"] for player in players}) == 35
+
+    by_name = {player["name"]: player for player in players}
+    assert by_name["Shohei Ohtani"] == {
+        "name": "Shohei Ohtani",
+        "espn_id": "39832",
+        "espn_slug": "shohei-ohtani",
+        "uniform_number": 17,
+        "positions": ["DH"],
+        "bats": "L",
+        "throws": "R",
+        "height": "6' 4\"",
+        "weight": 210,
+        "status": "Active",
+        "team": "Los Angeles Dodgers",
+    }
+    # Accented names used to be dropped by the name check
+    assert by_name["Enrique Hernández"]["uniform_number"] == 8
+    assert by_name["Will Smith"]["positions"] == ["C"]
+
+
+def test_page_without_roster():
+    assert parse_roster_html("<html><body><p>Page not found</p></body></html>") == []
+    assert parse_roster_html(b"<table class='Table'><tr><th>Name</th></tr></table>") == []
+
+
+def test_player_name_check():
+    assert is_valid_player_name("J.P. Feyereisen")
+    assert is_valid_player_name("Kiké Hernández")
+    # Accented initials and lowercase particles
+    assert is_valid_player_name("Ángel Zerpa")
+    assert is_valid_player_name("Óscar González")
+    assert is_valid_player_name("Travis d'Arnaud")
+    assert is_valid_player_name("Elly De La Cruz")
+    assert not is_valid_player_name("pitchers and catchers")
+    assert not is_valid_player_name("Injured List (60-Day)")
+    assert not is_valid_player_name("National League West")
+    assert not is_valid_player_name("Pitchers")
+
+
+def test_parse_time_budget():
+    html = load_fixture()
+    elapsed = best_parse_ms(html, parse_roster_html)
+    assert elapsed < ROSTER_PARSE_BUDGET_MS, f"Roster parse took {elapsed:.1f} ms (budget {ROSTER_PARSE_BUDGET_MS:.0f} ms)"
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
+
+    from bs4 import BeautifulSoup
+    html = load_fixture()
+    print(f"Roster parse: {best_parse_ms(html, parse_roster_html):.1f} ms "
+          f"(BeautifulSoup html.parser tree alone: {best_parse_ms(html, lambda h: BeautifulSoup(h, 'html.parser')):.1f} ms)")
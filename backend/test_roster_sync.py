@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Differential roster sync checks, using the saved ESPN roster page as input:
+player IDs survive re-syncs, departed players become Inactive, players listed
+without a uniform number are kept, a sync with nothing new writes nothing,
+and the roster job runs at most once a day.
+
+Run with `python test_roster_sync.py` or `python -m pytest test_roster_sync.py`.
+"""
+
+import sys
+import os
+import copy
+from datetime import date, datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.data_versions import get_versions, ROSTER
+from app.db.models import Game, JobRun, Player, PlayerGameStats, PlayerPosition
+from app.db.query_counter import count_queries
+from app.services.player_service import PlayerService
+from app.services.roster_parser import parse_roster_html
+from app.services.sync_jobs import SYNC_ROSTER, sync_roster_job
+from testing import new_database
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "espn_roster_lad.html")
+
+with open(FIXTURE, encoding="utf-8") as f:
+    ROSTER_PAGE = parse_roster_html(f.read())
+
+
+def sync(db, players):
+    """Run the sync with `players` as the parsed ESPN roster."""
+    service = PlayerService(db)
+    service.sync_roster_from_espn = lambda: copy.deepcopy(players)
+    return service.sync_roster_to_database()
+
+
+def test_first_sync_inserts_roster():
+    engine, db = new_database()
+    result = sync(db, ROSTER_PAGE)
+    assert result["synced"] and result["added"] == 35
+    assert db.query(Player).count() == 35
+    assert db.query(PlayerPosition).filter(PlayerPosition.is_primary.is_(True)).count() == 35
+
+
+def test_resync_writes_nothing():
+    engine, db = new_database()
+    sync(db, ROSTER_PAGE)
+    version = get_versions(db, [ROSTER])[ROSTER]
+
+    with count_queries(engine) as counter:
+        result = sync(db, ROSTER_PAGE)
+    writes = [s for s in counter.statements if s.lstrip().split()[0].upper() in ("INSERT", "UPDATE", "DELETE")]
+    assert writes == [], writes
+    assert result["unchanged"] == 35 and result["reason"] == "Roster already up to date"
+    assert get_versions(db, [ROSTER])[ROSTER] == version
+
+
+def test_changes_keep_player_ids():
+    engine, db = new_database()
+    sync(db, ROSTER_PAGE)
+    ids = {player.espn_id: player.id for player in db.query(Player)}
+
+    # Stats reference players by ID; they must survive the sync
+    ohtani_id = ids["39832"]
+    game = Game(espn_id="401", game_date=date(2025, 4, 1), home_team="Los Angeles Dodgers", away_team="San Diego Padres")
+    db.add(game)
+    db.flush()
+    db.add(PlayerGameStats(player_id=ohtani_id, game_id=game.id, home_runs=1))
+    db.commit()
+
+    roster = [player for player in ROSTER_PAGE if player["name"] != "Clayton Kershaw"]
+    roster[0] = dict(roster[0], weight=230, positions=["SP"])
+    roster.append(dict(ROSTER_PAGE[0], name="Bobby Miller", espn_id="4683371", uniform_number=28))
+    result = sync(db, roster)
+    assert (result["added"], result["updated"], result["inactivated"]) == (1, 1, 1)
+
+    db.expire_all()
+    assert {player.espn_id: player.id for player in db.query(Player) if player.espn_id in ids} == ids
+    assert db.query(Player).filter(Player.name == "Clayton Kershaw").one().status == "Inactive"
+    assert db.get(Player, ids[roster[0]["espn_id"]]).weight == 230
+    assert [p.position for p in db.get(Player, ids[roster[0]["espn_id"]]).positions] == ["SP"]
+    assert db.query(PlayerGameStats).one().player_id == ohtani_id
+
+    # Inactive players stay out of the roster list unless asked for
+    listed = PlayerService(db).get_players()
+    assert len(listed) == 35 and "Clayton Kershaw" not in {player.name for player in listed}
+    assert len(PlayerService(db).get_players(status="Inactive")) == 1
+
+    # A returning player is reactivated under the same ID
+    sync(db, ROSTER_PAGE + [roster[-1]])
+    db.expire_all()
+    kershaw = db.query(Player).filter(Player.name == "Clayton Kershaw").one()
+    assert kershaw.status == "Active" and kershaw.id == ids["28963"]
+
+
+def test_players_without_espn_id_are_adopted():
+    engine, db = new_database()
+    legacy = Player(name="Mookie Betts", uniform_number=50, team="Los Angeles Dodgers", status="Injured")
+    db.add(legacy)
+    db.commit()
+    legacy_id = legacy.id
+
+    sync(db, ROSTER_PAGE)
+    db.expire_all()
+    betts = db.query(Player).filter(Player.name == "Mookie Betts").one()
+    assert betts.id == legacy_id and betts.espn_id == "33039"
+    assert betts.status == "Injured"  # Statuses set by hand are kept
+
+
+
+def test_players_without_number_stay_active():
+    engine, db = new_database()
+    sync(db, ROSTER_PAGE)
+
+    # A known player listed without a number keeps the stored one
+    roster = copy.deepcopy(ROSTER_PAGE)
+    known = roster[0]
+    known["uniform_number"] = None
+    roster.append(dict(ROSTER_PAGE[0], name="Hyeseong Kim", espn_id="5246270", uniform_number=None))
+    result = sync(db, roster)
+    assert result["inactivated"] == 0 and result["skipped_players"] == ["Hyeseong Kim"]
+    assert "skipped" not in result  # Would mark the job run as skipped instead of succeeded
+
+    db.expire_all()
+    player = db.query(Player).filter(Player.espn_id == known["espn_id"]).one()
+    assert (player.status, player.uniform_number) == ("Active", ROSTER_PAGE[0]["uniform_number"])
+    assert db.query(Player).count() == 35
+
+
+def test_roster_synced_at_most_once_a_day():
+    engine, db = new_database()
+    service = PlayerService(db)
+    assert service.should_sync_roster()
+
+    def finish_run(status, hours_ago):
+        db.add(JobRun(job_name=SYNC_ROSTER, trigger="schedule", status=status,
+                      finished_at=datetime.now() - timedelta(hours=hours_ago)))
+        db.commit()
+
+    # Only a successful run holds off the next one
+    finish_run("failed", 1)
+    finish_run("skipped", 1)
+    finish_run("succeeded", 25)
+    assert service.should_sync_roster()
+
+    finish_run("succeeded", 2)
+    assert not service.should_sync_roster()
+    result = sync_roster_job(db, lambda *args: None)
+    assert result["skipped"] and db.query(Player).count() == 0
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
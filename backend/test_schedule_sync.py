@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Schedule sync checks: games are upserted by ESPN ID, so a re-sync updates
+changed games in place, leaves unchanged ones unwritten and keeps the weather,
+results and player stats attached to them; the number of statements does not
+grow with the size of the schedule.
+
+Run with `python test_schedule_sync.py` or `python -m pytest test_schedule_sync.py`.
+"""
+
+import sys
+import os
+from datetime import date
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.models import Game, GameResult, Player, PlayerGameStats, Stadium
+from app.db.query_counter import count_queries
+from app.services.game_service import GameService
+from app.services.standings_service import DODGERS
+from testing import fake_upstream, new_database, serving
+
+
+def make_session():
+    engine, db = new_database()
+    db.add(Stadium(name="Dodger Stadium", city="Los Angeles", state="CA", latitude=34.0739, longitude=-118.24))
+    db.commit()
+    return engine, db
+
+
+def schedule_event(espn_id, day, venue="Dodger Stadium", scores=None):
+    competitors = [{"homeAway": "home"}, {"homeAway": "away"}]
+    if scores:
+        competitors = [
+            {"homeAway": "home", "score": {"value": scores[0]}},
+            {"homeAway": "away", "score": {"value": scores[1]}},
+        ]
+    return {
+        "id": espn_id, "date": f"2025-08-{day:02d}T02:10Z",
+        "name": f"San Diego Padres at {DODGERS}",
+        "competitions": [{
+            "status": {"type": {"state": "post" if scores else "pre"}},
+            "venue": {"fullName": venue},
+            "competitors": competitors,
+        }],
+    }
+
+
+def sync_schedule(db, *schedule_events):
+    with fake_upstream(fetch_json=serving({"events": list(schedule_events)})):
+        return GameService(db).sync_dodgers_schedule()
+
+
+def test_first_sync_inserts_games():
+    _, db = make_session()
+    result = sync_schedule(db, schedule_event("401", 4, scores=(5, 2)), schedule_event("402", 5))
+    assert (result["inserted"], result["updated"], result["unchanged"]) == (2, 0, 0)
+
+    game = db.query(Game).filter(Game.espn_id == "401").one()
+    assert (game.game_date, game.home_score, game.is_final) == (date(2025, 8, 4), 5, True)
+    # The venue is resolved to a stadium while syncing
+    assert game.stadium_id == db.query(Stadium.id).scalar()
+    assert db.query(GameResult).count() == 2
+
+
+def test_resync_updates_in_place():
+    _, db = make_session()
+    sync_schedule(db, schedule_event("401", 4, scores=(5, 2)), schedule_event("402", 5))
+    game = db.query(Game).filter(Game.espn_id == "402").one()
+    game_id = game.id
+    game.weather_temp = 72
+    player = Player(name="Mookie Betts", uniform_number=50)
+    db.add(player)
+    db.flush()
+    db.add(PlayerGameStats(player_id=player.id, game_id=game_id, at_bats=4, hits=2))
+    db.commit()
+
+    # 402 is moved a day; 401 is unchanged
+    result = sync_schedule(db, schedule_event("401", 4, scores=(5, 2)), schedule_event("402", 6))
+    assert (result["inserted"], result["updated"], result["unchanged"]) == (0, 1, 1)
+
+    db.expire_all()
+    game = db.query(Game).filter(Game.espn_id == "402").one()
+    assert (game.id, game.game_date, game.day_of_week) == (game_id, date(2025, 8, 6), "Wednesday")
+    # Columns owned by other syncs survive the re-sync
+    assert game.weather_temp == 72
+    assert db.query(PlayerGameStats).filter(PlayerGameStats.game_id == game_id).count() == 1
+    assert db.query(Game).count() == 2 and db.query(GameResult).count() == 2
+
+
+def test_unchanged_schedule_writes_nothing():
+    engine, db = make_session()
+    schedule = [schedule_event(str(400 + day), day) for day in range(1, 6)]
+    sync_schedule(db, *schedule)
+
+    with count_queries(engine) as counter:
+        result = sync_schedule(db, *schedule)
+    assert result["unchanged"] == 5
+    writes = [s for s in counter.statements if s.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))]
+    assert writes == []
+
+
+def test_statements_do_not_grow_with_schedule():
+    def statements(games):
+        engine, db = make_session()
+        with count_queries(engine) as counter:
+            sync_schedule(db, *[schedule_event(str(400 + day), day) for day in range(1, games + 1)])
+        return counter.count
+
+    assert statements(25) == statements(5)
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Job scheduler checks: next-fire times of the cron, interval and adaptive
+triggers, single-flight runs (in this worker and across workers through the
+job_runs table), recovery of runs interrupted by a restart, and cancelled
+runs at shutdown.
+
+Run with `python test_scheduler.py` or `python -m pytest test_scheduler.py`.
+"""
+
+import sys
+import os
+import threading
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.scheduler import AdaptiveTrigger, CronTrigger, IntervalTrigger, JobScheduler, run_owner
+from app.db.models import JobRun
+from testing import new_database
+
+
+def make_scheduler(max_workers=2):
+    # Jobs run on worker threads; the in-memory database must be shared with them
+    engine, _ = new_database(threads=True)
+    session_factory = sessionmaker(bind=engine)
+    return JobScheduler(session_factory=session_factory, max_workers=max_workers), session_factory
+
+
+def blocking_job(release: threading.Event, started: threading.Event = None):
+    def job(db, progress):
+        if started:
+            started.set()
+        release.wait(5)
+        return {"synced": True}
+    return job
+
+
+def wait_for_status(scheduler, run_id, status="succeeded"):
+    for _ in range(200):
+        run = scheduler.get_run(run_id)
+        if run["status"] == status:
+            return run
+        threading.Event().wait(0.01)
+    raise AssertionError(f"Run {run_id} is {run['status']}, expected {status}")
+
+
+def test_cron_next_run():
+    after = datetime(2025, 8, 1, 10, 0)
+    assert CronTrigger("30 9 * * *").next_run(after) == datetime(2025, 8, 2, 9, 30)
+    assert CronTrigger("*/15 * * * *").next_run(after) == datetime(2025, 8, 1, 10, 15)
+    assert CronTrigger("0 9-17/4 * * *").next_run(after) == datetime(2025, 8, 1, 13, 0)
+    assert CronTrigger("0 0 1 1 *").next_run(after) == datetime(2026, 1, 1, 0, 0)
+
+    # Both day fields restricted: the 13th OR a Friday (Aug 1, 2025 is a Friday)
+    assert CronTrigger("0 12 13 * 5").next_run(datetime(2025, 8, 2)) == datetime(2025, 8, 8, 12, 0)
+    # "*/2" counts as unrestricted, as in standard cron: odd days AND Mondays
+    assert CronTrigger("0 0 */2 * 1").next_run(datetime(2025, 8, 31, 12, 0)) == datetime(2025, 9, 1, 0, 0)
+    assert CronTrigger("0 0 */2 * 1").next_run(datetime(2025, 9, 1, 0, 0)) == datetime(2025, 9, 15, 0, 0)
+
+    for expression in ("* * *", "61 * * * *", "0 0 0 * *"):
+        try:
+            CronTrigger(expression)
+        except ValueError:
+            continue
+        raise AssertionError(f"{expression!r} should be rejected")
+
+
+def test_interval_and_adaptive_next_run():
+    after = datetime(2025, 8, 1, 10, 0)
+    assert IntervalTrigger(90).next_run(after) == after + timedelta(seconds=90)
+
+    active = {"value": True}
+    trigger = AdaptiveTrigger(60, 900, lambda: active["value"])
+    assert trigger.next_run(after) == after + timedelta(seconds=60)
+    active["value"] = False
+    assert trigger.next_run(after) == after + timedelta(seconds=900)
+
+    def broken():
+        raise RuntimeError("database is locked")
+    assert AdaptiveTrigger(60, 900, broken).next_run(after) == after + timedelta(seconds=900)
+
+
+def test_single_flight_in_process():
+    scheduler, _ = make_scheduler()
+    release, started = threading.Event(), threading.Event()
+    scheduler.add_job("sync", blocking_job(release, started))
+
+    first = scheduler.submit("sync")
+    assert first["started"] and started.wait(5)
+    second = scheduler.submit("sync")
+    assert not second["started"] and second["run"]["id"] == first["run"]["id"]
+
+    release.set()
+    wait_for_status(scheduler, first["run"]["id"])
+    assert scheduler.submit("sync")["started"]
+    scheduler.shutdown(wait=True)
+
+
+def test_single_flight_across_workers():
+    scheduler, session_factory = make_scheduler()
+    scheduler.add_job("sync", lambda db, progress: {"synced": True})
+
+    # Another worker holds a run of this job
+    db = session_factory()
+    db.add(JobRun(job_name="sync", trigger="manual", status="running", owner="web-2:41", started_at=datetime.now()))
+    db.commit()
+    result = scheduler.submit("sync")
+    assert not result["started"] and result["run"]["status"] == "running"
+    assert scheduler._claim_run("sync", "manual") is None  # The claim itself is what fails
+
+    # A run stuck past JOB_STALE_SECONDS no longer blocks
+    db.query(JobRun).update({JobRun.started_at: datetime.now() - timedelta(seconds=settings.JOB_STALE_SECONDS + 60)})
+    db.commit()
+    result = scheduler.submit("sync")
+    assert result["started"]
+    wait_for_status(scheduler, result["run"]["id"])
+    statuses = [run.status for run in db.query(JobRun).order_by(JobRun.id)]
+    assert statuses == ["failed", "succeeded"]
+    db.close()
+    scheduler.shutdown(wait=True)
+
+
+def test_interrupted_runs_recovered_on_start():
+    scheduler, session_factory = make_scheduler()
+    host = run_owner().rsplit(":", 1)[0]
+    db = session_factory()
+    owners = {
+        "previous": run_owner(),  # Same host:pid, e.g. a restarted container
+        "dead": f"{host}:999999999",
+        "sibling": f"{host}:{os.getppid()}",  # Another live worker on this host
+        "remote": "web-2:41",
+    }
+    for job_name, owner in owners.items():
+        db.add(JobRun(job_name=job_name, trigger="schedule", status="running", owner=owner, started_at=datetime.now()))
+    db.commit()
+
+    scheduler._fail_interrupted_runs()
+    db.expire_all()
+    statuses = {run.job_name: run.status for run in db.query(JobRun)}
+    assert statuses == {"previous": "failed", "dead": "failed", "sibling": "running", "remote": "running"}
+    db.close()
+
+
+def test_shutdown_fails_cancelled_runs():
+    scheduler, _ = make_scheduler(max_workers=1)
+    release, started = threading.Event(), threading.Event()
+    scheduler.add_job("first", blocking_job(release, started))
+    scheduler.add_job("queued", lambda db, progress: {"synced": True})
+
+    first = scheduler.submit("first")
+    assert started.wait(5)
+    queued = scheduler.submit("queued")
+    scheduler.shutdown(wait=False)
+
+    run = scheduler.get_run(queued["run"]["id"])
+    assert (run["status"], run["error"]) == ("failed", "Cancelled at shutdown")
+    assert not scheduler._jobs["queued"].lock.locked()
+
+    release.set()
+    wait_for_status(scheduler, first["run"]["id"])
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
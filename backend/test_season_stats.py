@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Season stat checks: counting stats are summed and the batting and pitching
+rates derived in one grouped query per request, whatever the number of
+players, games from other seasons are left out, and players without games
+(or without innings) get zero lines instead of division errors.
+
+Run with `python test_season_stats.py` or `python -m pytest test_season_stats.py`.
+"""
+
+import sys
+import os
+from datetime import date
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import HTTPException
+
+from app.api import games as games_api
+from app.db.models import Game, Player, PlayerGameStats
+from app.db.query_counter import assert_max_queries
+from app.services.box_score_service import BoxScoreService
+from app.services.standings_service import DODGERS
+from testing import new_database
+
+
+def make_session():
+    engine, db = new_database()
+    games = [
+        Game(espn_id=espn_id, game_date=game_date, home_team=DODGERS, away_team="San Diego Padres")
+        for espn_id, game_date in (("401", date(2025, 8, 1)), ("402", date(2025, 8, 2)), ("301", date(2024, 9, 1)))
+    ]
+    batter = Player(name="Mookie Betts", uniform_number=50)
+    pitcher = Player(name="Yoshinobu Yamamoto", uniform_number=18)
+    bench = Player(name="Kiké Hernández", uniform_number=8)
+    db.add_all(games + [batter, pitcher, bench])
+    db.flush()
+
+    db.add_all([
+        PlayerGameStats(player_id=batter.id, game_id=games[0].id, at_bats=4, hits=2, doubles=1, home_runs=1, walks=1, rbis=3),
+        PlayerGameStats(player_id=batter.id, game_id=games[1].id, at_bats=3, hits=1, hit_by_pitch=1, sacrifice_flies=1),
+        # Last season: not part of the 2025 line
+        PlayerGameStats(player_id=batter.id, game_id=games[2].id, at_bats=5, hits=5),
+        PlayerGameStats(player_id=pitcher.id, game_id=games[0].id, innings_pitched=6.0, hits_allowed=4,
+                        earned_runs=2, walks_allowed=1, strikeouts_pitched=5),
+        PlayerGameStats(player_id=pitcher.id, game_id=games[1].id, innings_pitched=3.0, hits_allowed=3,
+                        earned_runs=1, walks_allowed=1, strikeouts_pitched=4),
+    ])
+    db.commit()
+    return engine, db, (batter.id, pitcher.id, bench.id)
+
+
+def test_batting_line():
+    _, db, (batter, _, _) = make_session()
+    line = BoxScoreService(db).get_player_season_stats(batter, 2025)
+    assert (line['games_played'], line['at_bats'], line['hits'], line['rbis']) == (2, 7, 3, 3)
+    # AVG 3/7, OBP (3 H + 1 BB + 1 HBP) / (7 AB + 1 BB + 1 HBP + 1 SF), SLG 7 TB / 7 AB
+    assert (line['batting_average'], line['on_base_percentage'], line['slugging_percentage'], line['ops']) == (
+        0.429, 0.5, 1.0, 1.5
+    )
+    assert line['era'] is None and line['whip'] is None
+
+
+def test_pitching_line():
+    _, db, (_, pitcher, _) = make_session()
+    line = BoxScoreService(db).get_player_season_stats(pitcher, 2025)
+    assert (line['innings_pitched'], line['earned_runs'], line['strikeouts_pitched']) == (9.0, 3, 9)
+    assert (line['era'], line['whip'], line['strikeouts_per_nine']) == (3.0, 1.0, 9.0)
+    # No at-bats: rates are zero rather than a division error
+    assert line['batting_average'] == 0.0 and line['ops'] == 0.0
+
+
+def test_roster_lines_in_one_query():
+    engine, db, player_ids = make_session()
+    with assert_max_queries(engine, 1):
+        lines = BoxScoreService(db).get_players_season_stats(list(player_ids), 2025)
+    assert list(lines) == list(player_ids)
+    assert lines[player_ids[2]]['games_played'] == 0 and lines[player_ids[2]]['hits'] == 0
+
+    # The previous season only has the batter's one game
+    lines = BoxScoreService(db).get_players_season_stats(list(player_ids), 2024)
+    assert (lines[player_ids[0]]['hits'], lines[player_ids[0]]['batting_average']) == (5, 1.0)
+    assert lines[player_ids[1]]['games_played'] == 0
+
+
+def test_season_stats_endpoint():
+    _, db, (batter, pitcher, _) = make_session()
+    lines = games_api.get_players_season_stats(f"{batter},{pitcher}", season=2025, db=db)
+    assert [(line['player_id'], line['games_played']) for line in lines] == [(batter, 2), (pitcher, 2)]
+
+    try:
+        games_api.get_players_season_stats("1,two", season=2025, db=db)
+    except HTTPException as e:
+        assert e.status_code == 400
+    else:
+        raise AssertionError("expected a 400 for malformed ids")
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Stadium resolver checks: venue names resolve through the in-memory index by
+normalized name, alias, contained name or trigram similarity, lookups after
+the first load run no queries, unknown venues resolve to None, and adding a
+stadium invalidates the index.
+
+Run with `python test_stadium_resolver.py` or `python -m pytest test_stadium_resolver.py`.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.models import Stadium
+from app.db.query_counter import count_queries
+from app.services.stadium_resolver import StadiumResolver, normalize_venue
+from app.services.stadium_service import StadiumService
+from testing import new_database
+
+STADIUMS = ["Dodger Stadium", "Oracle Park", "Minute Maid Park", "Oriole Park at Camden Yards"]
+
+
+def make_session():
+    engine, db = new_database()
+    for name in STADIUMS:
+        db.add(Stadium(name=name, city="City", state="ST", latitude=0.0, longitude=0.0))
+    db.commit()
+    ids = {name: stadium_id for stadium_id, name in db.query(Stadium.id, Stadium.name)}
+    return engine, db, ids
+
+
+def test_normalize_venue():
+    assert normalize_venue("  AT&T  Park ") == "at and t park"
+    assert normalize_venue("Oriole Park at Camden Yards.") == "oriole park at camden yards"
+
+
+def test_resolves_names_and_aliases():
+    _, db, ids = make_session()
+    resolver = StadiumResolver()
+    assert resolver.resolve(db, "dodger stadium") == ids["Dodger Stadium"]
+    # Former and sponsor names
+    assert resolver.resolve(db, "AT&T Park") == ids["Oracle Park"]
+    assert resolver.resolve(db, "Daikin Park") == ids["Minute Maid Park"]
+    assert resolver.resolve(db, "Camden Yards") == ids["Oriole Park at Camden Yards"]
+
+
+def test_fuzzy_matches():
+    _, db, ids = make_session()
+    resolver = StadiumResolver()
+    # A known name inside a longer venue string
+    assert resolver.resolve(db, "Dodger Stadium, Los Angeles") == ids["Dodger Stadium"]
+    # A misspelling, by trigram similarity
+    assert resolver.resolve(db, "Oracel Park") == ids["Oracle Park"]
+    assert resolver.resolve(db, "Estadio Alfredo Harp Helu") is None
+    assert resolver.resolve(db, None) is None and resolver.resolve(db, "") is None
+
+
+def test_lookups_after_load_run_no_queries():
+    engine, db, ids = make_session()
+    resolver = StadiumResolver()
+    resolver.resolve(db, "Dodger Stadium")
+
+    with count_queries(engine) as counter:
+        for venue in ("Dodger Stadium", "AT&T Park", "Oracel Park", "Oracel Park", "Unknown Field"):
+            resolver.resolve(db, venue)
+    assert counter.count == 0
+
+
+def test_new_stadium_invalidates_index():
+    _, db, _ = make_session()
+    service = StadiumService(db)
+    assert service.resolve_stadium_id("Sutter Health Park") is None
+
+    stadium = service.create_stadium("Sutter Health Park", "West Sacramento", "CA", 38.58, -121.51)
+    assert service.resolve_stadium_id("Sutter Health Park") == stadium.id
+    assert service.get_stadium_by_name("sutter health park").name == "Sutter Health Park"
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Materialized standings checks: games going final are folded into the season
+record incrementally, out-of-order games fall back to a season rebuild, and a
+game seen going final by two writers (live poller and results sync) is only
+counted once, and two writers finalizing different games both count.
+Reading a record never writes: an unmaterialized season is computed from
+games.
+
+Run with `python test_standings.py` or `python -m pytest test_standings.py`.
+"""
+
+import sys
+import os
+from datetime import date
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Game, TeamRecord
+from app.db.query_counter import count_queries
+from app.services.game_service import GameService
+from app.services.standings_service import StandingsService, DODGERS
+from testing import fake_upstream, new_database, serving, temp_database_url
+
+# (day, opponent, Dodgers at home, Dodgers runs, opponent runs)
+RESULTS = [
+    (1, "San Diego Padres", True, 5, 2),
+    (2, "San Diego Padres", True, 1, 3),
+    (3, "Arizona Diamondbacks", False, 4, 0),
+    (4, "Arizona Diamondbacks", False, 6, 5),
+]
+
+
+def make_session(final_days=(1, 2, 3, 4), url="sqlite://"):
+    engine, db = new_database(url)
+    for day, opponent, home, runs, allowed in RESULTS:
+        db.add(Game(
+            espn_id=f"40169630{day}", game_date=date(2025, 8, day),
+            home_team=DODGERS if home else opponent, away_team=opponent if home else DODGERS,
+            home_score=runs if home else allowed, away_score=allowed if home else runs,
+            is_final=day in final_days
+        ))
+    db.commit()
+    return engine, db
+
+
+def as_dict(game):
+    return {column: getattr(game, column) for column in ("game_date", "home_team", "away_team", "home_score", "away_score")}
+
+
+def scoreboard(*games):
+    return {"events": [{
+        "id": game.espn_id,
+        "competitions": [{
+            "status": {"type": {"state": "post"}},
+            "competitors": [
+                {"homeAway": "home", "score": str(game.home_score)},
+                {"homeAway": "away", "score": str(game.away_score)},
+            ],
+        }],
+    } for game in games]}
+
+
+def sync_results(db, data):
+    with fake_upstream(fetch_json=serving(data)):
+        return GameService(db).sync_game_results()
+
+
+def test_incremental_matches_rebuild():
+    _, db = make_session(final_days=(1, 2))
+    standings = StandingsService(db)
+    standings.rebuild_record(DODGERS, 2025)
+
+    for game in db.query(Game).filter(Game.is_final.isnot(True)).order_by(Game.game_date):
+        assert standings.claim_final_game(game.id)
+        standings.apply_final_games([as_dict(game)])
+    record = standings.to_dict(standings.get_record(DODGERS, 2025))
+    assert (record["record"], record["streak"], record["home_record"], record["away_record"]) == ("3-1", "W2", "1-1", "2-0")
+
+    # Same numbers as recomputing the season from scratch
+    assert standings.to_dict(standings.rebuild_record(DODGERS, 2025)) == record
+
+
+def test_out_of_order_game_rebuilds_season():
+    _, db = make_session(final_days=(1, 3, 4))
+    standings = StandingsService(db)
+    standings.rebuild_record(DODGERS, 2025)
+
+    late = db.query(Game).filter(Game.game_date == date(2025, 8, 2)).one()
+    assert standings.claim_final_game(late.id)
+    standings.apply_final_games([as_dict(late)])
+    record = standings.to_dict(standings.get_record(DODGERS, 2025))
+    # Incrementally the 8/2 loss would become the latest result ("L1")
+    assert (record["record"], record["streak"], record["last_game"]) == ("3-1", "W2", date(2025, 8, 4))
+
+
+def test_game_counted_once_by_two_writers():
+    # Two sessions on one database: the results sync and the live poller
+    engine, db = make_session(final_days=(1, 2, 3), url=temp_database_url("standings"))
+    StandingsService(db).rebuild_record(DODGERS, 2025)
+    db.commit()
+    game = db.query(Game).filter(Game.game_date == date(2025, 8, 4)).one()
+    poller_db = sessionmaker(bind=engine)()
+
+    # The sync has read the game as not final when the poller finalizes it
+    original_claim = StandingsService.claim_final_game
+    def claim_after_poller(self, game_id):
+        poller = StandingsService(poller_db)
+        if original_claim(poller, game_id):
+            poller.apply_final_games([as_dict(game)])
+            poller_db.commit()
+        return original_claim(self, game_id)
+    StandingsService.claim_final_game = claim_after_poller
+    try:
+        result = sync_results(db, scoreboard(game))
+    finally:
+        StandingsService.claim_final_game = original_claim
+    assert result["synced"] and result["updated_games"] == 1
+
+    db.expire_all()
+    assert StandingsService(db).to_dict(StandingsService(db).get_record(DODGERS, 2025))["record"] == "3-1"  # 2-1 plus one win
+    poller_db.close()
+
+
+def test_two_writers_finalizing_different_games():
+    # The poller's session read the record before the results sync counted a game
+    engine, db = make_session(final_days=(1, 2), url=temp_database_url("standings"))
+    StandingsService(db).rebuild_record(DODGERS, 2025)
+    db.commit()
+    poller_db = sessionmaker(bind=engine)()
+    stale = StandingsService(poller_db).get_record(DODGERS, 2025)
+    assert stale.wins == 1
+
+    day_3, day_4 = db.query(Game).filter(Game.is_final.isnot(True)).order_by(Game.game_date).all()
+    standings = StandingsService(db)
+    assert standings.claim_final_game(day_3.id)
+    standings.apply_final_games([as_dict(day_3)])
+    db.commit()
+
+    poller = StandingsService(poller_db)
+    assert poller.claim_final_game(day_4.id)
+    poller.apply_final_games([as_dict(day_4)])
+    poller_db.commit()
+    poller_db.close()
+
+    db.expire_all()
+    record = standings.to_dict(standings.get_record(DODGERS, 2025))
+    # Both wins are counted, not just the poller's on top of its stale read
+    assert (record["record"], record["streak"], record["away_record"]) == ("3-1", "W2", "2-0")
+
+
+def test_get_record_does_not_write():
+    engine, db = make_session()
+    commits = []
+    event.listen(db, "after_commit", lambda session: commits.append(session))
+
+    with count_queries(engine) as counter:
+        record = StandingsService(db).get_record(DODGERS)
+    assert record.season == 2025 and (record.wins, record.losses) == (3, 1)
+    assert StandingsService(db).to_dict(record)["streak"] == "W2"
+    # Computed from games without materializing a row
+    assert all(statement.lstrip().upper().startswith("SELECT") for statement in counter.statements)
+    assert commits == [] and record not in db
+    assert db.query(TeamRecord).count() == 0
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Weather backfill checks: games are grouped by stadium-day so doubleheaders
+share one lookup, cached days are served without the network, the rest are
+fetched in parallel by the worker pool (all database writes stay on the
+calling thread) and committed in batches, a failed day is reported without
+stopping the run, and WeatherAPI calls go through the shared rate limiter.
+
+Run with `python test_weather_backfill.py` or `python -m pytest test_weather_backfill.py`.
+"""
+
+import sys
+import os
+import threading
+import time
+from datetime import date, time as game_time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config import settings
+from app.core.rate_limit import TokenBucket
+from app.db.models import Game, Stadium, WeatherObservation
+from app.services import stadium_service
+from app.services.game_service import GameService
+from app.services.stadium_service import StadiumService
+from app.services.standings_service import DODGERS
+from testing import FakeUpstream, fake_upstream, new_database, weather_day
+
+
+def weather_api(failing=(), barrier=None):
+    """A fake WeatherAPI recording the requested days; `failing` days raise."""
+    return FakeUpstream(weather_day, key=lambda url, params: params["dt"], failing=failing, barrier=barrier)
+
+
+def make_session(days=4):
+    """A stadium with one game per day on August 1..days, plus a doubleheader on the 1st."""
+    _, db = new_database()
+    db.add(Stadium(name="Dodger Stadium", city="Los Angeles", state="CA", latitude=34.0739, longitude=-118.24))
+    for day in range(1, days + 1):
+        db.add(Game(espn_id=f"40{day:02d}", game_date=date(2025, 8, day), home_team=DODGERS,
+                    away_team="San Diego Padres", venue="Dodger Stadium"))
+    db.add(Game(espn_id="4001b", game_date=date(2025, 8, 1), game_time=game_time(13, 10), home_team=DODGERS,
+                away_team="San Diego Padres", venue="Dodger Stadium"))
+    db.commit()
+    return db
+
+
+def backfill(db, api, **kwargs):
+    with fake_upstream(fetch_json=api):
+        return GameService(db).sync_weather_for_existing_games(**kwargs)
+
+
+def test_one_fetch_per_stadium_day():
+    db = make_session()
+    api = weather_api()
+    result = backfill(db, api)
+
+    assert sorted(api.requested) == ["2025-08-01", "2025-08-02", "2025-08-03", "2025-08-04"]
+    assert (result["updated_games"], result["stadium_days"], result["fetched"], result["cache_hits"]) == (5, 4, 4, 0)
+    db.expire_all()
+    # 60°F plus the hour: the 7 PM games average 6-8 PM, the 1:10 PM game 12-2 PM
+    assert sorted(game.weather_temp for game in db.query(Game)) == [73, 79, 79, 79, 79]
+    assert db.query(WeatherObservation).count() == 4 * 24
+
+
+def test_cached_days_skip_the_network():
+    db = make_session()
+    stadium = db.query(Stadium).one()
+    StadiumService(db).store_weather_day(stadium.id, date(2025, 8, 1), [
+        {"time": f"2025-08-01 {hour:02d}:00", "temp_f": 65.0, "condition": "Fog", "wind_mph": 2.0,
+         "wind_dir": "N", "humidity": 80, "precip_in": 0.0}
+        for hour in range(24)
+    ])
+    db.commit()
+
+    api = weather_api()
+    result = backfill(db, api)
+    assert "2025-08-01" not in api.requested
+    assert (result["cache_hits"], result["fetched"], result["updated_games"]) == (1, 3, 5)
+    db.expire_all()
+    assert {game.weather_conditions for game in db.query(Game).filter(Game.game_date == date(2025, 8, 1))} == {"Fog"}
+
+
+def test_fetches_run_in_parallel():
+    db = make_session(days=settings.WEATHER_BACKFILL_WORKERS)
+    # Each call waits until every worker is inside one; sequential fetches would time out
+    api = weather_api(barrier=threading.Barrier(settings.WEATHER_BACKFILL_WORKERS))
+    result = backfill(db, api)
+    assert result["failures"] == [] and result["fetched"] == settings.WEATHER_BACKFILL_WORKERS
+    assert len(api.threads) == settings.WEATHER_BACKFILL_WORKERS
+    assert threading.get_ident() not in api.threads
+
+
+def test_failed_day_reported_and_batches_committed():
+    db = make_session()
+    progress = []
+    original_batch = settings.WEATHER_BACKFILL_BATCH_SIZE
+    settings.WEATHER_BACKFILL_BATCH_SIZE = 2
+    try:
+        result = backfill(db, weather_api(failing={"2025-08-02"}),
+                          progress=lambda done, total: progress.append((done, total)))
+    finally:
+        settings.WEATHER_BACKFILL_BATCH_SIZE = original_batch
+
+    assert result["synced"] and result["updated_games"] == 4 and result["fetched"] == 3
+    assert result["failures"] == [{"stadium": "Dodger Stadium", "date": "2025-08-02", "error": "503 Service Unavailable"}]
+    assert progress == [(2, 4)]
+    db.expire_all()
+    assert db.query(Game).filter(Game.weather_temp.is_(None)).one().game_date == date(2025, 8, 2)
+
+
+def test_only_queued_games():
+    db = make_session()
+    game_id = db.query(Game.id).filter(Game.espn_id == "4003").scalar()
+    api = weather_api()
+    result = backfill(db, api, game_ids=[game_id])
+    assert api.requested == ["2025-08-03"] and result["updated_games"] == 1
+
+
+def test_workers_share_the_rate_limit():
+    db = make_session()
+    original = stadium_service.weather_api_limiter
+    stadium_service.weather_api_limiter = TokenBucket(rate=20, capacity=1)
+    started = time.monotonic()
+    try:
+        result = backfill(db, weather_api())
+    finally:
+        stadium_service.weather_api_limiter = original
+    assert result["fetched"] == 4
+    # Four parallel workers, but one call from the burst and then one every 1/20 s
+    assert time.monotonic() - started >= 0.14
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
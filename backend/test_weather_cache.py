@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Historical weather cache checks: a stadium-day is fetched from WeatherAPI
+once and stored as hourly rows keyed by stadium, date and hour, so later
+games that day (doubleheaders, re-syncs) are served locally; days that are
+still forecasts are not stored, and the game window is averaged over the
+cached hours.
+
+Run with `python test_weather_cache.py` or `python -m pytest test_weather_cache.py`.
+"""
+
+import sys
+import os
+from datetime import date, datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.models import Stadium, WeatherObservation
+from app.services.stadium_service import StadiumService
+from testing import FakeUpstream, fake_upstream, new_database, weather_day
+
+
+def make_session():
+    _, db = new_database()
+    db.add(Stadium(name="Dodger Stadium", city="Los Angeles", state="CA", latitude=34.0739, longitude=-118.24))
+    db.commit()
+    return db
+
+
+def with_weather_api(call):
+    """Run `call` against a fake WeatherAPI that records the (location, day) of each request."""
+    api = FakeUpstream(weather_day, key=lambda url, params: (params["q"], params["dt"]))
+    with fake_upstream(fetch_json=api):
+        return call(), api
+
+
+def test_stadium_day_fetched_once():
+    db = make_session()
+    service = StadiumService(db)
+
+    # A doubleheader: two games, one WeatherAPI call
+    (first, second), api = with_weather_api(lambda: (
+        service.get_weather_for_game("Dodger Stadium", "2025-08-03", "13:10"),
+        service.get_weather_for_game("Dodger Stadium", "2025-08-03", "19:10"),
+    ))
+    db.commit()
+    assert api.requested == [("34.0739,-118.24", "2025-08-03")]
+    assert first["temperature"] != second["temperature"]
+
+    stadium = db.query(Stadium).one()
+    hours = [row.hour for row in db.query(WeatherObservation).filter(WeatherObservation.stadium_id == stadium.id)]
+    assert sorted(hours) == list(range(24))
+
+    # Served from the cache afterwards, without the network
+    hourly, api = with_weather_api(lambda: service.get_hourly_weather(stadium, date(2025, 8, 3)))
+    assert api.requested == [] and len(hourly) == 24
+    assert hourly[19] == {
+        "time": "2025-08-03 19:00", "temp_f": 79.0, "condition": "Sunny",
+        "wind_mph": 5.0, "wind_dir": "W", "humidity": 40, "precip_in": 0.0,
+    }
+
+
+def test_forecast_days_not_stored():
+    db = make_session()
+    service = StadiumService(db)
+    stadium = db.query(Stadium).one()
+
+    for day in (date.today(), date.today() + timedelta(days=1)):
+        hourly, api = with_weather_api(lambda: service.get_hourly_weather(stadium, day))
+        assert len(hourly) == 24 and len(api.requested) == 1
+    assert db.query(WeatherObservation).count() == 0
+
+
+def test_game_window_average():
+    db = make_session()
+    weather, _ = with_weather_api(lambda: StadiumService(db).get_weather_for_game("Dodger Stadium", "2025-08-03"))
+    # Default 7:00 PM start: the 6, 7 and 8 PM hours
+    assert (weather["temperature"], weather["conditions"], weather["wind_speed"]) == (79, "Sunny", 5)
+    assert [hour["time"][-5:] for hour in weather["hourly_data"]] == ["18:00", "19:00", "20:00"]
+
+    game_start = StadiumService(db).game_start_datetime("2025-08-03", "not a time")
+    assert game_start == datetime(2025, 8, 3, 19, 0)
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
@@ -0,0 +1,107 @@
+"""
+Shared setup for the test_*.py scripts: throwaway databases and stand-ins for
+the upstream HTTP calls. Each test file keeps only its own seed data and
+upstream payloads.
+"""
+
+import copy
+import tempfile
+import threading
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core import http
+from app.core.read_cache import read_cache
+from app.db.database import Base
+from app.services.player_registry import player_registry
+from app.services.stadium_resolver import stadium_resolver
+
+
+def temp_database_url(name: str = "test") -> str:
+    """A SQLite file in a new temporary directory, for tests that need several connections."""
+    return f"sqlite:///{tempfile.mkdtemp()}/{name}.db"
+
+
+def new_database(url: str = "sqlite://", threads: bool = False):
+    """
+    Create every table in a new database and return (engine, session).
+
+    `threads` shares one in-memory connection so worker threads see the same
+    database. The stadium index, player registry and read cache are
+    cleared: every test database starts its IDs and data versions over at 1.
+    """
+    if threads:
+        engine = create_engine(url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+    else:
+        engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    stadium_resolver.invalidate()
+    player_registry.invalidate()
+    read_cache.clear()
+    return engine, sessionmaker(bind=engine)()
+
+
+@contextmanager
+def fake_upstream(fetch_json=None, fetch_text=None):
+    """Answer http.fetch_json and/or http.fetch_text with the given callables inside the block."""
+    fakes = {name: fake for name, fake in (("fetch_json", fetch_json), ("fetch_text", fetch_text)) if fake}
+    originals = {name: getattr(http, name) for name in fakes}
+    for name, fake in fakes.items():
+        setattr(http, name, fake)
+    try:
+        yield
+    finally:
+        for name, original in originals.items():
+            setattr(http, name, original)
+
+
+def serving(data):
+    """A fetch stand-in that answers every request with a fresh copy of `data`."""
+    return lambda url, **kwargs: copy.deepcopy(data)
+
+
+class FakeUpstream:
+    """
+    A recording fetch stand-in: `respond(url, params)` builds each answer.
+
+    Requests are recorded by `key(url, params)` (the URL by default) along
+    with the calling threads; keys in `failing` raise, and a `barrier` makes
+    calls wait for each other. Every call counts as a network fetch, so it
+    takes a token from the caller's limiter.
+    """
+
+    def __init__(self, respond, key=lambda url, params: url, failing=(), barrier=None):
+        self.respond = respond
+        self.key = key
+        self.failing = set(failing)
+        self.barrier = barrier
+        self.requested = []
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, url, params=None, limiter=None, **kwargs):
+        if limiter:
+            limiter.acquire()
+        key = self.key(url, params)
+        with self._lock:
+            self.requested.append(key)
+            self.threads.add(threading.get_ident())
+        if self.barrier:
+            self.barrier.wait(timeout=5)
+        if key in self.failing:
+            raise RuntimeError("503 Service Unavailable")
+        return self.respond(url, params)
+
+
+def weather_day(url, params):
+    """WeatherAPI history.json for `params["dt"]`: 24 sunny hours, 60°F plus the hour."""
+    return {"forecast": {"forecastday": [{"hour": [
+        {
+            "time": f"{params['dt']} {hour:02d}:00", "temp_f": 60.0 + hour, "condition": {"text": "Sunny"},
+            "wind_mph": 5.0, "wind_dir": "W", "humidity": 40, "precip_in": 0.0,
+        }
+        for hour in range(24)
+    ]}]}}
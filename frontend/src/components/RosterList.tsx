@@ -23,7 +23,7 @@ const RosterList: React.FC<RosterListProps> = ({ onEditPlayer }) => {
 
   // Available positions and statuses for filters
   const positions = ['P', 'C', '1B', '2B', '3B', 'SS', 'LF', 'CF', 'RF', 'DH', 'SP', 'RP'];
-  const statuses = ['Active', 'Injured', 'Suspended'];
+  const statuses = ['Active', 'Injured', 'Suspended', 'Inactive'];
 
   const loadRoster = async () => {
     try {
@@ -14,6 +14,15 @@ const GameLogs: React.FC = () => {
     loadGames();
   }, []);
 
+  // Apply live score changes as they are pushed instead of reloading the list
+  useEffect(() => {
+    return gameService.subscribeLive({
+      onGameUpdate: ({ game_id, ...changes }) => {
+        setGames(current => current.map(game => (game.id === game_id ? { ...game, ...changes } : game)));
+      },
+    });
+  }, []);
+
   const loadGames = async () => {
     try {
       setLoading(true);
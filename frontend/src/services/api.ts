@@ -1,6 +1,7 @@
 import axios from 'axios';
 import { Player, PlayerCreate, PlayerUpdate, RosterFilters } from '../types/Player';
-import { Game } from '../types/Game';
+import { Game, LiveGameUpdate } from '../types/Game';
+import { JobRun, JobStart } from '../types/Job';
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000';
 
@@ -11,6 +12,32 @@ const api = axios.create({
   },
 });
 
+export const jobService = {
+  // Get a job run's status and progress
+  getRun: async (runId: number): Promise<JobRun> => {
+    const response = await api.get<JobRun>(`/api/v1/jobs/runs/${runId}`);
+    return response.data;
+  },
+
+  // Poll a job run until it is no longer running
+  waitForRun: async (runId: number, intervalMs = 1000): Promise<JobRun> => {
+    let run = await jobService.getRun(runId);
+    while (run.status === 'running') {
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+      run = await jobService.getRun(runId);
+    }
+    return run;
+  },
+};
+
+// Sync endpoints start a background job; wait for it and return the sync result
+const runSyncJob = async (path: string): Promise<any> => {
+  const response = await api.post<JobStart>(path);
+  if (!response.data.run) return response.data;
+  const run = await jobService.waitForRun(response.data.run.id);
+  return run.result ?? { synced: false, reason: run.error };
+};
+
 export const playerService = {
   // Get all players with optional filters
   getRoster: async (filters?: RosterFilters): Promise<Player[]> => {
@@ -53,8 +80,7 @@ export const playerService = {
 
   // Sync roster from ESPN
   syncRoster: async (): Promise<any> => {
-    const response = await api.post('/api/v1/roster-espn-sync');
-    return response.data;
+    return runSyncJob('/api/v1/roster-espn-sync');
   },
 
   // Check roster sync status
@@ -108,14 +134,12 @@ export const gameService = {
 
   // Sync schedule from ESPN
   syncSchedule: async (): Promise<any> => {
-    const response = await api.post('/api/v1/games/sync-schedule');
-    return response.data;
+    return runSyncJob('/api/v1/games/sync-schedule');
   },
 
   // Sync game results from ESPN
   syncResults: async (): Promise<any> => {
-    const response = await api.post('/api/v1/games/sync-results');
-    return response.data;
+    return runSyncJob('/api/v1/games/sync-results');
   },
 
   // Fix existing game results
@@ -126,11 +150,25 @@ export const gameService = {
 
   // Sync weather data
   syncWeather: async (): Promise<any> => {
-    const response = await api.post('/api/v1/games/sync-weather');
-    return response.data;
+    return runSyncJob('/api/v1/games/sync-weather');
+  },
+
+  // Subscribe to live game changes (Server-Sent Events); returns a function that closes the stream.
+  // game_update carries only the changed fields plus the game's id and espn_id.
+  subscribeLive: (handlers: {
+    onGameUpdate?: (update: LiveGameUpdate) => void;
+    onRecordUpdate?: (record: any) => void;
+  }): (() => void) => {
+    // EventSource reconnects by itself and resumes from the last event it saw
+    const source = new EventSource(`${API_BASE_URL}/api/v1/games/live/stream`);
+    source.addEventListener('game_update', (event) => {
+      handlers.onGameUpdate?.(JSON.parse((event as MessageEvent).data));
+    });
+    source.addEventListener('record_update', (event) => {
+      handlers.onRecordUpdate?.(JSON.parse((event as MessageEvent).data));
+    });
+    return () => source.close();
   },
-
-
 };
 
 export default api;
@@ -17,6 +17,9 @@ export interface Game {
   day_of_week?: string;
   is_night_game?: boolean;
   days_since_last_game?: number;
+  game_state?: 'pre' | 'in' | 'post';
+  inning?: number;
+  status_detail?: string;
   weather_temp?: number;
   weather_conditions?: string;
   wind_speed?: number;
@@ -26,6 +29,9 @@ export interface Game {
   updated_at?: string;
 }
 
+// Pushed on /games/live/stream: the fields that changed, keyed by game
+export type LiveGameUpdate = Partial<Game> & { game_id: number; espn_id: string };
+
 export interface GameResult {
   id: number;
   game_id: number;
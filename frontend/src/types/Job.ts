@@ -0,0 +1,19 @@
+export interface JobRun {
+  id: number;
+  job: string;
+  trigger: 'manual' | 'schedule';
+  status: 'running' | 'succeeded' | 'skipped' | 'failed';
+  progress?: number;
+  message?: string;
+  result?: any;
+  error?: string;
+  started_at?: string;
+  finished_at?: string;
+  duration_seconds?: number;
+}
+
+export interface JobStart {
+  started: boolean;
+  reason: string;
+  run?: JobRun;
+}
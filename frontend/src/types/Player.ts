@@ -10,6 +10,7 @@ export interface PlayerPosition {
 export interface Player {
   id: number;
   name: string;
+  espn_id?: string;
   positions: PlayerPosition[];
   uniform_number?: number;
   height?: string;